@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Importa un rango largo de historia de Google Calendar al caché local.
+El rango se divide en meses descargados en paralelo; si se interrumpe,
+ejecutarlo de nuevo con el mismo rango continúa desde los meses pendientes.
+
+Uso:
+    uv run backfill.py --start 2021-01-01 --end 2026-01-01
+    uv run backfill.py --start 2024-01-01 --end 2025-01-01 --calendar-id work@example.com
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+
+
+def parse_date(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"fecha inválida: {value} (usa YYYY-MM-DD)")
+
+
+async def run(args: argparse.Namespace) -> int:
+    from services.backfill import Backfill
+    from services.google_calendar_async import close_async_calendar_service
+    from services.google_executor import GoogleCalendarError
+
+    backfill = Backfill(calendar_ids=args.calendar_id, max_concurrency=args.concurrency)
+    if not backfill.async_service.configured:
+        print("❌ Google Calendar no está configurado (ver /calendar/health)")
+        return 1
+
+    try:
+        result = await backfill.run(args.start, args.end)
+    except GoogleCalendarError as e:
+        print(f"❌ Backfill incompleto: {e}")
+        print("💡 Ejecuta el mismo comando de nuevo para continuar")
+        return 1
+    finally:
+        await close_async_calendar_service()
+
+    print(
+        f"✅ Backfill terminado: {backfill.completed_shards} mes(es) importados, "
+        f"{backfill.skipped_shards} ya completos"
+    )
+    print(
+        f"   ├─ {result.created} creados, {result.updated} actualizados, "
+        f"{result.unchanged} sin cambios"
+    )
+    print(f"   └─ {result.pages} páginas en {result.timings.get('total', 0):.1f}s")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--start", type=parse_date, required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end", type=parse_date, required=True, help="YYYY-MM-DD")
+    parser.add_argument(
+        "--calendar-id",
+        action="append",
+        help="Calendario a importar (repetible; default: todos los configurados)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, help="Meses a la vez (default: SYNC_BACKFILL_CONCURRENCY)"
+    )
+    args = parser.parse_args()
+    if args.end <= args.start:
+        parser.error("--end debe ser posterior a --start")
+
+    from database import Base, engine
+    import models  # Registra las tablas en Base.metadata
+    from utils.migrations import run_migrations
+
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Mide el arranque en frío del cliente de Google Calendar: cada medición corre
+en un proceso nuevo, con una service account desechable (no contacta a Google;
+el refresh del token queda fuera).
+
+Compara:
+- build(): cliente construido al iniciar, como antes (discovery + build)
+- lazy:    GoogleCalendarService() solo carga credenciales; cada thread
+           construye su cliente al primer uso desde el documento de
+           discovery ya parseado (build_from_document)
+
+Uso:
+    uv run bench_cold_start.py
+    uv run bench_cold_start.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+SCOPES = ["https://www.googleapis.com/auth/calendar"]
+
+
+def write_service_account(directory: str) -> str:
+    """Crea un JSON de service account con una llave RSA recién generada."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    path = os.path.join(directory, "service-account.json")
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "type": "service_account",
+                "project_id": "bench",
+                "private_key_id": "bench",
+                "private_key": pem,
+                "client_email": "bench@bench.iam.gserviceaccount.com",
+                "client_id": "0",
+                "token_uri": "https://oauth2.googleapis.com/token",
+            },
+            f,
+        )
+    return path
+
+
+def elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+def import_app_dependencies() -> None:
+    """
+    Importa lo que la app carga de todas formas (FastAPI, SQLAlchemy, modelos,
+    OpenTelemetry, httpx), para medir solo lo que agrega el cliente de Google.
+    """
+    import fastapi  # noqa: F401
+    import httpx  # noqa: F401
+    import models  # noqa: F401
+    import utils.telemetry  # noqa: F401
+
+
+def measure_build() -> Dict[str, float]:
+    """Camino anterior: credenciales + build() en el arranque."""
+    import_app_dependencies()
+    started = time.perf_counter()
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+
+    result = {"import": elapsed_ms(started)}
+
+    started = time.perf_counter()
+    creds = service_account.Credentials.from_service_account_file(
+        os.environ["GOOGLE_SERVICE_ACCOUNT_FILE"], scopes=SCOPES
+    )
+    result["credentials"] = elapsed_ms(started)
+
+    started = time.perf_counter()
+    build("calendar", "v3", credentials=creds)
+    result["client"] = elapsed_ms(started)
+    result["startup"] = result["credentials"] + result["client"]
+
+    # Un segundo cliente (otro thread) vuelve a leer y parsear el discovery
+    started = time.perf_counter()
+    build("calendar", "v3", credentials=creds)
+    result["next_client"] = elapsed_ms(started)
+    return result
+
+
+def measure_lazy() -> Dict[str, float]:
+    """Camino actual: solo credenciales al iniciar, cliente por thread al primer uso."""
+    import_app_dependencies()
+    started = time.perf_counter()
+    from services.google_calendar import GoogleCalendarService
+
+    result = {"import": elapsed_ms(started)}
+
+    started = time.perf_counter()
+    service = GoogleCalendarService()
+    result["startup"] = elapsed_ms(started)
+
+    started = time.perf_counter()
+    service._build_service()
+    result["first_client"] = elapsed_ms(started)
+
+    def build_in_thread():
+        nonlocal started
+        started = time.perf_counter()
+        service._build_service()
+        result["next_client"] = elapsed_ms(started)
+
+    thread = threading.Thread(target=build_in_thread)
+    thread.start()
+    thread.join()
+    return result
+
+
+def run_child(mode: str, env: Dict[str, str]) -> Dict[str, float]:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(label: str, runs: List[Dict[str, float]]) -> None:
+    print(f"📊 {label} (mediana de {len(runs)} procesos)")
+    keys = list(runs[0])
+    for i, key in enumerate(keys):
+        branch = "└─" if i == len(keys) - 1 else "├─"
+        value = statistics.median(run[key] for run in runs)
+        print(f"   {branch} {key:<13} {value:8.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=["build", "lazy"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        # Sin ruido de logs en la salida que lee el proceso padre
+        import logging
+
+        logging.disable(logging.CRITICAL)
+        measure = measure_build if args.child == "build" else measure_lazy
+        print(json.dumps(measure()))
+        return 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(
+            os.environ, GOOGLE_SERVICE_ACCOUNT_FILE=write_service_account(directory)
+        )
+        results = {"build": [], "lazy": []}
+        # Alternados, para que el ruido de la máquina afecte a ambos por igual
+        for _ in range(args.runs):
+            for mode in results:
+                results[mode].append(run_child(mode, env))
+
+    summarize("build() al iniciar", results["build"])
+    summarize("lazy + build_from_document", results["lazy"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
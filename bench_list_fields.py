@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Compara una página de events.list completa contra la misma página con el
+fields mask de `GoogleCalendarService.LIST_FIELDS`. No contacta a Google.
+
+Usa el fixture `tests/fixtures/events_list_1k.json.gz`: 1.000 eventos con la
+forma completa de events.list (etag, creator/organizer, attendees,
+conferenceData, reminders, recurrencia...), generados con semilla fija por
+`make_full_events`. El mask se aplica como lo haría Google y se reporta, para
+cada versión:
+- bytes del JSON (crudo y gzip, como viaja con Accept-Encoding: gzip)
+- tiempo de json.loads y de parse_events
+
+Uso:
+    uv run bench_list_fields.py
+    uv run bench_list_fields.py --repeat 20
+    uv run bench_list_fields.py --write-fixture   # regenera el fixture
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import random
+import statistics
+import string
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from tests.test_list_fields import apply_fields_mask, parse_fields_mask
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "tests",
+    "fixtures",
+    "events_list_1k.json.gz",
+)
+
+SUMMARIES = [
+    "Reunión de equipo",
+    "Revisión semanal",
+    "1:1 con Ana",
+    "Almuerzo",
+    "Gimnasio",
+    "Planificación del sprint",
+    "Llamada con cliente",
+    "Dentista",
+    "Clase de inglés",
+    "Entrega de informe",
+]
+CATEGORIES = ["TRABAJO", "SALUD", "OCIO", "RUTINA", "personal", "Estudio"]
+PRIORITIES = ["critical", "high", "medium", "low"]
+LOCATIONS = ["Oficina", "Sala 3B", "Av. Larco 1150, Miraflores", "Casa", "Zoom"]
+DOMAINS = ["example.com", "gmail.com", "empresa.pe"]
+WORDS = (
+    "revisar avances del proyecto definir próximos pasos acordar fechas "
+    "preparar presentación enviar minuta validar presupuesto"
+).split()
+
+
+def _token(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(string.ascii_lowercase + string.digits, k=length))
+
+
+def _email(rng: random.Random) -> str:
+    return f"{_token(rng, rng.randint(5, 10))}@{rng.choice(DOMAINS)}"
+
+
+def _timestamp(moment: datetime, rng: random.Random) -> str:
+    return f"{moment.isoformat()}.{rng.randrange(1000):03d}Z"
+
+
+def make_full_events(count: int, seed: int = 42) -> Dict:
+    """
+    Genera una respuesta de events.list sin fields mask: los campos que
+    Google devuelve por defecto, con valores variados (IDs, etags, correos y
+    textos distintos) para que el tamaño gzip sea realista.
+    """
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1)
+    owner = "owner@example.com"
+    items = []
+    for _ in range(count):
+        event_id = _token(rng, 26)
+        start = base + timedelta(minutes=30 * rng.randrange(365 * 48))
+        created = start - timedelta(
+            days=rng.randint(1, 90), seconds=rng.randrange(86400)
+        )
+        updated = created + timedelta(seconds=rng.randrange(30 * 86400))
+        event = {
+            "kind": "calendar#event",
+            "etag": f'"{rng.randrange(10**15, 10**16)}"',
+            "id": event_id,
+            "status": "confirmed",
+            "htmlLink": f"https://www.google.com/calendar/event?eid={_token(rng, 60)}",
+            "created": _timestamp(created, rng),
+            "updated": _timestamp(updated, rng),
+            "summary": rng.choice(SUMMARIES),
+            "creator": {"email": owner, "self": True},
+            "organizer": {"email": owner, "self": True},
+        }
+        if rng.random() < 0.2:
+            event["start"] = {"date": start.date().isoformat()}
+            event["end"] = {"date": (start.date() + timedelta(days=1)).isoformat()}
+            event["transparency"] = "transparent"
+        else:
+            end = start + timedelta(minutes=30 * rng.randint(1, 4))
+            event["start"] = {
+                "dateTime": f"{start.isoformat()}-05:00",
+                "timeZone": "America/Lima",
+            }
+            event["end"] = {
+                "dateTime": f"{end.isoformat()}-05:00",
+                "timeZone": "America/Lima",
+            }
+        if rng.random() < 0.6:
+            notes = " ".join(rng.choices(WORDS, k=rng.randint(4, 25)))
+            if rng.random() < 0.5:
+                meta = {
+                    "priority": rng.choice(PRIORITIES),
+                    "category": rng.choice(CATEGORIES),
+                }
+                notes += f"\n\nBUJO_META: {json.dumps(meta)}"
+            event["description"] = notes
+        if rng.random() < 0.4:
+            event["location"] = rng.choice(LOCATIONS)
+        if rng.random() < 0.3:
+            event["colorId"] = str(rng.randint(1, 11))
+        if rng.random() < 0.15:
+            event["recurringEventId"] = _token(rng, 26)
+            event["originalStartTime"] = dict(event["start"])
+        event["iCalUID"] = f"{event_id}@google.com"
+        event["sequence"] = rng.randint(0, 3)
+        if rng.random() < 0.5:
+            event["attendees"] = [
+                {
+                    "email": owner,
+                    "organizer": True,
+                    "self": True,
+                    "responseStatus": "accepted",
+                }
+            ] + [
+                {
+                    "email": _email(rng),
+                    "responseStatus": rng.choice(
+                        ["accepted", "needsAction", "declined", "tentative"]
+                    ),
+                }
+                for _ in range(rng.randint(1, 6))
+            ]
+        if rng.random() < 0.35:
+            code = f"{_token(rng, 3)}-{_token(rng, 4)}-{_token(rng, 3)}"
+            event["hangoutLink"] = f"https://meet.google.com/{code}"
+            event["conferenceData"] = {
+                "entryPoints": [
+                    {
+                        "entryPointType": "video",
+                        "uri": f"https://meet.google.com/{code}",
+                        "label": f"meet.google.com/{code}",
+                    }
+                ],
+                "conferenceSolution": {
+                    "key": {"type": "hangoutsMeet"},
+                    "name": "Google Meet",
+                    "iconUri": (
+                        "https://fonts.gstatic.com/s/i/productlogos/meet_2020q4/v6/"
+                        "web-512dp/logo_meet_2020q4_color_2x_web_512dp.png"
+                    ),
+                },
+                "conferenceId": code,
+            }
+        if rng.random() < 0.8:
+            event["reminders"] = {"useDefault": True}
+        else:
+            event["reminders"] = {
+                "useDefault": False,
+                "overrides": [{"method": "popup", "minutes": 10}],
+            }
+        event["eventType"] = "default"
+        items.append(event)
+
+    items.sort(
+        key=lambda event: event["start"].get("dateTime") or event["start"]["date"]
+    )
+    return {
+        "kind": "calendar#events",
+        "etag": f'"{rng.randrange(10**15, 10**16)}"',
+        "summary": owner,
+        "description": "",
+        "updated": _timestamp(base, rng),
+        "timeZone": "America/Lima",
+        "accessRole": "owner",
+        "defaultReminders": [{"method": "popup", "minutes": 30}],
+        "nextSyncToken": f"CP{_token(rng, 40)}",
+        "items": items,
+    }
+
+
+def elapsed(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def format_ms(timings: List[float]) -> str:
+    return (
+        f"{min(timings) * 1000:8.2f} ms "
+        f"(mediana {statistics.median(timings) * 1000:.2f})"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--write-fixture", action="store_true")
+    args = parser.parse_args()
+
+    if args.write_fixture:
+        os.makedirs(os.path.dirname(FIXTURE), exist_ok=True)
+        payload = json.dumps(make_full_events(1000)).encode()
+        # mtime=0: el archivo no cambia si el contenido no cambia
+        with open(FIXTURE, "wb") as f:
+            f.write(gzip.compress(payload, mtime=0))
+        print(f"✅ Fixture escrito: {FIXTURE}")
+        return 0
+
+    # Sin credenciales el servicio registra errores de setup: no aplican aquí
+    logging.getLogger("mnemos").setLevel(logging.CRITICAL)
+    from services.google_calendar import GoogleCalendarService
+
+    service = GoogleCalendarService()
+    with gzip.open(FIXTURE, "rb") as f:
+        full_payload = f.read()
+    full = json.loads(full_payload)
+    masked = apply_fields_mask(
+        full, parse_fields_mask(GoogleCalendarService.LIST_FIELDS)
+    )
+    variants = {
+        "sin fields mask": (full_payload, full["items"]),
+        "con LIST_FIELDS": (json.dumps(masked).encode(), masked["items"]),
+    }
+
+    # Mismo resultado con y sin mask: solo cambia el costo
+    assert service.parse_events(masked["items"]) == service.parse_events(full["items"])
+
+    timings = {label: {"loads": [], "parse": []} for label in variants}
+    # Alternados, para que el ruido de la máquina afecte a ambos por igual
+    for _ in range(args.repeat):
+        for label, (payload, items) in variants.items():
+            timings[label]["loads"].append(elapsed(lambda: json.loads(payload)))
+            timings[label]["parse"].append(
+                elapsed(lambda: service.parse_events(items))
+            )
+
+    print(f"📅 {len(full['items']):,} eventos, {args.repeat} repeticiones\n")
+    summary = {}
+    for label, (payload, _) in variants.items():
+        gzipped = len(gzip.compress(payload))
+        print(f"📊 {label}")
+        print(f"   ├─ JSON:         {len(payload):>10,} bytes")
+        print(f"   ├─ gzip:         {gzipped:>10,} bytes")
+        print(f"   ├─ json.loads:   {format_ms(timings[label]['loads'])}")
+        print(f"   └─ parse_events: {format_ms(timings[label]['parse'])}")
+        summary[label] = {
+            "JSON": len(payload),
+            "gzip": gzipped,
+            "json.loads": min(timings[label]["loads"]),
+            "parse_events": min(timings[label]["parse"]),
+        }
+
+    before, after = summary.values()
+    print("\n📉 Con LIST_FIELDS (bytes y mejor tiempo)")
+    keys = list(before)
+    for i, key in enumerate(keys):
+        branch = "└─" if i == len(keys) - 1 else "├─"
+        print(f"   {branch} {key + ':':<13} {after[key] / before[key] - 1:+.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark de `GoogleCalendarService.parse_events` con eventos sintéticos
+con la forma de events.list (fields mask aplicado). No contacta a Google.
+
+Mezcla: ~80% eventos con hora y ~20% de todo el día, en franjas de 30 minutos
+durante un año; ~30% con BUJO_META en la descripción.
+
+Uso:
+    uv run bench_parse_events.py
+    uv run bench_parse_events.py --events 50000 --repeat 5
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+CATEGORIES = ["TRABAJO", "SALUD", "OCIO", "RUTINA", "personal", "Estudio"]
+PRIORITIES = ["critical", "high", "medium", "low"]
+
+
+def make_events(count: int, seed: int = 42) -> List[Dict]:
+    """Genera `count` eventos crudos como los entrega events.list."""
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1)
+    events = []
+    for i in range(count):
+        start = base + timedelta(minutes=30 * rng.randrange(365 * 48))
+        event = {
+            "id": f"evt{i:08d}",
+            "status": "confirmed",
+            "summary": f"Evento {i}",
+            "iCalUID": f"evt{i:08d}@google.com",
+        }
+        if rng.random() < 0.2:
+            event["start"] = {"date": start.date().isoformat()}
+            event["end"] = {"date": (start.date() + timedelta(days=1)).isoformat()}
+        else:
+            end = start + timedelta(minutes=30 * rng.randint(1, 4))
+            event["start"] = {"dateTime": f"{start.isoformat()}-05:00"}
+            event["end"] = {"dateTime": f"{end.isoformat()}-05:00"}
+        if rng.random() < 0.3:
+            meta = {
+                "priority": rng.choice(PRIORITIES),
+                "category": rng.choice(CATEGORIES),
+            }
+            event["description"] = f"Notas del evento\n\nBUJO_META: {json.dumps(meta)}"
+        elif rng.random() < 0.5:
+            event["description"] = "Notas del evento"
+        if rng.random() < 0.2:
+            event["location"] = "Oficina"
+        events.append(event)
+    return events
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Sin credenciales el servicio registra errores de setup: no aplican aquí
+    logging.getLogger("mnemos").setLevel(logging.CRITICAL)
+    from services.google_calendar import GoogleCalendarService
+
+    service = GoogleCalendarService()
+    events = make_events(args.events)
+
+    # Primera pasada (proceso recién iniciado)
+    started = time.perf_counter()
+    service.parse_events(events)
+    cold = time.perf_counter() - started
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        service.parse_events(events)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    median = statistics.median(timings)
+    print(f"📊 parse_events: {args.events:,} eventos, {args.repeat} repeticiones")
+    print(f"   ├─ primera pasada: {cold * 1000:8.1f} ms")
+    print(
+        f"   ├─ mejor:          {best * 1000:8.1f} ms "
+        f"({best / args.events * 1e6:.2f} µs/evento)"
+    )
+    print(
+        f"   └─ mediana:        {median * 1000:8.1f} ms "
+        f"({args.events / median:,.0f} eventos/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,11 @@ from utils.seed import (
 from utils.logger import logger
 from utils.telemetry import setup_opentelemetry, instrument_fastapi
 from utils.config import get_priority_config
+from utils.migrations import run_migrations
+from services.sync_worker import start_sync_worker, stop_sync_worker
+from services.outbox import start_outbox_drainer, stop_outbox_drainer
+from services.watch_channels import start_watch_channels, stop_watch_channels
+from services.google_calendar_async import close_async_calendar_service
 import os
 from dotenv import load_dotenv
 from sqlalchemy.exc import OperationalError
@@ -22,6 +27,7 @@ load_dotenv()
 setup_opentelemetry()
 
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 
 API_V1 = "/api/v1"
 
@@ -99,6 +105,24 @@ def startup_event():
         db.close()
 
 
+@app.on_event("startup")
+async def start_background_workers():
+    # Sincronización periódica: las lecturas sirven siempre desde el caché local
+    await start_sync_worker()
+    # Envío en segundo plano de los cambios locales encolados en el outbox
+    await start_outbox_drainer()
+    # Notificaciones push de Google: sincronización casi en tiempo real
+    await start_watch_channels()
+
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    await stop_sync_worker()
+    await stop_outbox_drainer()
+    await stop_watch_channels()
+    await close_async_calendar_service()
+
+
 @app.get("/")
 def hello():
     return {"message": "Hello World"}
@@ -4,6 +4,11 @@ from .priority import Priority
 from .inbox_item import InboxItem
 from .idea import Idea
 from .calendar_event import CalendarEvent
+from .calendar_sync_state import CalendarSyncState
+from .calendar_outbox import CalendarOutbox
+from .calendar_watch_channel import CalendarWatchChannel
+from .calendar_backfill_shard import CalendarBackfillShard
+from .calendar_sync_lock import CalendarSyncLock
 
 # from .habit import Habit
 # from .habit_log import HabitLog
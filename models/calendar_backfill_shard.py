@@ -0,0 +1,41 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    Text,
+    UniqueConstraint,
+)
+from database import Base
+from sqlalchemy.sql import func
+
+
+class CalendarBackfillShard(Base):
+    """
+    Checkpoint de una importación histórica (backfill), un registro por mes
+    y calendario. Si el proceso se cae, el backfill continúa desde los meses
+    pendientes y, dentro de un mes a medias, desde la última página guardada.
+    """
+
+    __tablename__ = "calendar_backfill_shards"
+    __table_args__ = (
+        UniqueConstraint("calendar_id", "shard_start", "shard_end"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    calendar_id = Column(String, index=True, nullable=False)
+    shard_start = Column(DateTime(timezone=True), nullable=False)
+    shard_end = Column(DateTime(timezone=True), nullable=False)
+    status = Column(String, default="pending", nullable=False)  # pending | done | failed
+    page_token = Column(Text, nullable=True)  # Siguiente página por procesar
+    events = Column(Integer, default=0, nullable=False)  # Eventos escritos hasta ahora
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
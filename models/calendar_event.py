@@ -7,11 +7,24 @@ from sqlalchemy import (
     DateTime,
     Text,
     JSON,
+    Index,
 )
+from typing import Optional
 from database import Base
+from sqlalchemy.orm import validates
 from sqlalchemy.sql import func
 
 
+def normalize_category(category: Optional[str]) -> Optional[str]:
+    """
+    Forma canónica de una categoría ("trabajo " -> "TRABAJO", "" -> None).
+    Se guarda así para que los filtros sean igualdad simple sobre el índice.
+    """
+    if category is None:
+        return None
+    return category.strip().upper() or None
+
+
 class CalendarEvent(Base):
     """
     Modelo para cachear eventos de Google Calendar localmente.
@@ -19,11 +32,23 @@ class CalendarEvent(Base):
     """
 
     __tablename__ = "calendar_events"
+    __table_args__ = (
+        # Paginación por cursor: ORDER BY start_datetime, id
+        Index("ix_calendar_events_start_id", "start_datetime", "id"),
+        # Listado filtrado por categoría y ordenado por fecha
+        Index("ix_calendar_events_category_start", "category", "start_datetime"),
+        # Modo overlaps en SQLite: rango sobre start_datetime, end_datetime sin leer la fila
+        Index("ix_calendar_events_start_end", "start_datetime", "end_datetime"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     google_event_id = Column(String, unique=True, index=True, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
+    # Origen en Google Calendar (NULL = calendario por defecto)
+    calendar_id = Column(String, nullable=True, index=True)
+    ical_uid = Column(String, nullable=True, index=True)  # iCalUID, común entre calendarios
+
     # Información del evento
     summary = Column(String, nullable=False)  # Título del evento
     description = Column(Text, nullable=True)  # Descripción completa
@@ -37,7 +62,10 @@ class CalendarEvent(Base):
     # Metadata del evento
     status = Column(String, nullable=True)  # confirmed, tentative, cancelled
     priority = Column(String, nullable=True, index=True)  # low, medium, high, critical
-    category = Column(String, nullable=True, index=True)  # TRABAJO, SALUD, OCIO, RUTINA
+    category = Column(String, nullable=True, index=True)  # TRABAJO, SALUD, OCIO, RUTINA (en mayúsculas)
+
+    # Hash del contenido sincronizado desde Google (detecta cambios reales)
+    content_hash = Column(String, nullable=True)
 
     # Metadata adicional (almacenada como JSON)
     # Nota: No usar 'metadata' porque es reservado en SQLAlchemy
@@ -56,3 +84,7 @@ class CalendarEvent(Base):
     synced_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+
+    @validates("category")
+    def _normalize_category(self, key, value):
+        return normalize_category(value)
@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from database import Base
+from sqlalchemy.sql import func
+
+
+class CalendarOutbox(Base):
+    """
+    Cola persistente de cambios locales pendientes de enviar a Google Calendar.
+
+    Hay a lo sumo un push pendiente por evento: las ediciones repetidas
+    actualizan la misma fila (coalescing) en lugar de encolar una nueva.
+    """
+
+    __tablename__ = "calendar_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # Evento local (NULL en deletes: la fila local ya no existe)
+    event_id = Column(Integer, unique=True, index=True, nullable=True)
+    action = Column(String, nullable=False)  # push | delete
+    google_event_id = Column(String, nullable=True)  # Requerido para delete
+    calendar_id = Column(String, nullable=True)
+
+    # Estado de entrega
+    status = Column(String, nullable=False, default="pending")  # pending | failed
+    version = Column(Integer, nullable=False, default=1)  # Sube con cada edición
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    last_error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime
+from database import Base
+
+
+class CalendarSyncLock(Base):
+    """
+    Lock de sincronización entre procesos para SQLite (en PostgreSQL se usa
+    un advisory lock). Una fila por lock tomado; `expires_at` libera el lock
+    si el proceso que lo tenía murió sin soltarlo.
+    """
+
+    __tablename__ = "calendar_sync_locks"
+
+    name = Column(String, primary_key=True)  # sync:<calendar_id>
+    owner = Column(String, nullable=False)  # host:pid:uuid del proceso dueño
+    acquired_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from database import Base
+from sqlalchemy.sql import func
+
+
+class CalendarSyncState(Base):
+    """
+    Estado de sincronización incremental por calendario.
+    Guarda el `nextSyncToken` de Google para pedir solo los cambios (deltas).
+    """
+
+    __tablename__ = "calendar_sync_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    calendar_id = Column(String, unique=True, index=True, nullable=False)
+    sync_token = Column(Text, nullable=True)  # nextSyncToken de Google
+
+    # Timestamps
+    last_full_sync_at = Column(DateTime(timezone=True), nullable=True)
+    last_incremental_sync_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from database import Base
+from sqlalchemy.sql import func
+
+
+class CalendarWatchChannel(Base):
+    """
+    Canal de notificaciones push (`events.watch`) activo por calendario.
+    Google envía un POST a `/calendar/webhook` cada vez que el calendario cambia.
+    """
+
+    __tablename__ = "calendar_watch_channels"
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(String, unique=True, index=True, nullable=False)
+    calendar_id = Column(String, index=True, nullable=False)
+    resource_id = Column(String, nullable=True)  # Asignado por Google
+    token = Column(String, nullable=False)  # Se valida en cada notificación
+    expiration = Column(DateTime(timezone=True), nullable=False)
+
+    # Timestamps
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -3,13 +3,24 @@ Router para endpoints de Google Calendar.
 Proporciona acceso a eventos del calendario con diferentes filtros.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    status,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional, Union, Dict
+from sqlalchemy import tuple_
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
-from models.calendar_event import CalendarEvent
+from models.calendar_event import CalendarEvent, normalize_category
 from schemas.calendar_event import (
     CalendarEventRead,
     CalendarEventSummary,
@@ -18,10 +29,47 @@ from schemas.calendar_event import (
     PrioritizedEventsResponse,
     PrioritizedEventsConfig,
     PrioritizedEventsCounts,
+    SyncReport,
+    BulkEventSelection,
+    BulkOperationItem,
+    BulkOperationResponse,
 )
 from dependencies.database import get_db
 from services.google_calendar import get_calendar_service
+from services.google_calendar_async import get_async_calendar_service
+from services.google_executor import (
+    CircuitOpenError,
+    GoogleCalendarError,
+    get_google_executor,
+)
+from services.backfill import get_backfill_job
+from services.event_overlap import apply_overlap
+from services.event_priority import (
+    HIGH_PRIORITY,
+    REGULAR,
+    ROUTINE,
+    get_prioritized_events,
+)
+from services.event_search import apply_search
+from services.event_store import event_to_google_data, get_events_by_google_ids
+from services.multi_calendar_sync import MultiCalendarSync
+from services.outbox import (
+    abandon_claim,
+    claim_pushes,
+    complete_claim,
+    discard_pending_pushes,
+    enqueue_delete,
+    enqueue_push,
+    get_outbox_drainer,
+    record_created_event,
+)
+from services.single_flight import get_single_flight
+from services.sync_lock import SyncLockTimeoutError
+from services.sync_worker import get_sync_worker
+from services.watch_channels import get_watch_manager
 from utils.logger import logger
+from utils.telemetry import record_counter, record_histogram
+from utils.pagination import decode_cursor, encode_cursor
 from utils.timezone import parse_date_param
 from utils.config import get_priority_config
 
@@ -72,275 +120,378 @@ def get_categories():
     return categories
 
 
-@router.api_route(
-    "/sync/today", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
-)
-def sync_today_events(db: Session = Depends(get_db)):
-    """
-    Sincroniza y obtiene eventos del día actual desde Google Calendar.
-    Acepta GET y POST.
-    """
+def _require_calendar_service():
+    """Obtiene el servicio de Google Calendar o responde 503 si no está configurado."""
     calendar_service = get_calendar_service()
 
     # Validar que el servicio esté inicializado
-    if not calendar_service.service:
+    if not calendar_service.configured:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Google Calendar service not configured. Please check your credentials and configuration.",
         )
+    return calendar_service
 
-    try:
-        # Obtener eventos de Google Calendar
-        google_events = calendar_service.get_today_events()
-        logger.info(f"📅 Syncing {len(google_events)} events from today")
-
-        synced_events = []
-        for google_event in google_events:
-            parsed_event = calendar_service.parse_event(google_event)
-
-            # Verificar si ya existe en la BD
-            existing = (
-                db.query(CalendarEvent)
-                .filter(
-                    CalendarEvent.google_event_id == parsed_event["google_event_id"]
-                )
-                .first()
-            )
 
-            if existing:
-                # Actualizar evento existente
-                for key, value in parsed_event.items():
-                    if key != "google_event_id":
-                        setattr(existing, key, value)
-                db_event = existing
-            else:
-                # Crear nuevo evento
-                db_event = CalendarEvent(**parsed_event)
-                db.add(db_event)
+def _google_http_exception(error: GoogleCalendarError) -> HTTPException:
+    """
+    Traduce un error de Google Calendar a una respuesta HTTP.
+    Circuit breaker abierto o límites de tasa -> 503 (con Retry-After);
+    cualquier otro fallo -> 502.
+    """
+    if isinstance(error, CircuitOpenError):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Google Calendar is unavailable (circuit breaker open). Retry later.",
+            headers={"Retry-After": str(max(1, int(error.retry_after or 1)))},
+        )
+    if error.rate_limited:
+        headers = {"Retry-After": str(int(error.retry_after or 30))}
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Google Calendar rate limit exceeded: {error.reason or error.status}",
+            headers=headers,
+        )
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=f"Google Calendar API error: {str(error)}",
+    )
 
-            synced_events.append(db_event)
 
-        db.commit()
-        logger.info(f"✅ Successfully synced {len(synced_events)} events")
-        return synced_events
+def _sync_busy_exception(error: SyncLockTimeoutError) -> HTTPException:
+    """Otro proceso está sincronizando el mismo calendario -> 503 con Retry-After."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Another process is syncing this calendar. Retry later.",
+        headers={"Retry-After": str(max(1, int(error.retry_after)))},
+    )
+
+
+async def _run_window_sync(
+    db: Session,
+    response: Response,
+    start_time: datetime,
+    end_time: datetime,
+    label: str,
+) -> List[CalendarEvent]:
+    """
+    Sincroniza un rango en todos los calendarios configurados (en paralelo) y
+    retorna los eventos sincronizados.
+
+    Reporta las páginas obtenidas en `X-Sync-Pages` y la latencia por etapa
+    en `Server-Timing`.
+    """
+    _require_calendar_service()
 
+    try:
+        result = await MultiCalendarSync().sync_window(start_time, end_time, label)
+    except GoogleCalendarError as e:
+        await run_in_threadpool(db.rollback)
+        logger.error(f"❌ Google Calendar error syncing {label} events: {e}")
+        raise _google_http_exception(e)
+    except SyncLockTimeoutError as e:
+        logger.warning(f"⚠️  {e}")
+        raise _sync_busy_exception(e)
     except Exception as e:
-        logger.error(f"❌ Error syncing today events: {e}")
+        await run_in_threadpool(db.rollback)
+        logger.error(f"❌ Error syncing {label} events: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to sync events: {str(e)}",
         )
 
+    response.headers["X-Sync-Pages"] = str(result.pages)
+    response.headers["Server-Timing"] = result.server_timing()
+    return await run_in_threadpool(get_events_by_google_ids, db, result.synced_ids)
+
+
+@router.api_route(
+    "/sync/today", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
+)
+async def sync_today_events(response: Response, db: Session = Depends(get_db)):
+    """
+    Sincroniza y obtiene eventos del día actual desde Google Calendar.
+    Acepta GET y POST.
+
+    El número de páginas obtenidas de Google se reporta en el header `X-Sync-Pages`.
+    """
+    start_time, end_time = get_calendar_service().get_today_range()
+    return await _run_window_sync(db, response, start_time, end_time, "today")
+
 
 @router.api_route(
     "/sync/week", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
 )
-def sync_week_events(db: Session = Depends(get_db)):
+async def sync_week_events(response: Response, db: Session = Depends(get_db)):
     """
     Sincroniza y obtiene eventos de la semana actual desde Google Calendar.
     Acepta GET y POST.
-    """
-    calendar_service = get_calendar_service()
 
-    # Validar que el servicio esté inicializado
-    if not calendar_service.service:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Google Calendar service not configured. Please check your credentials and configuration.",
-        )
+    El número de páginas obtenidas de Google se reporta en el header `X-Sync-Pages`.
+    """
+    start_time, end_time = get_calendar_service().get_week_range()
+    return await _run_window_sync(db, response, start_time, end_time, "week")
 
-    try:
-        google_events = calendar_service.get_week_events()
-        logger.info(f"📅 Syncing {len(google_events)} events from this week")
 
-        synced_events = []
-        for google_event in google_events:
-            parsed_event = calendar_service.parse_event(google_event)
+@router.api_route(
+    "/sync/month", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
+)
+async def sync_month_events(response: Response, db: Session = Depends(get_db)):
+    """
+    Sincroniza y obtiene eventos del mes actual desde Google Calendar.
+    Acepta GET y POST.
 
-            existing = (
-                db.query(CalendarEvent)
-                .filter(
-                    CalendarEvent.google_event_id == parsed_event["google_event_id"]
-                )
-                .first()
-            )
+    El número de páginas obtenidas de Google se reporta en el header `X-Sync-Pages`.
+    """
+    start_time, end_time = get_calendar_service().get_month_range()
+    return await _run_window_sync(db, response, start_time, end_time, "month")
 
-            if existing:
-                for key, value in parsed_event.items():
-                    if key != "google_event_id":
-                        setattr(existing, key, value)
-                # synced_at se actualiza automáticamente
-                db_event = existing
-            else:
-                db_event = CalendarEvent(**parsed_event)
-                db.add(db_event)
 
-            synced_events.append(db_event)
+@router.api_route(
+    "/sync/critical", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
+)
+async def sync_critical_events(
+    response: Response,
+    days_ahead: int = Query(7, ge=1, le=30, description="Días hacia adelante"),
+    db: Session = Depends(get_db),
+):
+    """
+    Sincroniza y obtiene eventos críticos (próximos N días) desde Google Calendar.
+    Acepta GET y POST.
 
-        db.commit()
-        logger.info(f"✅ Successfully synced {len(synced_events)} events")
-        return synced_events
+    - **days_ahead**: Número de días hacia adelante (default: 7, max: 30)
 
-    except Exception as e:
-        logger.error(f"❌ Error syncing week events: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to sync events: {str(e)}",
-        )
+    El número de páginas obtenidas de Google se reporta en el header `X-Sync-Pages`.
+    """
+    start_time, end_time = get_calendar_service().get_critical_range(days_ahead)
+    return await _run_window_sync(db, response, start_time, end_time, "critical")
 
 
 @router.api_route(
-    "/sync/month", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
+    "/sync/range", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
 )
-def sync_month_events(db: Session = Depends(get_db)):
+async def sync_range_events(
+    response: Response,
+    start: datetime = Query(..., description="Inicio del rango (ISO 8601)"),
+    end: datetime = Query(..., description="Fin del rango (ISO 8601)"),
+    db: Session = Depends(get_db),
+):
     """
-    Sincroniza y obtiene eventos del mes actual desde Google Calendar.
+    Sincroniza y obtiene eventos de un rango arbitrario desde Google Calendar.
     Acepta GET y POST.
-    """
-    calendar_service = get_calendar_service()
 
-    # Validar que el servicio esté inicializado
-    if not calendar_service.service:
+    - **start**: Inicio del rango (ej: 2026-02-01T00:00:00)
+    - **end**: Fin del rango (ej: 2026-02-28T23:59:59)
+
+    El número de páginas obtenidas de Google se reporta en el header `X-Sync-Pages`.
+    """
+    if end <= start:
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Google Calendar service not configured. Please check your credentials and configuration.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start",
         )
+    return await _run_window_sync(db, response, start, end, "range")
 
-    try:
-        google_events = calendar_service.get_month_events()
-        logger.info(f"📅 Syncing {len(google_events)} events from this month")
-
-        synced_events = []
-        for google_event in google_events:
-            parsed_event = calendar_service.parse_event(google_event)
-
-            existing = (
-                db.query(CalendarEvent)
-                .filter(
-                    CalendarEvent.google_event_id == parsed_event["google_event_id"]
-                )
-                .first()
-            )
-
-            if existing:
-                for key, value in parsed_event.items():
-                    if key != "google_event_id":
-                        setattr(existing, key, value)
-                # synced_at se actualiza automáticamente
-                db_event = existing
-            else:
-                db_event = CalendarEvent(**parsed_event)
-                db.add(db_event)
 
-            synced_events.append(db_event)
+@router.api_route(
+    "/sync/incremental", methods=["GET", "POST"], response_model=SyncReport
+)
+async def sync_incremental_events(response: Response, db: Session = Depends(get_db)):
+    """
+    Sincroniza solo los cambios desde la última sincronización (syncToken).
+    Acepta GET y POST.
 
-        db.commit()
-        logger.info(f"✅ Successfully synced {len(synced_events)} events")
-        return synced_events
+    - La primera llamada hace una sincronización completa desde
+      `SYNC_LOOKBACK_DAYS` días atrás y guarda el `nextSyncToken`.
+    - Las siguientes llamadas traen solo los eventos creados, modificados o
+      cancelados (los cancelados se eliminan del caché local).
+    - Si Google invalida el token (HTTP 410) se hace una resincronización completa.
+    - Los eventos cuyo contenido no cambió (`content_hash`) no se reescriben y
+      se cuentan en `unchanged`; `updated_at` solo cambia con cambios reales.
+    - Con varios calendarios (GOOGLE_CALENDAR_IDS) cada uno guarda su propio
+      token y se sincronizan en paralelo; `calendar_id` lista los calendarios.
+    """
+    _require_calendar_service()
 
+    try:
+        result = await MultiCalendarSync().sync_incremental()
+    except GoogleCalendarError as e:
+        await run_in_threadpool(db.rollback)
+        logger.error(f"❌ Google Calendar error in incremental sync: {e}")
+        raise _google_http_exception(e)
+    except SyncLockTimeoutError as e:
+        logger.warning(f"⚠️  {e}")
+        raise _sync_busy_exception(e)
     except Exception as e:
-        logger.error(f"❌ Error syncing month events: {e}")
+        await run_in_threadpool(db.rollback)
+        logger.error(f"❌ Error in incremental sync: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to sync events: {str(e)}",
         )
 
+    response.headers["Server-Timing"] = result.server_timing()
+    return SyncReport(
+        calendar_id=result.calendar_id,
+        mode=result.mode,
+        upserted=result.upserted,
+        created=result.created,
+        updated=result.updated,
+        unchanged=result.unchanged,
+        deleted=result.deleted,
+        pages=result.pages,
+        timings=result.timings,
+    )
 
-@router.api_route(
-    "/sync/critical", methods=["GET", "POST"], response_model=List[CalendarEventSummary]
-)
-def sync_critical_events(
-    days_ahead: int = Query(7, ge=1, le=30, description="Días hacia adelante"),
+
+@router.post("/backfill", status_code=status.HTTP_202_ACCEPTED)
+async def start_backfill(
+    start: datetime = Query(..., description="Inicio del rango (ISO 8601)"),
+    end: datetime = Query(..., description="Fin del rango (ISO 8601)"),
+    calendar_id: Optional[List[str]] = Query(
+        None, description="Calendarios a importar (default: todos)"
+    ),
     db: Session = Depends(get_db),
 ):
     """
-    Sincroniza y obtiene eventos críticos (próximos N días) desde Google Calendar.
-    Acepta GET y POST.
+    Importa un rango largo de historia (ej: varios años) en segundo plano.
 
-    - **days_ahead**: Número de días hacia adelante (default: 7, max: 30)
-    """
-    calendar_service = get_calendar_service()
+    - El rango se divide en meses que se descargan en paralelo
+      (`SYNC_BACKFILL_CONCURRENCY` a la vez) y se escriben con el upsert por lotes.
+    - Cada mes guarda un checkpoint: si el proceso se cae, volver a llamar con
+      el mismo rango continúa desde los meses pendientes.
+    - Responde 202 de inmediato; el avance se consulta en `GET /calendar/backfill`.
+    - 409 si ya hay un backfill corriendo.
 
-    # Validar que el servicio esté inicializado
-    if not calendar_service.service:
+    También disponible por línea de comandos: `uv run backfill.py --start ... --end ...`.
+    """
+    _require_calendar_service()
+    if end <= start:
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Google Calendar service not configured. Please check your credentials and configuration.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be after start",
         )
 
-    try:
-        google_events = calendar_service.get_critical_events(days_ahead=days_ahead)
-        logger.info(
-            f"📅 Syncing {len(google_events)} critical events (next {days_ahead} days)"
+    job = get_backfill_job()
+    if not job.start(start, end, calendar_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A backfill is already running",
         )
+    return await run_in_threadpool(job.get_status, db)
 
-        synced_events = []
-        for google_event in google_events:
-            parsed_event = calendar_service.parse_event(google_event)
 
-            existing = (
-                db.query(CalendarEvent)
-                .filter(
-                    CalendarEvent.google_event_id == parsed_event["google_event_id"]
-                )
-                .first()
-            )
+@router.get("/backfill")
+def get_backfill_status(db: Session = Depends(get_db)):
+    """
+    Estado del backfill: si está corriendo, shards completados/pendientes y
+    resultado de la última ejecución.
+    """
+    return get_backfill_job().get_status(db)
 
-            if existing:
-                for key, value in parsed_event.items():
-                    if key != "google_event_id":
-                        setattr(existing, key, value)
-                # synced_at se actualiza automáticamente
-                db_event = existing
-            else:
-                db_event = CalendarEvent(**parsed_event)
-                db.add(db_event)
 
-            synced_events.append(db_event)
+@router.post("/webhook", status_code=status.HTTP_200_OK)
+async def receive_google_notification(
+    x_goog_channel_id: str = Header(...),
+    x_goog_channel_token: Optional[str] = Header(None),
+    x_goog_resource_state: str = Header(...),
+    x_goog_resource_id: Optional[str] = Header(None),
+):
+    """
+    Receptor de notificaciones push de Google Calendar (`events.watch`).
 
-        db.commit()
-        logger.info(f"✅ Successfully synced {len(synced_events)} critical events")
-        return synced_events
+    - Valida `X-Goog-Channel-ID` contra los canales abiertos y
+      `X-Goog-Channel-Token` contra el secreto del canal.
+    - `X-Goog-Resource-State: sync` es el aviso inicial al abrir el canal y no
+      dispara nada.
+    - El resto de avisos se agrupan durante `WEBHOOK_DEBOUNCE_SECONDS` en una
+      sola sincronización incremental del calendario afectado.
 
-    except Exception as e:
-        logger.error(f"❌ Error syncing critical events: {e}")
+    Responde de inmediato (Google reintenta si tardamos); la sincronización
+    corre en segundo plano.
+    """
+    manager = get_watch_manager()
+    calendar_id = await run_in_threadpool(
+        manager.validate, x_goog_channel_id, x_goog_channel_token
+    )
+    if calendar_id is None:
+        logger.warning(
+            f"⚠️  Rejected notification for channel {x_goog_channel_id} "
+            f"(resource {x_goog_resource_id})"
+        )
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to sync events: {str(e)}",
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Unknown channel or invalid token",
         )
 
+    if x_goog_resource_state != "sync":
+        manager.notify(calendar_id)
+
+    return {"status": "accepted", "resource_state": x_goog_resource_state}
+
 
 @router.get(
     "/events", response_model=Union[List[CalendarEventRead], PrioritizedEventsResponse]
 )
 def list_cached_events(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(
+        None, description="Cursor de la página siguiente (header X-Next-Cursor)"
+    ),
     category: Optional[str] = None,
     priority: Optional[str] = None,
     search: Optional[str] = Query(None, description="Buscar en título y descripción"),
+    sort: str = Query(
+        "start",
+        pattern="^(start|relevance)$",
+        description="Orden: 'start' (fecha de inicio) o 'relevance' (con search)",
+    ),
     start_date: Optional[datetime] = Query(None, description="Fecha de inicio (desde)"),
     end_date: Optional[datetime] = Query(None, description="Fecha de fin (hasta)"),
     date: Optional[str] = Query(
         None, description="Fecha relativa: 'today', 'tomorrow', o 'YYYY-MM-DD'"
     ),
+    overlaps: bool = Query(
+        False, description="Incluir eventos que se cruzan con el rango (vista agenda)"
+    ),
     prioritized: bool = Query(
         False, description="Retornar eventos agrupados por prioridad"
     ),
+    group_limit: Optional[int] = Query(
+        None,
+        ge=1,
+        description="Con prioritized: máximo de eventos por grupo (default: limit)",
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Lista eventos cacheados localmente con filtros opcionales.
 
-    - **skip**: Número de registros a saltar (default: 0)
+    - **skip**: Número de registros a saltar (default: 0). Se mantiene por
+      compatibilidad; para recorrer muchas páginas usar `cursor`
     - **limit**: Número máximo de registros (default: 100)
+    - **cursor**: Continúa después del último evento de la página anterior
+      (ignora `skip`). Si hay más resultados, la respuesta incluye el header
+      `X-Next-Cursor` y un `Link: <...>; rel="next"` con la URL siguiente
     - **category**: Filtrar por categoría (TRABAJO, SALUD, OCIO, RUTINA) - case insensitive
     - **priority**: Filtrar por prioridad (low, medium, high, critical)
-    - **search**: Buscar texto en título y descripción (case-insensitive)
+    - **search**: Buscar texto en título y descripción (índice full-text: cada
+      palabra por prefijo, sin distinguir mayúsculas ni tildes)
+    - **sort**: `start` (default) o `relevance` para ordenar los resultados de
+      `search` por relevancia (el título pesa más que la descripción)
     - **start_date**: Mostrar eventos desde esta fecha (ISO format: 2026-02-20T00:00:00)
     - **end_date**: Mostrar eventos hasta esta fecha (ISO format: 2026-02-28T23:59:59)
     - **date**: Fecha relativa ('today', 'tomorrow', 'YYYY-MM-DD') - sobrescribe start_date/end_date
-    - **prioritized**: Si es True, retorna eventos agrupados por prioridad
+    - **overlaps**: Si es True, retorna todos los eventos que se cruzan con el
+      rango (empiezan antes de `end_date` y terminan después de `start_date`),
+      no solo los contenidos en él
+    - **prioritized**: Si es True, retorna eventos agrupados por prioridad.
+      Cada grupo trae hasta `group_limit` eventos (saltando `skip` de cada
+      grupo) y `counts` cuenta todos los eventos filtrados
+    - **group_limit**: Máximo de eventos por grupo en modo priorizado
     """
 
     # Manejar parámetro 'date' (sobrescribe start_date y end_date)
@@ -352,99 +503,96 @@ def list_cached_events(
 
     query = db.query(CalendarEvent)
 
-    # Filtro por categoría (case-insensitive)
+    # Filtro por categoría (case-insensitive): se guarda normalizada, así la
+    # comparación es una igualdad que usa el índice de category
     if category:
-        # Usar func.upper() para hacer la comparación case-insensitive
-        query = query.filter(func.upper(CalendarEvent.category) == category.upper())
+        query = query.filter(CalendarEvent.category == normalize_category(category))
 
     if priority:
         query = query.filter(CalendarEvent.priority == priority)
 
+    # Filtro por rango de fechas
+    if overlaps:
+        query = apply_overlap(db, query, start_date, end_date)
+    else:
+        if start_date:
+            query = query.filter(CalendarEvent.start_datetime >= start_date)
+        if end_date:
+            query = query.filter(CalendarEvent.end_datetime <= end_date)
+
+    # Ordenar por fecha de inicio (id desempata: orden estable para el cursor)
+    query = query.order_by(CalendarEvent.start_datetime, CalendarEvent.id)
+
     # Búsqueda por texto en título y descripción
+    ranked = bool(search) and sort == "relevance"
     if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            (CalendarEvent.summary.ilike(search_pattern))
-            | (CalendarEvent.description.ilike(search_pattern))
-        )
+        query = apply_search(db, query, search, rank=ranked)
 
-    # Filtro por rango de fechas
-    if start_date:
-        query = query.filter(CalendarEvent.start_datetime >= start_date)
-    if end_date:
-        query = query.filter(CalendarEvent.end_datetime <= end_date)
-
-    # Ordenar por fecha de inicio
-    query = query.order_by(CalendarEvent.start_datetime)
-
-    # Si no se pide priorización, retornar lista plana (backward compatibility)
-    if not prioritized:
-        events = query.offset(skip).limit(limit).all()
-        return events
-
-    # Modo priorizado: agrupar eventos
-    all_events = query.offset(skip).limit(limit).all()
-
-    # Obtener configuración de priorización
-    config = get_priority_config()
-
-    # Inicializar grupos
-    high_priority_events = []
-    regular_events = []
-    routine_events = []
-    category_counts: Dict[str, int] = {}
-
-    for event in all_events:
-        # Contar por categoría
-        event_category = event.category
-        if event_category:
-            category_counts[event_category] = category_counts.get(event_category, 0) + 1
-
-        # Clasificar evento
-        # 1. Rutinas (basado en categoría)
-        if event_category and event_category.upper() == config.routine_category.upper():
-            routine_events.append(event)
-
-        # 2. Alta prioridad (categoría + nivel de prioridad)
-        elif (
-            # Tiene categoría de alta prioridad
-            (
-                event_category
-                and event_category.upper()
-                in [cat.upper() for cat in config.high_priority_categories]
-            )
-            and
-            # Y tiene nivel de prioridad alto
-            (
-                event.priority
-                and event.priority.lower()
-                in [lvl.lower() for lvl in config.high_priority_levels]
+    # Modo priorizado: agrupar eventos en SQL (ver services/event_priority.py)
+    if prioritized:
+        if cursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    "cursor pagination is not available with prioritized=true; "
+                    "use skip"
+                ),
             )
-        ):
-            high_priority_events.append(event)
+        config = get_priority_config()
+        grouped = get_prioritized_events(
+            db, query, config, per_group_limit=group_limit or limit, skip=skip
+        )
+        return PrioritizedEventsResponse(
+            high_priority=grouped.groups[HIGH_PRIORITY],
+            regular=grouped.groups[REGULAR],
+            routines=grouped.groups[ROUTINE],
+            counts=PrioritizedEventsCounts(
+                high_priority=grouped.counts[HIGH_PRIORITY],
+                regular=grouped.counts[REGULAR],
+                routines=grouped.counts[ROUTINE],
+                total=grouped.total,
+                by_category=grouped.by_category,
+            ),
+            config=PrioritizedEventsConfig(
+                high_priority_categories=config.high_priority_categories,
+                high_priority_levels=config.high_priority_levels,
+                routine_category=config.routine_category,
+            ),
+        )
 
-        # 3. Regular (todo lo demás)
-        else:
-            regular_events.append(event)
-
-    # Construir respuesta
-    return PrioritizedEventsResponse(
-        high_priority=high_priority_events,
-        regular=regular_events,
-        routines=routine_events,
-        counts=PrioritizedEventsCounts(
-            high_priority=len(high_priority_events),
-            regular=len(regular_events),
-            routines=len(routine_events),
-            total=len(all_events),
-            by_category=category_counts,
-        ),
-        config=PrioritizedEventsConfig(
-            high_priority_categories=config.high_priority_categories,
-            high_priority_levels=config.high_priority_levels,
-            routine_category=config.routine_category,
-        ),
-    )
+    if cursor and ranked:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor pagination is not available with sort=relevance; use skip",
+        )
+    if cursor:
+        # Keyset: usa el índice (start_datetime, id) en vez de recorrer y
+        # descartar `skip` filas; las filas insertadas por un sync no desplazan páginas
+        try:
+            cursor_start, cursor_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        query = query.filter(
+            tuple_(CalendarEvent.start_datetime, CalendarEvent.id)
+            > tuple_(cursor_start, cursor_id)
+        )
+    else:
+        query = query.offset(skip)
+
+    # Un evento extra indica si hay página siguiente
+    all_events = query.limit(limit + 1).all()
+    has_more = len(all_events) > limit
+    all_events = all_events[:limit]
+    if has_more and not ranked:
+        last = all_events[-1]
+        next_cursor = encode_cursor(last.start_datetime, last.id)
+        next_url = request.url.remove_query_params("skip").include_query_params(
+            cursor=next_cursor
+        )
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+    return all_events
 
 
 @router.get("/events/{event_id}", response_model=CalendarEventRead)
@@ -463,8 +611,10 @@ def create_event(event_data: CalendarEventCreate, db: Session = Depends(get_db))
     """
     Crea un nuevo evento local.
 
-    Este evento se guarda solo en la base de datos local.
-    Para sincronizarlo con Google Calendar, usa los endpoints de sync.
+    El evento se guarda en la base de datos local. Si es un evento local
+    (`google_event_id` con prefijo `local_`), su creación en Google Calendar
+    queda encolada en el outbox (la envía el drainer en segundo plano); con
+    otro ID se asume que el evento ya existe en Google y no se envía.
 
     - **google_event_id**: ID único del evento (genera uno si es evento local)
     - **summary**: Título del evento (requerido)
@@ -497,8 +647,17 @@ def create_event(event_data: CalendarEventCreate, db: Session = Depends(get_db))
         # Crear evento
         db_event = CalendarEvent(**event_data.model_dump())
         db.add(db_event)
+        db.flush()
+        if db_event.google_event_id.startswith("local_"):
+            enqueue_push(db, db_event)
         db.commit()
         db.refresh(db_event)
+        _record_event_metric("events_created", db_event)
+        record_histogram(
+            "event_duration",
+            (db_event.end_datetime - db_event.start_datetime).total_seconds() / 3600,
+            attributes={"category": db_event.category or ""},
+        )
 
         logger.info(f"✅ Created event: {db_event.summary} (ID: {db_event.id})")
         return db_event
@@ -522,6 +681,8 @@ def update_event(
     Actualiza un evento existente (actualización completa).
 
     Solo actualiza los campos proporcionados, los demás se mantienen igual.
+    El cambio se encola para Google Calendar; varias ediciones seguidas del
+    mismo evento se envían como una sola actualización.
 
     - **summary**: Nuevo título
     - **description**: Nueva descripción
@@ -570,10 +731,14 @@ def update_event(
         for field, value in update_data.items():
             setattr(event, field, value)
 
+        # Mientras el push esté en el outbox, la sincronización no pisa la fila
+        enqueue_push(db, event)
+
         # updated_at se actualiza automáticamente con onupdate
 
         db.commit()
         db.refresh(event)
+        _record_event_metric("events_updated", event)
 
         logger.info(f"✅ Updated event: {event.summary} (ID: {event.id})")
         return event
@@ -620,130 +785,428 @@ def delete_cached_event(event_id: int, db: Session = Depends(get_db)):
 
     db.delete(event)
     db.commit()
+    _record_event_metric("events_deleted", event)
     return {"message": f"Event {event_id} deleted from cache"}
 
 
 # ==================== BIDIRECTIONAL SYNC ENDPOINTS ====================
 
 
+def _record_event_metric(
+    counter: str, event: CalendarEvent, source: str = "api"
+) -> None:
+    """Cuenta un cambio de evento en OTEL (`source`: api | google_push)."""
+    record_counter(
+        counter,
+        attributes={
+            "source": source,
+            "category": event.category or "",
+            "calendar_id": event.calendar_id or "",
+        },
+    )
+
+
+def _get_event_or_404(db: Session, event_id: int) -> CalendarEvent:
+    """Busca un evento local por ID o responde 404."""
+    event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return event
+
+
+def _claim_event_push(db: Session, event_id: int) -> Tuple[Dict, Dict]:
+    """
+    Lee el evento a enviar y reserva su push en el outbox (el drainer no lo
+    envía mientras tanto).
+
+    Returns:
+        (datos del evento al momento de reservar, reserva)
+
+    Raises:
+        HTTPException: 404 si no existe, 409 si ya se está enviando
+    """
+    event = _get_event_or_404(db, event_id)
+    snapshot = {
+        "event_data": event_to_google_data(event),
+        "google_event_id": event.google_event_id,
+        "calendar_id": event.calendar_id,
+    }
+    try:
+        claim = claim_pushes(db, [event]).get(event_id)
+    except IntegrityError:
+        db.rollback()
+        claim = None
+    if claim is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Event {event_id} is already being sent to Google Calendar",
+        )
+    return snapshot, claim
+
+
+def _finish_event_push(
+    db: Session,
+    event_id: int,
+    snapshot: Dict,
+    claim: Dict,
+    google_event: Optional[Dict],
+) -> Optional[CalendarEvent]:
+    """
+    Guarda el resultado de un push directo y cierra la reserva. Con
+    `google_event` None (el envío falló) la reserva se abandona.
+    """
+    if google_event is None:
+        abandon_claim(db, claim)
+        db.commit()
+        return None
+
+    if snapshot["google_event_id"].startswith("local_"):
+        record_created_event(
+            db,
+            event_id,
+            snapshot["google_event_id"],
+            snapshot["calendar_id"],
+            google_event,
+        )
+    complete_claim(db, claim)
+    db.commit()
+    return _get_event_or_404(db, event_id)
+
+
 @router.post("/events/{event_id}/push", response_model=CalendarEventRead)
-def push_event_to_google(event_id: int, db: Session = Depends(get_db)):
+async def push_event_to_google(event_id: int, db: Session = Depends(get_db)):
     """
     Crea o actualiza un evento en Google Calendar basado en el evento local.
 
     - Si el evento no existe en Google Calendar: lo **crea**
     - Si ya existe: lo **actualiza**
+    - Si el drainer del outbox lo está enviando en este momento: **409**
 
     Actualiza el google_event_id en la base de datos local.
     """
-    calendar_service = get_calendar_service()
+    _require_calendar_service()
+    async_service = get_async_calendar_service()
 
-    # Validar que el servicio esté inicializado
-    if not calendar_service.service:
+    # Toda la sesión se usa en el threadpool; aquí solo se llama a Google
+    snapshot, claim = await run_in_threadpool(_claim_event_push, db, event_id)
+    google_event = None
+    try:
+        google_event_id_str: str = snapshot["google_event_id"]
+        if google_event_id_str.startswith("local_"):
+            # Es un evento local, crear en Google
+            google_event = await async_service.create_event(
+                snapshot["event_data"], snapshot["calendar_id"]
+            )
+            action = "created"
+        else:
+            # Ya existe en Google, actualizar
+            google_event = await async_service.update_event(
+                google_event_id_str, snapshot["event_data"], snapshot["calendar_id"]
+            )
+            action = "updated"
+        if not google_event:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to push event to Google Calendar",
+            )
+    except HTTPException:
+        raise
+    except GoogleCalendarError as e:
+        logger.error(f"❌ Google Calendar error pushing event {event_id}: {e}")
+        raise _google_http_exception(e)
+    except Exception as e:
+        logger.error(f"❌ Error pushing event to Google Calendar: {e}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Google Calendar service not configured. Please check your credentials and configuration.",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to push event to Google Calendar: {str(e)}",
         )
+    finally:
+        if not google_event:
+            # El envío falló: el cambio (si había uno encolado) sigue en el outbox
+            await run_in_threadpool(
+                _finish_event_push, db, event_id, snapshot, claim, None
+            )
 
-    try:
-        # Buscar evento local
-        event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
-        if not event:
-            raise HTTPException(status_code=404, detail="Event not found")
+    event = await run_in_threadpool(
+        _finish_event_push, db, event_id, snapshot, claim, google_event
+    )
+    _record_event_metric(f"events_{action}", event, source="google_push")
+    logger.info(f"✅ Event {action} in Google Calendar: {google_event['id']}")
+    return event
 
-        # Convertir a dict para enviar a Google
-        event_data = {
-            "summary": event.summary,
-            "description": event.description or "",
-            "location": event.location,
-            "start_datetime": event.start_datetime,
-            "end_datetime": event.end_datetime,
-            "all_day": event.all_day,
-            "status": event.status or "confirmed",
-            "priority": event.priority,
-            "category": event.category,
-        }
 
-        # Verificar si ya existe en Google Calendar
-        google_event_id_str: str = event.google_event_id  # type: ignore
-        if google_event_id_str and google_event_id_str.startswith("local_"):
-            # Es un evento local, crear en Google
-            google_event = calendar_service.create_event(event_data)
-            if not google_event:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to create event in Google Calendar",
-                )
+def _select_events(db: Session, selection: BulkEventSelection) -> List[CalendarEvent]:
+    """
+    Resuelve una selección masiva (IDs o filtro) a eventos locales.
+    Exige IDs o al menos un filtro para no operar sobre todo el caché por error.
+    """
+    has_filter = any(
+        [selection.start_date, selection.end_date, selection.category]
+    ) or selection.local_only
+    if not selection.event_ids and not has_filter:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide event_ids or at least one filter (start_date, end_date, category, local_only)",
+        )
 
-            # Actualizar google_event_id
-            event.google_event_id = google_event["id"]
-            logger.info(f"✅ Created event in Google Calendar: {google_event['id']}")
+    query = db.query(CalendarEvent)
+    if selection.event_ids:
+        query = query.filter(CalendarEvent.id.in_(selection.event_ids))
+    if selection.start_date:
+        query = query.filter(CalendarEvent.start_datetime >= selection.start_date)
+    if selection.end_date:
+        query = query.filter(CalendarEvent.end_datetime <= selection.end_date)
+    if selection.category:
+        query = query.filter(
+            CalendarEvent.category == normalize_category(selection.category)
+        )
+    if selection.local_only:
+        query = query.filter(
+            CalendarEvent.google_event_id.startswith("local_", autoescape=True)
+        )
 
-        else:
-            # Ya existe en Google, actualizar
-            google_event = calendar_service.update_event(
-                google_event_id_str, event_data
+    return query.order_by(CalendarEvent.start_datetime).all()
+
+
+def _bulk_response(results: List[BulkOperationItem]) -> BulkOperationResponse:
+    succeeded = sum(1 for item in results if item.success)
+    for item in results:
+        if item.success:
+            record_counter(
+                f"events_{item.action}", attributes={"source": "google_push"}
             )
-            if not google_event:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to update event in Google Calendar",
+    return BulkOperationResponse(
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+    )
+
+
+@router.post("/events/push", response_model=BulkOperationResponse)
+def push_events_to_google(
+    selection: BulkEventSelection, db: Session = Depends(get_db)
+):
+    """
+    Crea o actualiza muchos eventos en Google Calendar en una sola llamada.
+
+    Los eventos se envían en batch requests de hasta 50 operaciones y los
+    `google_event_id` nuevos se guardan en una sola transacción. Los eventos
+    que el drainer del outbox está enviando en ese momento se reportan como
+    error sin enviarse.
+
+    - **event_ids**: IDs locales a enviar
+    - **start_date** / **end_date** / **category**: Filtro alternativo
+    - **local_only**: Solo eventos `local_*` (aún no creados en Google)
+
+    Retorna el resultado por evento (created / updated / error).
+    """
+    calendar_service = _require_calendar_service()
+
+    try:
+        events = _select_events(db, selection)
+
+        operations = []
+        for event in events:
+            google_event_id_str: str = event.google_event_id  # type: ignore
+            is_local = google_event_id_str.startswith("local_")
+            operations.append(
+                {
+                    "key": str(event.id),
+                    "google_event_id": None if is_local else google_event_id_str,
+                    "local_google_event_id": google_event_id_str,
+                    "calendar_id": event.calendar_id,
+                    "event_data": event_to_google_data(event),
+                }
+            )
+
+        # Reservar los pushes: los que el drainer está enviando quedan fuera
+        try:
+            claims = claim_pushes(db, events)
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Events are already being sent to Google Calendar",
+            )
+        claimed = [op for op in operations if int(op["key"]) in claims]
+        batch_results = calendar_service.batch_push_events(claimed)
+
+        results = []
+        for operation in operations:
+            event_id = int(operation["key"])
+            local_google_event_id = (
+                operation["google_event_id"] or operation["local_google_event_id"]
+            )
+            action = "updated" if operation["google_event_id"] else "created"
+            if event_id not in claims:
+                results.append(
+                    BulkOperationItem(
+                        event_id=event_id,
+                        success=False,
+                        action=action,
+                        google_event_id=local_google_event_id,
+                        error="Push already in progress",
+                    )
+                )
+                continue
+
+            outcome = batch_results.get(operation["key"])
+            if not outcome or outcome["error"] is not None:
+                error = outcome["error"] if outcome else "No response from Google"
+                abandon_claim(db, claims[event_id])
+                results.append(
+                    BulkOperationItem(
+                        event_id=event_id,
+                        success=False,
+                        action=action,
+                        google_event_id=local_google_event_id,
+                        error=str(error),
+                    )
+                )
+                continue
+
+            google_event = outcome["response"]
+            if action == "created":
+                record_created_event(
+                    db,
+                    event_id,
+                    local_google_event_id,
+                    operation["calendar_id"],
+                    google_event,
+                )
+            complete_claim(db, claims[event_id])
+            results.append(
+                BulkOperationItem(
+                    event_id=event_id,
+                    success=True,
+                    action=action,
+                    google_event_id=google_event["id"],
                 )
-            logger.info(f"✅ Updated event in Google Calendar: {event.google_event_id}")
+            )
 
+        # Guardar los google_event_id nuevos y cerrar las reservas en una transacción
         db.commit()
-        db.refresh(event)
-        return event
+
+        response = _bulk_response(results)
+        logger.info(
+            f"✅ Bulk push: {response.succeeded} succeeded, {response.failed} failed"
+        )
+        return response
 
     except HTTPException:
         raise
+    except GoogleCalendarError as e:
+        db.rollback()
+        logger.error(f"❌ Google Calendar error in bulk push: {e}")
+        raise _google_http_exception(e)
     except Exception as e:
         db.rollback()
-        logger.error(f"❌ Error pushing event to Google Calendar: {e}")
+        logger.error(f"❌ Error pushing events to Google Calendar: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to push event to Google Calendar: {str(e)}",
+            detail=f"Failed to push events to Google Calendar: {str(e)}",
         )
 
 
-@router.delete("/events/{event_id}/sync")
-def delete_event_from_google(event_id: int, db: Session = Depends(get_db)):
+@router.post("/events/delete", response_model=BulkOperationResponse)
+def delete_events_from_google(
+    selection: BulkEventSelection, db: Session = Depends(get_db)
+):
     """
-    Elimina un evento tanto de la base de datos local como de Google Calendar.
+    Elimina muchos eventos tanto de Google Calendar como de la base de datos local.
 
-    - Elimina de Google Calendar (si existe)
-    - Elimina de la base de datos local
+    - Los borrados en Google se envían en batch requests de hasta 50 operaciones
+    - Eventos que Google ya no tiene (404/410) se consideran eliminados
+    - Los eventos locales se eliminan con un solo `DELETE ... WHERE id IN (...)`
+    - Si Google falla para un evento, se conserva localmente y se reporta el error
+
+    Acepta `event_ids` o un filtro (`start_date`, `end_date`, `category`, `local_only`).
     """
-    calendar_service = get_calendar_service()
+    calendar_service = _require_calendar_service()
 
-    # Validar que el servicio esté inicializado
-    if not calendar_service.service:
+    try:
+        events = _select_events(db, selection)
+
+        remote_calendars = {
+            event.google_event_id: event.calendar_id
+            for event in events
+            if not event.google_event_id.startswith("local_")
+        }
+        google_errors = (
+            calendar_service.batch_delete_events(
+                list(remote_calendars), remote_calendars
+            )
+            if remote_calendars
+            else {}
+        )
+
+        results = []
+        deleted_ids = []
+        for event in events:
+            error = google_errors.get(event.google_event_id)
+            if error is None:
+                deleted_ids.append(event.id)
+            results.append(
+                BulkOperationItem(
+                    event_id=event.id,
+                    success=error is None,
+                    action="deleted",
+                    google_event_id=event.google_event_id,
+                    error=str(error) if error else None,
+                )
+            )
+
+        if deleted_ids:
+            db.query(CalendarEvent).filter(CalendarEvent.id.in_(deleted_ids)).delete(
+                synchronize_session=False
+            )
+            discard_pending_pushes(db, deleted_ids)
+        db.commit()
+
+        response = _bulk_response(results)
+        logger.info(
+            f"✅ Bulk delete: {response.succeeded} succeeded, {response.failed} failed"
+        )
+        return response
+
+    except HTTPException:
+        raise
+    except GoogleCalendarError as e:
+        db.rollback()
+        logger.error(f"❌ Google Calendar error in bulk delete: {e}")
+        raise _google_http_exception(e)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Error deleting events: {e}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Google Calendar service not configured. Please check your credentials and configuration.",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to delete events: {str(e)}",
         )
 
-    try:
-        # Buscar evento local
-        event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
-        if not event:
-            raise HTTPException(status_code=404, detail="Event not found")
 
-        # Intentar eliminar de Google Calendar (si no es local)
+@router.delete("/events/{event_id}/sync")
+def delete_event_from_google(event_id: int, db: Session = Depends(get_db)):
+    """
+    Elimina un evento de la base de datos local y encola su borrado en Google Calendar.
+
+    - Elimina de la base de datos local (inmediato)
+    - El borrado en Google Calendar lo envía el drainer del outbox, con reintentos
+    """
+    _require_calendar_service()
+
+    try:
+        event = _get_event_or_404(db, event_id)
         google_event_id_str: str = event.google_event_id  # type: ignore
-        if google_event_id_str and not google_event_id_str.startswith("local_"):
-            success = calendar_service.delete_event(google_event_id_str)
-            if not success:
-                logger.warning(
-                    f"⚠️  Failed to delete from Google Calendar, but will delete from local DB"
-                )
 
-        # Eliminar de la base de datos local
+        # Encolar el borrado remoto en la misma transacción que el borrado local
+        enqueue_delete(db, event)
         db.delete(event)
         db.commit()
+        _record_event_metric("events_deleted", event)
 
         return {
-            "message": f"Event {event_id} deleted from both local database and Google Calendar",
+            "message": f"Event {event_id} deleted from local database; Google Calendar deletion queued",
             "google_event_id": google_event_id_str,
         }
 
@@ -765,13 +1228,31 @@ def check_calendar_health():
 
     Returns:
         - configured: Si el servicio está configurado correctamente
-        - calendar_id: ID del calendario configurado
+        - calendar_id: ID del calendario por defecto (destino de eventos nuevos)
+        - calendar_ids: Calendarios sincronizados (GOOGLE_CALENDAR_IDS)
         - timezone: Timezone configurado
         - message: Mensaje descriptivo del estado
+        - sync: Estado del worker de sincronización (last_synced_at, stale, ...) y
+          sincronizaciones compartidas por el single-flight (`single_flight.joined`)
+        - outbox: Cambios locales pendientes/fallidos hacia Google y estado del drainer
+        - webhook: Notificaciones push recibidas y sincronizaciones disparadas
+        - google_api: Requests, reintentos, espera por throttling y estado del
+          circuit breaker (closed / open / half_open)
     """
     import os
 
     calendar_service = get_calendar_service()
+    sync_status = {
+        **get_sync_worker().get_status(),
+        "single_flight": get_single_flight().get_stats(),
+    }
+    outbox_status = get_outbox_drainer().get_status()
+    webhook_status = get_watch_manager().get_status()
+    executor = get_google_executor()
+    google_api_status = {
+        **executor.get_stats(),
+        "circuit_breaker": executor.breaker.get_status(),
+    }
     service_account_file = os.getenv(
         "GOOGLE_SERVICE_ACCOUNT_FILE", "credentials/service-account.json"
     )
@@ -783,32 +1264,47 @@ def check_calendar_health():
         return {
             "configured": False,
             "calendar_id": calendar_service.calendar_id,
+            "calendar_ids": calendar_service.calendar_ids,
             "timezone": calendar_service.timezone,
             "credentials_file": service_account_file,
             "credentials_exist": False,
             "service_initialized": False,
             "message": f"❌ Service account file not found: {service_account_file}. Please add your Google Calendar credentials.",
             "help": "See docs/GOOGLE_CALENDAR_INTEGRATION.md for setup instructions",
+            "sync": sync_status,
+            "outbox": outbox_status,
+            "webhook": webhook_status,
+            "google_api": google_api_status,
         }
 
-    if not calendar_service.service:
+    if not calendar_service.configured:
         return {
             "configured": False,
             "calendar_id": calendar_service.calendar_id,
+            "calendar_ids": calendar_service.calendar_ids,
             "timezone": calendar_service.timezone,
             "credentials_file": service_account_file,
             "credentials_exist": True,
             "service_initialized": False,
             "message": "❌ Google Calendar service failed to initialize. Check credentials and API access.",
             "help": "See docs/GOOGLE_CALENDAR_INTEGRATION.md for troubleshooting",
+            "sync": sync_status,
+            "outbox": outbox_status,
+            "webhook": webhook_status,
+            "google_api": google_api_status,
         }
 
     return {
         "configured": True,
         "calendar_id": calendar_service.calendar_id,
+        "calendar_ids": calendar_service.calendar_ids,
         "timezone": calendar_service.timezone,
         "credentials_file": service_account_file,
         "credentials_exist": True,
         "service_initialized": True,
         "message": "✅ Google Calendar service is properly configured and ready to use",
+        "sync": sync_status,
+        "outbox": outbox_status,
+        "webhook": webhook_status,
+        "google_api": google_api_status,
     }
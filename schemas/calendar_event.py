@@ -14,6 +14,7 @@ class CalendarEventBase(BaseModel):
     priority: Optional[str] = None
     category: Optional[str] = None
     extra_data: Optional[Dict[str, Any]] = None
+    calendar_id: Optional[str] = None  # Calendario de Google (None = por defecto)
 
 
 class CalendarEventCreate(CalendarEventBase):
@@ -37,6 +38,7 @@ class CalendarEventUpdate(BaseModel):
 class CalendarEventRead(CalendarEventBase):
     id: int
     google_event_id: str
+    ical_uid: Optional[str] = None
     user_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
@@ -88,3 +90,46 @@ class PrioritizedEventsResponse(BaseModel):
     routines: List[CalendarEventRead]
     counts: PrioritizedEventsCounts
     config: PrioritizedEventsConfig
+
+
+class SyncReport(BaseModel):
+    """Resultado de una sincronización con Google Calendar"""
+
+    calendar_id: str  # Calendarios sincronizados, separados por coma
+    mode: str  # full | incremental | mixed
+    upserted: int
+    created: int
+    updated: int
+    unchanged: int  # Sin cambios (mismo content_hash): no se reescriben
+    deleted: int
+    pages: int
+    timings: Dict[str, float]  # Segundos por etapa (fetch, parse, diff, write, total)
+
+
+class BulkEventSelection(BaseModel):
+    """Selección de eventos para operaciones masivas: por IDs o por filtro"""
+
+    event_ids: Optional[List[int]] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    category: Optional[str] = None
+    local_only: bool = False  # Solo eventos local_* (aún no creados en Google)
+
+
+class BulkOperationItem(BaseModel):
+    """Resultado de una operación masiva para un evento"""
+
+    event_id: int
+    success: bool
+    action: str  # created | updated | deleted
+    google_event_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BulkOperationResponse(BaseModel):
+    """Respuesta de operaciones masivas con resultado por evento"""
+
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BulkOperationItem]
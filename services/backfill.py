@@ -0,0 +1,363 @@
+"""
+Importación histórica (backfill) de rangos largos desde Google Calendar.
+
+El rango se divide en meses (shards) que se descargan en paralelo con un
+máximo de `SYNC_BACKFILL_CONCURRENCY` a la vez. Cada página pasa por el
+pipeline normal del SyncEngine (upsert por lotes) y cada shard guarda un
+checkpoint en `calendar_backfill_shards`, así un backfill interrumpido
+continúa donde quedó en vez de empezar de nuevo.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from database import SessionLocal
+from models.calendar_backfill_shard import CalendarBackfillShard
+from services.event_store import dedupe_by_ical_uid
+from services.google_calendar_async import (
+    AsyncGoogleCalendarService,
+    get_async_calendar_service,
+)
+from services.google_executor import GoogleCalendarError
+from services.sync_engine import SyncEngine, SyncResult
+from utils.config import get_sync_config
+from utils.logger import logger
+from utils.timezone import now_local
+
+
+def month_shards(start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+    """
+    Divide [start, end) en tramos de mes calendario (UTC). El primer y el
+    último tramo pueden ser parciales.
+    """
+    shards = []
+    cursor = start
+    while cursor < end:
+        month_start = cursor.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        shard_end = min(next_month, end)
+        shards.append((cursor, shard_end))
+        cursor = shard_end
+    return shards
+
+
+@dataclass
+class _Shard:
+    """Copia de un checkpoint, independiente de la sesión que lo leyó."""
+
+    id: int
+    calendar_id: str
+    start: datetime
+    end: datetime
+    page_token: Optional[str]
+    events: int
+
+
+class Backfill:
+    """
+    Descarga un rango largo (años) de uno o varios calendarios en shards
+    mensuales concurrentes, con checkpoint por shard.
+
+    Los shards ya completados de un backfill anterior del mismo rango se
+    omiten; un shard a medias continúa desde su última página guardada.
+    """
+
+    def __init__(
+        self,
+        async_service: Optional[AsyncGoogleCalendarService] = None,
+        calendar_ids: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.async_service = async_service or get_async_calendar_service()
+        self.calendar_ids = calendar_ids or self.async_service.calendar_ids
+        self.max_concurrency = (
+            max_concurrency or get_sync_config().backfill_concurrency
+        )
+        self.session_factory = session_factory
+
+        # Progreso de la ejecución actual
+        self.total_shards = 0
+        self.completed_shards = 0
+        self.skipped_shards = 0
+
+    async def run(self, start_time: datetime, end_time: datetime) -> SyncResult:
+        """
+        Importa [start_time, end_time) de todos los calendarios.
+
+        Raises:
+            GoogleCalendarError: Si algún shard falla (los demás terminan igual
+                y quedan guardados; reintentar continúa desde los pendientes)
+        """
+        start_time = self._to_utc(start_time)
+        end_time = self._to_utc(end_time)
+        shards = await asyncio.to_thread(self._prepare_shards, start_time, end_time)
+        logger.info(
+            f"📦 Backfill {start_time.date()} -> {end_time.date()}: "
+            f"{len(shards)} shard(s) pending, {self.skipped_shards} already done "
+            f"(concurrency {self.max_concurrency})"
+        )
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_limited(shard: _Shard) -> SyncResult:
+            async with semaphore:
+                return await self._run_shard(shard)
+
+        outcomes = await asyncio.gather(
+            *(run_limited(shard) for shard in shards), return_exceptions=True
+        )
+        results = [o for o in outcomes if not isinstance(o, BaseException)]
+        errors = [o for o in outcomes if isinstance(o, BaseException)]
+
+        if len(self.calendar_ids) > 1 and results:
+            await asyncio.to_thread(self._dedupe)
+        if errors:
+            logger.error(
+                f"❌ Backfill finished with {len(errors)} failed shard(s); "
+                "run it again to resume"
+            )
+            raise errors[0]
+
+        result = (
+            SyncResult.merge(results)
+            if results
+            else SyncResult(calendar_id=",".join(self.calendar_ids), mode="backfill")
+        )
+        result.mode = "backfill"
+        return result
+
+    # ==================== SHARDS ====================
+
+    def _prepare_shards(self, start_time: datetime, end_time: datetime) -> List[_Shard]:
+        """Crea los checkpoints que falten y retorna los shards no completados."""
+        db = self.session_factory()
+        try:
+            pending = []
+            for calendar_id in self.calendar_ids:
+                for shard_start, shard_end in month_shards(start_time, end_time):
+                    self.total_shards += 1
+                    row = (
+                        db.query(CalendarBackfillShard)
+                        .filter(
+                            CalendarBackfillShard.calendar_id == calendar_id,
+                            CalendarBackfillShard.shard_start == shard_start,
+                            CalendarBackfillShard.shard_end == shard_end,
+                        )
+                        .first()
+                    )
+                    if row is None:
+                        row = CalendarBackfillShard(
+                            calendar_id=calendar_id,
+                            shard_start=shard_start,
+                            shard_end=shard_end,
+                            status="pending",
+                            events=0,
+                        )
+                        db.add(row)
+                        db.flush()
+                    elif row.status == "done":
+                        self.skipped_shards += 1
+                        continue
+
+                    row.status = "pending"
+                    pending.append(
+                        _Shard(
+                            id=row.id,
+                            calendar_id=calendar_id,
+                            start=shard_start,
+                            end=shard_end,
+                            page_token=row.page_token,
+                            events=row.events,
+                        )
+                    )
+            db.commit()
+            return pending
+        finally:
+            db.close()
+
+    async def _run_shard(self, shard: _Shard) -> SyncResult:
+        db = self.session_factory()
+        try:
+            engine = SyncEngine(db)
+
+            def checkpoint(next_page_token: Optional[str], result: SyncResult) -> None:
+                row = db.get(CalendarBackfillShard, shard.id)
+                row.page_token = next_page_token
+                row.events = shard.events + result.fetched
+                db.commit()
+
+            try:
+                result = await engine.async_sync_window(
+                    shard.start,
+                    shard.end,
+                    self.async_service,
+                    shard.calendar_id,
+                    page_token=shard.page_token,
+                    checkpoint=checkpoint,
+                    window="backfill",
+                )
+            except GoogleCalendarError as e:
+                # Google invalida los pageToken viejos: repetir el mes completo
+                if not shard.page_token or e.status not in (400, 410):
+                    raise
+                logger.warning(
+                    f"⚠️  Checkpoint expired for shard {shard.start.date()} "
+                    f"({shard.calendar_id}), restarting it"
+                )
+                await asyncio.to_thread(db.rollback)
+                shard.page_token = None
+                shard.events = 0
+                result = await engine.async_sync_window(
+                    shard.start,
+                    shard.end,
+                    self.async_service,
+                    shard.calendar_id,
+                    checkpoint=checkpoint,
+                    window="backfill",
+                )
+
+            await asyncio.to_thread(self._mark, db, shard.id, "done")
+            self.completed_shards += 1
+            return result
+        except Exception as e:
+            await asyncio.to_thread(db.rollback)
+            await asyncio.to_thread(self._mark, db, shard.id, "failed", str(e))
+            logger.error(
+                f"❌ Backfill shard {shard.start.date()} ({shard.calendar_id}) failed: {e}"
+            )
+            raise
+        finally:
+            await asyncio.to_thread(db.close)
+
+    def _mark(
+        self, db: Session, shard_id: int, status: str, error: Optional[str] = None
+    ) -> None:
+        row = db.get(CalendarBackfillShard, shard_id)
+        row.status = status
+        row.last_error = error
+        if status == "done":
+            row.page_token = None
+            row.completed_at = now_local()
+        db.commit()
+
+    def _dedupe(self) -> None:
+        db = self.session_factory()
+        try:
+            dedupe_by_ical_uid(db, self.async_service.calendar_ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _to_utc(self, dt: datetime) -> datetime:
+        aware = self.async_service.sync_service._get_timezone_aware_datetime(dt)
+        return aware.astimezone(timezone.utc)
+
+
+def get_shard_counts(db: Session) -> Dict[str, int]:
+    """Cantidad de shards de backfill por estado (pending, done, failed)."""
+    rows = (
+        db.query(CalendarBackfillShard.status, func.count(CalendarBackfillShard.id))
+        .group_by(CalendarBackfillShard.status)
+        .all()
+    )
+    return {status: count for status, count in rows}
+
+
+class BackfillJob:
+    """
+    Ejecuta un backfill como tarea asyncio en segundo plano (un job a la vez)
+    para que el endpoint responda de inmediato.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._backfill: Optional[Backfill] = None
+        self.start_time: Optional[datetime] = None
+        self.end_time: Optional[datetime] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.last_result: Optional[SyncResult] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        calendar_ids: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        Lanza el backfill en segundo plano.
+
+        Returns:
+            False si ya hay un backfill corriendo
+        """
+        if self.running:
+            return False
+
+        self._backfill = Backfill(calendar_ids=calendar_ids)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.started_at = now_local()
+        self.finished_at = None
+        self.last_result = None
+        self.last_error = None
+        self._task = asyncio.create_task(self._run(), name="calendar-backfill")
+        return True
+
+    async def _run(self) -> None:
+        try:
+            self.last_result = await self._backfill.run(self.start_time, self.end_time)
+        except Exception as e:
+            self.last_error = str(e)
+        finally:
+            self.finished_at = now_local()
+
+    def get_status(self, db: Session) -> Dict:
+        """Estado del job y de los checkpoints para `GET /calendar/backfill`."""
+        status = {
+            "running": self.running,
+            "start": self.start_time,
+            "end": self.end_time,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "last_error": self.last_error,
+            "shards": get_shard_counts(db),
+        }
+        if self._backfill:
+            status["progress"] = {
+                "total": self._backfill.total_shards,
+                "completed": self._backfill.completed_shards,
+                "skipped": self._backfill.skipped_shards,
+            }
+        if self.last_result:
+            status["last_result"] = {
+                "created": self.last_result.created,
+                "updated": self.last_result.updated,
+                "unchanged": self.last_result.unchanged,
+                "pages": self.last_result.pages,
+                "timings": self.last_result.timings,
+            }
+        return status
+
+
+# Singleton para reutilizar la instancia
+_backfill_job = None
+
+
+def get_backfill_job() -> BackfillJob:
+    """Obtiene instancia singleton del job de backfill."""
+    global _backfill_job
+    if _backfill_job is None:
+        _backfill_job = BackfillJob()
+    return _backfill_job
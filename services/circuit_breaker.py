@@ -0,0 +1,123 @@
+"""
+Circuit breaker para dependencias externas (Google Calendar API).
+Estados: closed -> open -> half_open -> closed.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from utils.logger import logger
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker thread-safe.
+
+    - **closed**: las llamadas pasan; `failure_threshold` fallos consecutivos lo abren.
+    - **open**: las llamadas fallan al instante durante `recovery_timeout` segundos.
+    - **half_open**: deja pasar hasta `half_open_max_calls` llamadas de prueba;
+      un éxito lo cierra y un fallo lo vuelve a abrir.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def retry_after(self) -> float:
+        """Segundos que faltan para pasar a half_open (0 si no está abierto)."""
+        with self._lock:
+            if self._state != self.OPEN or self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Indica si una llamada puede pasar (reserva un cupo en half_open)."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN:
+                if self._half_open_calls < self.half_open_max_calls:
+                    self._half_open_calls += 1
+                    return True
+            return False
+
+    def release(self) -> None:
+        """
+        Devuelve el cupo de half_open de una llamada que terminó sin resultado
+        (cancelada o con un error inesperado), para que no quede tomado.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"✅ Circuit '{self.name}' closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._half_open_calls = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                if self._state != self.OPEN:
+                    logger.warning(
+                        f"⚠️  Circuit '{self.name}' opened after {self._failures} "
+                        f"failure(s); failing fast for {self.recovery_timeout}s"
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._half_open_calls = 0
+
+    def _maybe_half_open(self) -> None:
+        # Llamar con el lock tomado
+        if (
+            self._state == self.OPEN
+            and self._opened_at is not None
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+            logger.info(f"🔄 Circuit '{self.name}' half-open, probing")
+
+    def get_status(self) -> Dict:
+        """Estado del breaker para `/calendar/health`."""
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout_seconds": self.recovery_timeout,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
@@ -0,0 +1,92 @@
+"""
+Filtro de eventos que se cruzan con una ventana de tiempo (modo `overlaps`).
+
+Un evento se cruza con [start, end) si empieza antes de `end` y termina
+después de `start`, aunque empiece antes de la ventana o termine después.
+
+- PostgreSQL: columna generada `time_range` (tstzrange) con índice GiST,
+  creada en utils/migrations.py; el filtro es `time_range && ventana`.
+- SQLite: índice compuesto (start_datetime, end_datetime) más una cota
+  inferior para start_datetime: ningún evento dura más que la duración
+  máxima guardada (leída de un índice de expresión), así que los que
+  empiezan antes de `start - duración máxima` no pueden cruzarse y el índice
+  no los recorre.
+- Otros dialectos: comparación simple de columnas.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlalchemy import DateTime, func, literal, literal_column, text
+from sqlalchemy.orm import Query, Session
+from models.calendar_event import CalendarEvent
+
+# Backend disponible por dialecto: "tstzrange" | None (comparación de columnas)
+_backends: Dict[str, Optional[str]] = {}
+
+
+def _overlap_backend(db: Session) -> Optional[str]:
+    dialect = db.get_bind().dialect.name
+    if dialect not in _backends:
+        backend = None
+        if dialect == "postgresql":
+            found = db.execute(
+                text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = 'calendar_events' "
+                    "AND column_name = 'time_range'"
+                )
+            ).first()
+            backend = "tstzrange" if found else None
+        _backends[dialect] = backend
+    return _backends[dialect]
+
+
+def _max_duration(db: Session) -> timedelta:
+    """
+    Duración del evento más largo guardado, leída en cada consulta (exacta
+    aunque otro worker acabe de escribir). La expresión es la del índice
+    `ix_calendar_events_duration` (utils/migrations.py), así SQLite la
+    resuelve con una sola búsqueda en el índice en vez de recorrer la tabla.
+    """
+    days = db.query(
+        func.max(
+            func.julianday(CalendarEvent.end_datetime)
+            - func.julianday(CalendarEvent.start_datetime)
+        )
+    ).scalar()
+    return timedelta(days=max(days or 0, 0))
+
+
+def apply_overlap(
+    db: Session,
+    query: Query,
+    start: Optional[datetime],
+    end: Optional[datetime],
+) -> Query:
+    """
+    Filtra `query` a los eventos que se cruzan con [start, end). Cualquiera
+    de los extremos puede ser None (ventana abierta de ese lado).
+    """
+    if start is None and end is None:
+        return query
+
+    if _overlap_backend(db) == "tstzrange":
+        # time_range es cerrado [inicio, fin] y la ventana abierta (start, end):
+        # se cruzan si inicio < end y fin > start, igual que en SQLite
+        window = func.tstzrange(
+            literal(start, DateTime(timezone=True)),
+            literal(end, DateTime(timezone=True)),
+            "()",
+        )
+        time_range = literal_column("calendar_events.time_range")
+        return query.filter(time_range.op("&&")(window))
+
+    if end is not None:
+        query = query.filter(CalendarEvent.start_datetime < end)
+    if start is not None:
+        query = query.filter(CalendarEvent.end_datetime > start)
+        if db.get_bind().dialect.name == "sqlite":
+            # Cota inferior: acota el rango recorrido en el índice compuesto
+            lower = start - _max_duration(db)
+            query = query.filter(CalendarEvent.start_datetime >= lower)
+    return query
@@ -0,0 +1,127 @@
+"""
+Agrupación de eventos por prioridad (`/calendar/events?prioritized=true`)
+calculada en SQL.
+
+El grupo de cada evento sale de una expresión CASE; los contadores salen de
+un único GROUP BY y los eventos de cada grupo se acotan con ROW_NUMBER(), así
+se leen como objetos solo los primeros N de cada grupo y no toda la ventana.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+from sqlalchemy import and_, case, func, literal
+from sqlalchemy.orm import Query, Session
+from models.calendar_event import CalendarEvent
+from utils.config import PriorityConfig
+
+HIGH_PRIORITY = "high_priority"
+ROUTINE = "routine"
+REGULAR = "regular"
+
+
+@dataclass
+class PrioritizedEvents:
+    """Eventos agrupados (página de cada grupo) y contadores de toda la ventana."""
+
+    groups: Dict[str, List[CalendarEvent]]
+    counts: Dict[str, int]
+    by_category: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def priority_bucket(config: PriorityConfig):
+    """
+    Expresión CASE con el grupo del evento:
+
+    1. routine: categoría == ROUTINE_CATEGORY
+    2. high_priority: categoría en HIGH_PRIORITY_CATEGORIES y prioridad en
+       HIGH_PRIORITY_LEVELS
+    3. regular: todo lo demás
+    """
+    # Las categorías se guardan en mayúsculas (ver normalize_category)
+    return case(
+        (CalendarEvent.category == config.routine_category, literal(ROUTINE)),
+        (
+            and_(
+                CalendarEvent.category.in_(config.high_priority_categories),
+                func.lower(CalendarEvent.priority).in_(config.high_priority_levels),
+            ),
+            literal(HIGH_PRIORITY),
+        ),
+        else_=literal(REGULAR),
+    )
+
+
+def get_prioritized_events(
+    db: Session,
+    query: Query,
+    config: PriorityConfig,
+    per_group_limit: int,
+    skip: int = 0,
+) -> PrioritizedEvents:
+    """
+    Agrupa los eventos de `query` (ya filtrada) por prioridad.
+
+    Args:
+        db: Sesión de base de datos
+        query: Consulta de CalendarEvent con los filtros del listado
+        config: Configuración de priorización
+        per_group_limit: Máximo de eventos retornados por grupo
+        skip: Eventos a saltar al inicio de cada grupo
+
+    Returns:
+        Los eventos de cada grupo ordenados por fecha de inicio, y los
+        contadores (por grupo y por categoría) de todos los eventos filtrados
+    """
+    bucket = priority_bucket(config)
+    query = query.order_by(None)
+
+    # Contadores: un solo GROUP BY sobre (grupo, categoría)
+    classified = query.with_entities(
+        bucket.label("bucket"), CalendarEvent.category.label("category")
+    ).subquery("classified")
+    counts = {HIGH_PRIORITY: 0, ROUTINE: 0, REGULAR: 0}
+    by_category: Dict[str, int] = {}
+    for group, category, count in db.query(
+        classified.c.bucket, classified.c.category, func.count()
+    ).group_by(classified.c.bucket, classified.c.category):
+        counts[group] += count
+        if category:
+            by_category[category] = by_category.get(category, 0) + count
+
+    groups: Dict[str, List[CalendarEvent]] = {
+        HIGH_PRIORITY: [],
+        ROUTINE: [],
+        REGULAR: [],
+    }
+    if per_group_limit <= 0 or not any(counts.values()):
+        return PrioritizedEvents(groups, counts, by_category)
+
+    # Primeros N de cada grupo por fecha de inicio
+    numbered = query.with_entities(
+        CalendarEvent.id.label("id"),
+        bucket.label("bucket"),
+        func.row_number()
+        .over(
+            partition_by=bucket,
+            order_by=(CalendarEvent.start_datetime, CalendarEvent.id),
+        )
+        .label("position"),
+    ).subquery("numbered")
+    rows = (
+        db.query(CalendarEvent, numbered.c.bucket)
+        .join(numbered, numbered.c.id == CalendarEvent.id)
+        .filter(
+            numbered.c.position > skip,
+            numbered.c.position <= skip + per_group_limit,
+        )
+        .order_by(CalendarEvent.start_datetime, CalendarEvent.id)
+        .all()
+    )
+    for event, group in rows:
+        groups[group].append(event)
+
+    return PrioritizedEvents(groups, counts, by_category)
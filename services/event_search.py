@@ -0,0 +1,116 @@
+"""
+Búsqueda de texto en eventos cacheados.
+
+Usa el índice full-text creado en utils/migrations.py (FTS5 en SQLite,
+`tsvector` + GIN en PostgreSQL) con coincidencia por prefijo y ranking por
+relevancia, sin distinguir tildes; si el índice no existe, cae a
+`ILIKE '%texto%'` (que sí distingue tildes).
+"""
+
+import re
+from typing import Dict, List, Optional
+from sqlalchemy import Float, Integer, func, literal_column, text
+from sqlalchemy.orm import Query, Session
+from models.calendar_event import CalendarEvent
+from utils.migrations import POSTGRES_TS_CONFIG
+
+# Palabras de la búsqueda (sin operadores ni comillas del usuario)
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# El título pesa más que la descripción en el ranking
+SQLITE_RANK = "bm25(calendar_events_fts, 10.0, 1.0)"
+
+# Backend disponible por dialecto: "fts5" | "tsvector" | None (ILIKE)
+_backends: Dict[str, Optional[str]] = {}
+
+# Configuración de text search con la que se generó `search_vector`; to_tsquery
+# debe usar la misma para que las palabras se normalicen igual
+_ts_config = "simple"
+
+
+def _search_backend(db: Session) -> Optional[str]:
+    global _ts_config
+    dialect = db.get_bind().dialect.name
+    if dialect not in _backends:
+        backend = None
+        if dialect == "sqlite":
+            found = db.execute(
+                text(
+                    "SELECT 1 FROM sqlite_master "
+                    "WHERE type = 'table' AND name = 'calendar_events_fts'"
+                )
+            ).first()
+            backend = "fts5" if found else None
+        elif dialect == "postgresql":
+            found = db.execute(
+                text(
+                    "SELECT generation_expression FROM information_schema.columns "
+                    "WHERE table_name = 'calendar_events' "
+                    "AND column_name = 'search_vector'"
+                )
+            ).first()
+            backend = "tsvector" if found else None
+            if found and f"'{POSTGRES_TS_CONFIG}'" in (found[0] or ""):
+                _ts_config = POSTGRES_TS_CONFIG
+        _backends[dialect] = backend
+    return _backends[dialect]
+
+
+def _search_words(search: str) -> List[str]:
+    return WORD_PATTERN.findall(search)
+
+
+def apply_search(
+    db: Session, query: Query, search: str, rank: bool = False
+) -> Query:
+    """
+    Filtra `query` por el texto `search` en título y descripción.
+
+    Cada palabra debe aparecer como prefijo de alguna palabra del evento
+    ("reu cli" encuentra "Reunión con cliente"). Con `rank=True` ordena por
+    relevancia (el título pesa más); si no, el orden de `query` se mantiene.
+    """
+    words = _search_words(search)
+    backend = _search_backend(db) if words else None
+
+    if backend == "fts5":
+        # Cada palabra entre comillas (literal) con * = prefijo; AND implícito
+        match = " ".join(f'"{word}"*' for word in words)
+        matches = (
+            text(
+                f"SELECT rowid, {SQLITE_RANK} AS rank FROM calendar_events_fts "
+                "WHERE calendar_events_fts MATCH :match"
+            )
+            .bindparams(match=match)
+            .columns(rowid=Integer, rank=Float)
+            .subquery("fts_matches")
+        )
+        query = query.join(matches, matches.c.rowid == CalendarEvent.id)
+        if rank:
+            # bm25: menor = más relevante
+            query = query.order_by(None).order_by(
+                matches.c.rank, CalendarEvent.start_datetime, CalendarEvent.id
+            )
+        return query
+
+    if backend == "tsvector":
+        ts_query = func.to_tsquery(
+            literal_column(f"'{_ts_config}'::regconfig"),
+            " & ".join(f"{word.lower()}:*" for word in words),
+        )
+        search_vector = literal_column("calendar_events.search_vector")
+        query = query.filter(search_vector.op("@@")(ts_query))
+        if rank:
+            query = query.order_by(None).order_by(
+                func.ts_rank(search_vector, ts_query).desc(),
+                CalendarEvent.start_datetime,
+                CalendarEvent.id,
+            )
+        return query
+
+    # Sin índice full-text: búsqueda por subcadena (recorre la tabla)
+    search_pattern = f"%{search}%"
+    return query.filter(
+        (CalendarEvent.summary.ilike(search_pattern))
+        | (CalendarEvent.description.ilike(search_pattern))
+    )
@@ -0,0 +1,351 @@
+"""
+Escritura masiva de eventos de Google Calendar en el caché local.
+Usa INSERT ... ON CONFLICT nativo en SQLite y PostgreSQL.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import and_, case, literal, or_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from sqlalchemy.dialects import postgresql, sqlite
+from models.calendar_event import CalendarEvent
+from utils.config import get_sync_config
+from utils.logger import logger
+
+
+# Columnas que nunca se sobrescriben en un upsert
+_IMMUTABLE_COLUMNS = {"id", "google_event_id", "created_at"}
+_COLUMN_NAMES = set(CalendarEvent.__table__.columns.keys())
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    """Agrupa un iterable en listas de tamaño `size`."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _dedupe(parsed_events: List[Dict]) -> List[Dict]:
+    """
+    Elimina google_event_id repetidos dentro de un mismo lote (gana el último)
+    y descarta claves que no son columnas de `calendar_events`.
+    PostgreSQL no permite que un ON CONFLICT afecte la misma fila dos veces.
+    """
+    by_id = {
+        event["google_event_id"]: {
+            key: value for key, value in event.items() if key in _COLUMN_NAMES
+        }
+        for event in parsed_events
+    }
+    return list(by_id.values())
+
+
+def _rank_expression(column, calendar_ids: List[str]):
+    """Equivalente SQL de `calendar_rank` para la columna `column`."""
+    if not calendar_ids:
+        return literal(0)
+    return case(
+        {calendar_id: i for i, calendar_id in enumerate(calendar_ids)},
+        value=func.coalesce(column, calendar_ids[0]),
+        else_=len(calendar_ids),
+    )
+
+
+def _upsert_on_conflict(
+    db: Session, rows: List[Dict], dialect_insert, calendar_ids: List[str]
+) -> None:
+    """
+    Upsert en una sola sentencia usando ON CONFLICT (google_event_id).
+    Las filas cuyo `content_hash` y `calendar_id` no cambiaron no se reescriben,
+    y un calendario de menor prioridad (`calendar_rank`) nunca reescribe la
+    fila de otro: la condición se evalúa contra la fila ya guardada, así dos
+    calendarios sincronizando a la vez no se quitan el evento.
+    """
+    table = CalendarEvent.__table__
+    stmt = dialect_insert(table).values(rows)
+
+    update_columns = {
+        column.name: stmt.excluded[column.name]
+        for column in table.columns
+        if column.name in rows[0] and column.name not in _IMMUTABLE_COLUMNS
+    }
+    update_columns["updated_at"] = func.now()
+    update_columns["synced_at"] = func.now()
+
+    incoming_rank = _rank_expression(stmt.excluded.calendar_id, calendar_ids)
+    owner_rank = _rank_expression(table.c.calendar_id, calendar_ids)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.google_event_id],
+        set_=update_columns,
+        where=or_(
+            incoming_rank < owner_rank,
+            and_(
+                incoming_rank == owner_rank,
+                or_(
+                    table.c.content_hash.is_distinct_from(stmt.excluded.content_hash),
+                    table.c.calendar_id.is_distinct_from(stmt.excluded.calendar_id),
+                ),
+            ),
+        ),
+    )
+    db.execute(stmt)
+
+
+def _upsert_generic(db: Session, rows: List[Dict], calendar_ids: List[str]) -> None:
+    """
+    Upsert para otros motores: un solo SELECT ... IN para detectar existentes
+    y luego inserts/updates masivos (solo de filas con `content_hash` distinto
+    y con la misma regla de prioridad que `_upsert_on_conflict`).
+    """
+    ids = [row["google_event_id"] for row in rows]
+    existing = {
+        google_event_id: (event_id, (content_hash, calendar_id))
+        for google_event_id, event_id, content_hash, calendar_id in db.query(
+            CalendarEvent.google_event_id,
+            CalendarEvent.id,
+            CalendarEvent.content_hash,
+            CalendarEvent.calendar_id,
+        )
+        .filter(CalendarEvent.google_event_id.in_(ids))
+        .all()
+    }
+
+    rank_of = calendar_rank(calendar_ids)
+
+    def should_update(row: Dict) -> bool:
+        stored = existing[row["google_event_id"]][1]
+        incoming_rank = rank_of(row.get("calendar_id"))
+        owner_rank = rank_of(stored[1])
+        return incoming_rank < owner_rank or (
+            incoming_rank == owner_rank
+            and stored != (row.get("content_hash"), row.get("calendar_id"))
+        )
+
+    to_insert = [row for row in rows if row["google_event_id"] not in existing]
+    now = datetime.now(timezone.utc)
+    to_update = [
+        {
+            **row,
+            "id": existing[row["google_event_id"]][0],
+            "updated_at": now,
+            "synced_at": now,
+        }
+        for row in rows
+        if row["google_event_id"] in existing and should_update(row)
+    ]
+
+    if to_insert:
+        db.bulk_insert_mappings(CalendarEvent, to_insert)
+    if to_update:
+        db.bulk_update_mappings(CalendarEvent, to_update)
+
+
+def upsert_events(
+    db: Session, parsed_events: List[Dict], calendar_ids: Optional[List[str]] = None
+) -> int:
+    """
+    Crea o actualiza un lote de eventos parseados en una sola sentencia.
+    No hace commit.
+
+    Args:
+        db: Sesión de base de datos
+        parsed_events: Eventos en el formato de `GoogleCalendarService.parse_event`
+        calendar_ids: Calendarios en orden de prioridad (`calendar_rank`); sin
+            ellos cualquier calendario reescribe la fila
+
+    Returns:
+        Número de eventos escritos
+    """
+    rows = _dedupe(parsed_events)
+    if not rows:
+        return 0
+
+    calendar_ids = calendar_ids or []
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        _upsert_on_conflict(db, rows, postgresql.insert, calendar_ids)
+    elif dialect == "sqlite":
+        _upsert_on_conflict(db, rows, sqlite.insert, calendar_ids)
+    else:
+        _upsert_generic(db, rows, calendar_ids)
+
+    return len(rows)
+
+
+def bulk_upsert_events(
+    db: Session,
+    parsed_events: Iterable[Dict],
+    chunk_size: Optional[int] = None,
+    calendar_ids: Optional[List[str]] = None,
+) -> int:
+    """
+    Crea o actualiza eventos en lotes, haciendo commit por cada lote.
+
+    Args:
+        db: Sesión de base de datos
+        parsed_events: Eventos parseados (puede ser un generador)
+        chunk_size: Eventos por sentencia/commit (default: SYNC_BATCH_SIZE)
+        calendar_ids: Calendarios en orden de prioridad (ver `upsert_events`)
+
+    Returns:
+        Número total de eventos escritos
+    """
+    chunk_size = chunk_size or get_sync_config().batch_size
+
+    total = 0
+    for chunk in _chunked(parsed_events, chunk_size):
+        total += upsert_events(db, chunk, calendar_ids)
+        db.commit()
+
+    logger.debug(f"💾 Upserted {total} events (chunk size {chunk_size})")
+    return total
+
+
+def event_to_google_data(event: CalendarEvent) -> Dict:
+    """Convierte un evento local al dict que espera GoogleCalendarService."""
+    return {
+        "summary": event.summary,
+        "description": event.description or "",
+        "location": event.location,
+        "start_datetime": event.start_datetime,
+        "end_datetime": event.end_datetime,
+        "all_day": event.all_day,
+        "status": event.status or "confirmed",
+        "priority": event.priority,
+        "category": event.category,
+    }
+
+
+def get_stored_versions(
+    db: Session, google_event_ids: List[str]
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Retorna google_event_id -> (content_hash, calendar_id) de los eventos que
+    ya existen, con una sola consulta IN.
+    """
+    if not google_event_ids:
+        return {}
+    rows = (
+        db.query(
+            CalendarEvent.google_event_id,
+            CalendarEvent.content_hash,
+            CalendarEvent.calendar_id,
+        )
+        .filter(CalendarEvent.google_event_id.in_(set(google_event_ids)))
+        .all()
+    )
+    return {
+        google_event_id: (content_hash, calendar_id)
+        for google_event_id, content_hash, calendar_id in rows
+    }
+
+
+def calendar_rank(calendar_ids: List[str]) -> Callable[[Optional[str]], int]:
+    """
+    Prioridad de un calendario (menor = gana) según el orden de
+    `calendar_ids`. NULL es el calendario por defecto (filas previas a
+    multi-calendario); los calendarios desconocidos van al final.
+
+    Un evento presente en varios calendarios pertenece al de mayor prioridad.
+    """
+    rank = {calendar_id: i for i, calendar_id in enumerate(calendar_ids)}
+    default_calendar = calendar_ids[0] if calendar_ids else None
+
+    def rank_of(calendar_id: Optional[str]) -> int:
+        return rank.get(calendar_id or default_calendar, len(rank))
+
+    return rank_of
+
+
+def get_events_by_google_ids(
+    db: Session, google_event_ids: List[str], chunk_size: Optional[int] = None
+) -> List[CalendarEvent]:
+    """Carga eventos por google_event_id con consultas IN por lotes."""
+    chunk_size = chunk_size or get_sync_config().batch_size
+
+    events = []
+    for chunk in _chunked(google_event_ids, chunk_size):
+        events.extend(
+            db.query(CalendarEvent)
+            .filter(CalendarEvent.google_event_id.in_(chunk))
+            .all()
+        )
+    events.sort(key=lambda event: event.start_datetime)
+    return events
+
+
+def dedupe_by_ical_uid(
+    db: Session,
+    calendar_ids: List[str],
+    ical_uids: Optional[Iterable[str]] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """
+    Elimina las copias de un mismo evento que aparece en varios calendarios.
+
+    Dos filas son el mismo evento si comparten iCalUID y hora de inicio (las
+    instancias de un evento recurrente comparten iCalUID). Se conserva la copia
+    del calendario que aparece primero en `calendar_ids`. No hace commit.
+
+    Args:
+        ical_uids: Revisar solo estos iCalUIDs (los escritos en un sync); sin
+            ellos se revisa toda la tabla
+
+    Returns:
+        Número de filas eliminadas
+    """
+    chunk_size = chunk_size or get_sync_config().batch_size
+
+    duplicated = (
+        db.query(CalendarEvent.ical_uid, CalendarEvent.start_datetime)
+        .group_by(CalendarEvent.ical_uid, CalendarEvent.start_datetime)
+        .having(func.count(CalendarEvent.id) > 1)
+    )
+    if ical_uids is None:
+        duplicated_keys = set(duplicated.filter(CalendarEvent.ical_uid.isnot(None)))
+    else:
+        duplicated_keys = set()
+        for chunk in _chunked(sorted(set(ical_uids)), chunk_size):
+            duplicated_keys.update(
+                duplicated.filter(CalendarEvent.ical_uid.in_(chunk))
+            )
+    if not duplicated_keys:
+        return 0
+
+    rank_of = calendar_rank(calendar_ids)
+
+    def priority(row) -> tuple:
+        return (rank_of(row.calendar_id), row.id)
+
+    loser_ids = []
+    ical_uids = sorted({ical_uid for ical_uid, _ in duplicated_keys})
+    for chunk in _chunked(ical_uids, chunk_size):
+        groups = defaultdict(list)
+        rows = db.query(
+            CalendarEvent.id,
+            CalendarEvent.ical_uid,
+            CalendarEvent.start_datetime,
+            CalendarEvent.calendar_id,
+        ).filter(CalendarEvent.ical_uid.in_(chunk))
+        for row in rows:
+            key = (row.ical_uid, row.start_datetime)
+            if key in duplicated_keys:
+                groups[key].append(row)
+        for group in groups.values():
+            group.sort(key=priority)
+            loser_ids.extend(row.id for row in group[1:])
+
+    for chunk in _chunked(loser_ids, chunk_size):
+        db.query(CalendarEvent).filter(CalendarEvent.id.in_(chunk)).delete(
+            synchronize_session=False
+        )
+
+    logger.info(f"🧹 Removed {len(loser_ids)} duplicated events (same iCalUID)")
+    return len(loser_ids)
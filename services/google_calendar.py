@@ -4,15 +4,84 @@ Basado en Service Account authentication.
 """
 
 import os
+import re
 import json
+import time
+import hashlib
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple, Iterable, Iterator
+import httplib2
+from google.auth.exceptions import GoogleAuthError
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from models.calendar_event import normalize_category
+from services.google_executor import (
+    SYNC_TRANSPORT_ERRORS,
+    GoogleCalendarError,
+    get_google_executor,
+)
+from utils.config import get_google_api_config
 from utils.logger import logger
 import pytz
 
+# orjson es opcional: acelera el parseo de BUJO_META si está instalado
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Metadata de mnemos embebida en la descripción: BUJO_META: {...}
+BUJO_META_MARKER = "BUJO_META:"
+BUJO_META_PATTERN = re.compile(r"BUJO_META:\s*(\{.*\})")
+
+
+@lru_cache(maxsize=1)
+def _calendar_discovery_document() -> Dict:
+    """
+    Documento de discovery de Calendar v3 incluido en googleapiclient
+    (static discovery: sin request a Google), parseado una sola vez.
+    """
+    return json.loads(get_static_doc("calendar", "v3"))
+
+
+def event_content_hash(
+    ical_uid: Optional[str],
+    summary: str,
+    description: str,
+    location: Optional[str],
+    start: str,
+    end: str,
+    status: str,
+) -> str:
+    """
+    Hash del contenido de un evento, para detectar cambios sin comparar campo
+    por campo. priority/category/extra_data salen de la descripción, así que
+    ya están cubiertos por ella.
+
+    `start`/`end` son los strings ISO tal como vienen de Google (`date` o
+    `dateTime`): determinan las fechas y si es de todo el día, y evitan
+    formatear los datetime de nuevo (era la mitad del costo del parseo).
+
+    No incluye `calendar_id`: el mismo evento visto desde dos calendarios
+    tiene el mismo hash (el calendario dueño lo decide `calendar_rank`).
+    """
+    content = (
+        f"{ical_uid}\x1f{summary}\x1f{description}\x1f{location}"
+        f"\x1f{start}\x1f{end}\x1f{status}"
+    )
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+class SyncTokenExpiredError(GoogleCalendarError):
+    """El syncToken guardado ya no es válido (HTTP 410); se requiere full sync."""
+
 
 class GoogleCalendarService:
     """
@@ -34,17 +103,38 @@ class GoogleCalendarService:
     }
     DEFAULT_COLOR = "8"  # Gris (sin categoría)
 
+    # Tamaño máximo de página permitido por events().list
+    MAX_PAGE_SIZE = 2500
+
+    # Partial response de events().list: solo lo que lee `parse_event`
+    # (sin attendees, conferenceData, reminders, etc.)
+    LIST_FIELDS = (
+        "nextPageToken,nextSyncToken,"
+        "items(id,status,summary,description,location,start,end,iCalUID)"
+    )
+
+    # Máximo de llamadas por batch HTTP request de Calendar API
+    MAX_BATCH_SIZE = 50
+
     def __init__(self):
         self.service_account_file = os.getenv(
             "GOOGLE_SERVICE_ACCOUNT_FILE", "credentials/service-account.json"
         )
         self.calendar_id = os.getenv("GOOGLE_CALENDAR_ID", "primary")
+        self.calendar_ids = self._load_calendar_ids()
         self.timezone = os.getenv("TIMEZONE", "America/Lima")
-        self.service = None
+        self.credentials = None
+        self.executor = get_google_executor()
+        # httplib2 no es thread-safe: un cliente (y conexión) por thread
+        self._local = threading.local()
+        self._credentials_lock = threading.Lock()
         self._initialize_service()
 
     def _initialize_service(self):
-        """Inicializa el servicio de Google Calendar con credenciales."""
+        """
+        Carga las credenciales. El cliente de Calendar API se construye recién
+        cuando un thread lo usa por primera vez (ver `service`).
+        """
         try:
             if not os.path.exists(self.service_account_file):
                 logger.error(f"\n❌ Google Calendar: Service account file not found")
@@ -62,27 +152,33 @@ class GoogleCalendarService:
                 )
                 return
 
+            started = time.perf_counter()
             creds = service_account.Credentials.from_service_account_file(
                 self.service_account_file,
                 scopes=["https://www.googleapis.com/auth/calendar"],  # Read & Write
             )
-            self.service = build("calendar", "v3", credentials=creds)
-            logger.info(f"✅ Google Calendar service initialized successfully")
+            self.credentials = creds
+            logger.info(
+                f"✅ Google Calendar service initialized successfully "
+                f"({(time.perf_counter() - started) * 1000:.1f}ms)"
+            )
             logger.info(f"   Calendar ID: {self.calendar_id}")
+            if len(self.calendar_ids) > 1:
+                logger.info(f"   Synced calendars: {', '.join(self.calendar_ids)}")
             logger.info(f"   Timezone: {self.timezone}")
         except FileNotFoundError:
             logger.error(
                 f"\n❌ Google Calendar: Credentials file not found: {self.service_account_file}"
             )
             logger.error(f"📚 Ver docs/GOOGLE_CALENDAR_INTEGRATION.md para setup\n")
-            self.service = None
+            self.credentials = None
         except json.JSONDecodeError:
             logger.error(f"\n❌ Google Calendar: Invalid JSON in credentials file")
             logger.error(f"   File: {self.service_account_file}")
             logger.error(
                 f"💡 Verifica que el archivo JSON esté correctamente formateado\n"
             )
-            self.service = None
+            self.credentials = None
         except Exception as e:
             logger.error(f"\n❌ Failed to initialize Google Calendar service")
             logger.error(f"   Error: {str(e)}")
@@ -93,7 +189,81 @@ class GoogleCalendarService:
             logger.error(
                 f"\n📚 Ver docs/GOOGLE_CALENDAR_INTEGRATION.md para troubleshooting\n"
             )
-            self.service = None
+            self.credentials = None
+
+    @property
+    def configured(self) -> bool:
+        return self.credentials is not None
+
+    @property
+    def service(self):
+        """
+        Cliente de Calendar API del thread actual (None si no hay credenciales).
+
+        Cada thread del threadpool construye el suyo la primera vez, con su
+        propio transporte httplib2; todos comparten las mismas credenciales.
+        """
+        if self.credentials is None:
+            return None
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = self._build_service()
+            self._local.service = service
+        self.refresh_credentials()
+        return service
+
+    def _build_service(self):
+        started = time.perf_counter()
+        http = AuthorizedHttp(
+            self.credentials,
+            http=httplib2.Http(timeout=get_google_api_config().timeout_seconds),
+        )
+        service = build_from_document(_calendar_discovery_document(), http=http)
+        logger.info(
+            f"⏱️  Calendar API client built for {threading.current_thread().name} "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return service
+
+    def refresh_credentials(self, force: bool = False) -> str:
+        """
+        Refresca el access token compartido si expiró (o si `force`) y lo
+        retorna. Si varios threads lo necesitan a la vez, solo uno llama a
+        Google y los demás reutilizan el token nuevo.
+
+        Raises:
+            GoogleCalendarError: Si el refresh falla (red o credenciales)
+        """
+        if force or not self.credentials.valid:
+            with self._credentials_lock:
+                if force or not self.credentials.valid:
+                    # Importado aquí: `requests` suma ~60ms al arranque y solo
+                    # se usa al refrescar el token
+                    from google.auth.transport.requests import Request
+
+                    started = time.perf_counter()
+                    try:
+                        self.credentials.refresh(Request())
+                    except (GoogleAuthError, OSError) as e:
+                        raise self.executor.to_error(e) from e
+                    logger.info(
+                        f"🔑 Google credentials refreshed in "
+                        f"{(time.perf_counter() - started) * 1000:.1f}ms"
+                    )
+        return self.credentials.token
+
+    def _load_calendar_ids(self) -> List[str]:
+        """
+        Carga los calendarios a sincronizar desde GOOGLE_CALENDAR_IDS (separados
+        por coma). El calendario por defecto (GOOGLE_CALENDAR_ID) va siempre
+        primero: recibe los eventos creados desde mnemos y gana al deduplicar.
+        """
+        calendar_ids = [self.calendar_id]
+        for calendar_id in os.getenv("GOOGLE_CALENDAR_IDS", "").split(","):
+            calendar_id = calendar_id.strip()
+            if calendar_id and calendar_id not in calendar_ids:
+                calendar_ids.append(calendar_id)
+        return calendar_ids
 
     def _get_timezone_aware_datetime(self, dt: datetime) -> datetime:
         """Convierte datetime a timezone aware si no lo es."""
@@ -102,69 +272,182 @@ class GoogleCalendarService:
             return tz.localize(dt)
         return dt
 
-    def get_events_in_range(
-        self, start_time: datetime, end_time: datetime
-    ) -> List[Dict]:
+    def iter_event_pages(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        calendar_id: Optional[str] = None,
+    ) -> Iterator[List[Dict]]:
         """
-        Obtiene eventos en un rango de tiempo específico.
+        Itera página por página los eventos de un rango siguiendo `nextPageToken`.
+
+        Cada iteración hace una sola llamada a la API (con el tamaño de página
+        máximo permitido) y entrega sus eventos, de modo que el consumidor puede
+        procesarlos sin tener el rango completo en memoria.
 
         Args:
             start_time: Inicio del rango (datetime)
             end_time: Fin del rango (datetime)
+            calendar_id: Calendario a leer (default: GOOGLE_CALENDAR_ID)
 
-        Returns:
-            Lista de eventos en formato dict
+        Yields:
+            Lista de eventos (formato dict) de cada página
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
         """
-        if not self.service:
+        if not self.configured:
             logger.error("❌ Google Calendar service not initialized")
-            return []
+            return
 
-        try:
-            # Asegurar que las fechas sean timezone aware
-            start_time = self._get_timezone_aware_datetime(start_time)
-            end_time = self._get_timezone_aware_datetime(end_time)
+        # Asegurar que las fechas sean timezone aware
+        start_time = self._get_timezone_aware_datetime(start_time)
+        end_time = self._get_timezone_aware_datetime(end_time)
 
-            # Convertir a formato ISO con timezone
-            time_min = start_time.isoformat()
-            time_max = end_time.isoformat()
+        # Convertir a formato ISO con timezone
+        time_min = start_time.isoformat()
+        time_max = end_time.isoformat()
 
-            logger.info(f"📅 Fetching events from {time_min} to {time_max}")
+        logger.info(f"📅 Fetching events from {time_min} to {time_max}")
 
-            events_result = (
-                self.service.events()
-                .list(
-                    calendarId=self.calendar_id,
+        page_token = None
+        page_count = 0
+        while True:
+            events_result = self.executor.execute(
+                self.service.events().list(
+                    calendarId=calendar_id or self.calendar_id,
                     timeMin=time_min,
                     timeMax=time_max,
                     singleEvents=True,
                     orderBy="startTime",
-                    maxResults=100,
-                )
-                .execute()
+                    maxResults=self.MAX_PAGE_SIZE,
+                    pageToken=page_token,
+                    fields=self.LIST_FIELDS,
+                ),
+                "events.list",
             )
+            page_count += 1
 
             events = events_result.get("items", [])
-            logger.info(f"✅ Found {len(events)} events")
-            return events
+            logger.debug(f"📄 Page {page_count}: {len(events)} events")
+            yield events
 
-        except HttpError as e:
-            logger.error(f"❌ Google Calendar API error: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"❌ Unexpected error fetching events: {e}")
-            return []
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
 
-    def get_today_events(self) -> List[Dict]:
-        """Obtiene eventos del día actual."""
+        logger.info(f"✅ Fetched {page_count} page(s) from Google Calendar")
+
+    def iter_event_changes(
+        self,
+        sync_token: Optional[str] = None,
+        time_min: Optional[datetime] = None,
+        calendar_id: Optional[str] = None,
+    ) -> Iterator[Tuple[List[Dict], Optional[str]]]:
+        """
+        Itera los cambios del calendario usando syncTokens de Google.
+
+        Sin `sync_token` hace una sincronización completa (desde `time_min`);
+        con `sync_token` solo trae lo que cambió desde la última vez, incluyendo
+        eventos cancelados (`status == "cancelled"`) para poder borrarlos.
+
+        Args:
+            sync_token: Token de la sincronización anterior (None = full sync)
+            time_min: Inicio del rango para la sincronización completa
+            calendar_id: Calendario a leer (default: GOOGLE_CALENDAR_ID)
+
+        Yields:
+            Tupla (eventos de la página, nextSyncToken). El token solo viene
+            en la última página; en las demás es None.
+
+        Raises:
+            SyncTokenExpiredError: Si Google invalida el token (HTTP 410)
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
+        """
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return
+
+        params = {
+            "calendarId": calendar_id or self.calendar_id,
+            "singleEvents": True,
+            "maxResults": self.MAX_PAGE_SIZE,
+            "fields": self.LIST_FIELDS,
+        }
+        if sync_token:
+            # timeMin/timeMax/orderBy no se permiten junto a syncToken
+            params["syncToken"] = sync_token
+            logger.info("📅 Fetching incremental changes from Google Calendar")
+        else:
+            if time_min:
+                params["timeMin"] = self._get_timezone_aware_datetime(
+                    time_min
+                ).isoformat()
+            logger.info(
+                f"📅 Full sync from Google Calendar (timeMin={params.get('timeMin')})"
+            )
+
+        page_token = None
+        page_count = 0
+        while True:
+            try:
+                events_result = self.executor.execute(
+                    self.service.events().list(**params, pageToken=page_token),
+                    "events.list",
+                )
+            except GoogleCalendarError as e:
+                if e.status == 410:
+                    logger.warning("⚠️  Sync token expired, full resync required")
+                    raise SyncTokenExpiredError(str(e), status=410) from e
+                raise
+            page_count += 1
+
+            page_token = events_result.get("nextPageToken")
+            next_sync_token = events_result.get("nextSyncToken")
+            yield events_result.get("items", []), next_sync_token
+
+            if not page_token:
+                break
+
+        logger.info(f"✅ Fetched {page_count} page(s) of changes")
+
+    def get_events_in_range(
+        self, start_time: datetime, end_time: datetime
+    ) -> List[Dict]:
+        """
+        Obtiene eventos en un rango de tiempo específico.
+
+        Recorre todas las páginas del rango; para procesar rangos grandes sin
+        cargarlos completos en memoria usa `iter_event_pages`.
+
+        Args:
+            start_time: Inicio del rango (datetime)
+            end_time: Fin del rango (datetime)
+
+        Returns:
+            Lista de eventos en formato dict
+
+        Raises:
+            GoogleCalendarError: Si la API falla (nunca se confunde con "cero eventos")
+        """
+        events = [
+            event
+            for page in self.iter_event_pages(start_time, end_time)
+            for event in page
+        ]
+        logger.info(f"✅ Found {len(events)} events")
+        return events
+
+    def get_today_range(self) -> Tuple[datetime, datetime]:
+        """Retorna (inicio, fin) del día actual."""
         tz = pytz.timezone(self.timezone)
         now = datetime.now(tz)
         start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = now.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return start_of_day, end_of_day
 
-        return self.get_events_in_range(start_of_day, end_of_day)
-
-    def get_week_events(self) -> List[Dict]:
-        """Obtiene eventos de la semana actual (lunes a domingo)."""
+    def get_week_range(self) -> Tuple[datetime, datetime]:
+        """Retorna (inicio, fin) de la semana actual (lunes a domingo)."""
         tz = pytz.timezone(self.timezone)
         now = datetime.now(tz)
 
@@ -176,11 +459,10 @@ class GoogleCalendarService:
         end_of_week = start_of_week + timedelta(
             days=6, hours=23, minutes=59, seconds=59
         )
+        return start_of_week, end_of_week
 
-        return self.get_events_in_range(start_of_week, end_of_week)
-
-    def get_month_events(self) -> List[Dict]:
-        """Obtiene eventos del mes actual."""
+    def get_month_range(self) -> Tuple[datetime, datetime]:
+        """Retorna (inicio, fin) del mes actual."""
         tz = pytz.timezone(self.timezone)
         now = datetime.now(tz)
 
@@ -202,8 +484,25 @@ class GoogleCalendarService:
             end_of_month = now.replace(
                 month=now.month + 1, day=1, hour=0, minute=0, second=0, microsecond=0
             ) - timedelta(seconds=1)
+        return start_of_month, end_of_month
+
+    def get_critical_range(self, days_ahead: int = 7) -> Tuple[datetime, datetime]:
+        """Retorna (ahora, ahora + N días) para eventos críticos."""
+        tz = pytz.timezone(self.timezone)
+        now = datetime.now(tz)
+        return now, now + timedelta(days=days_ahead)
 
-        return self.get_events_in_range(start_of_month, end_of_month)
+    def get_today_events(self) -> List[Dict]:
+        """Obtiene eventos del día actual."""
+        return self.get_events_in_range(*self.get_today_range())
+
+    def get_week_events(self) -> List[Dict]:
+        """Obtiene eventos de la semana actual (lunes a domingo)."""
+        return self.get_events_in_range(*self.get_week_range())
+
+    def get_month_events(self) -> List[Dict]:
+        """Obtiene eventos del mes actual."""
+        return self.get_events_in_range(*self.get_month_range())
 
     def get_critical_events(self, days_ahead: int = 7) -> List[Dict]:
         """
@@ -215,19 +514,15 @@ class GoogleCalendarService:
         Returns:
             Lista de eventos próximos
         """
-        tz = pytz.timezone(self.timezone)
-        now = datetime.now(tz)
-        start_time = now
-        end_time = now + timedelta(days=days_ahead)
-
-        return self.get_events_in_range(start_time, end_time)
+        return self.get_events_in_range(*self.get_critical_range(days_ahead))
 
-    def parse_event(self, event: Dict) -> Dict:
+    def parse_event(self, event: Dict, calendar_id: Optional[str] = None) -> Dict:
         """
         Parsea un evento de Google Calendar a formato mnemos.
 
         Args:
             event: Evento crudo de Google Calendar API
+            calendar_id: Calendario de origen (default: GOOGLE_CALENDAR_ID)
 
         Returns:
             Evento parseado con campos estandarizados
@@ -240,30 +535,57 @@ class GoogleCalendarService:
         all_day = "date" in start
 
         if all_day:
-            start_dt = datetime.fromisoformat(start["date"])
-            end_dt = datetime.fromisoformat(end["date"])
+            start_raw = start["date"]
+            end_raw = end["date"]
         else:
-            start_dt = datetime.fromisoformat(start.get("dateTime", ""))
-            end_dt = datetime.fromisoformat(end.get("dateTime", ""))
+            start_raw = start.get("dateTime", "")
+            end_raw = end.get("dateTime", "")
 
-        # Extraer metadata de la descripción (formato BUJO_META)
+        ical_uid = event.get("iCalUID")
+        summary = event.get("summary", "Sin título")
         description = event.get("description", "")
+        location = event.get("location")
+        status = event.get("status", "confirmed")
+
+        # Extraer metadata de la descripción (formato BUJO_META)
         extra_data = self._extract_metadata(description)
 
         return {
             "google_event_id": event["id"],
-            "summary": event.get("summary", "Sin título"),
+            "calendar_id": calendar_id or self.calendar_id,
+            "ical_uid": ical_uid,
+            "summary": summary,
             "description": description,
-            "location": event.get("location"),
-            "start_datetime": start_dt,
-            "end_datetime": end_dt,
+            "location": location,
+            "start_datetime": datetime.fromisoformat(start_raw),
+            "end_datetime": datetime.fromisoformat(end_raw),
             "all_day": all_day,
-            "status": event.get("status", "confirmed"),
+            "status": status,
             "priority": extra_data.get("priority"),
-            "category": extra_data.get("category"),
+            "category": normalize_category(extra_data.get("category")),
             "extra_data": extra_data,
+            "content_hash": event_content_hash(
+                ical_uid, summary, description, location, start_raw, end_raw, status
+            ),
         }
 
+    def parse_events(
+        self, events: Iterable[Dict], calendar_id: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Parsea un lote de eventos de Google Calendar.
+
+        Args:
+            events: Eventos crudos de Google Calendar API (no cancelados)
+            calendar_id: Calendario de origen (default: GOOGLE_CALENDAR_ID)
+
+        Returns:
+            Eventos parseados; cada uno incluye `content_hash`
+        """
+        calendar_id = calendar_id or self.calendar_id
+        parse = self.parse_event
+        return [parse(event, calendar_id) for event in events]
+
     def _extract_metadata(self, description: str) -> Dict:
         """
         Extrae metadata del formato BUJO_META de la descripción.
@@ -274,16 +596,15 @@ class GoogleCalendarService:
         Returns:
             Dict con metadata parseada
         """
-        if not description:
+        # La mayoría de eventos no tiene metadata: evitar la regex
+        if not description or BUJO_META_MARKER not in description:
             return {}
 
-        import re
-
-        match = re.search(r"BUJO_META:\s*(\{.*\})", description)
+        match = BUJO_META_PATTERN.search(description)
         if match:
             try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
+                return _json_loads(match.group(1))
+            except ValueError:
                 logger.warning(f"⚠️  Failed to parse BUJO_META: {match.group(1)}")
                 return {}
         return {}
@@ -352,120 +673,368 @@ class GoogleCalendarService:
 
     # ==================== BIDIRECTIONAL SYNC METHODS ====================
 
-    def create_event(self, event_data: Dict) -> Optional[Dict]:
+    def create_event(
+        self, event_data: Dict, calendar_id: Optional[str] = None
+    ) -> Optional[Dict]:
         """
         Crea un evento en Google Calendar.
 
         Args:
             event_data: Datos del evento en formato interno
+            calendar_id: Calendario destino (default: GOOGLE_CALENDAR_ID)
 
         Returns:
-            Evento creado (formato Google) o None si falla
+            Evento creado (formato Google) o None si el servicio no está inicializado
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
         """
-        if not self.service:
+        if not self.configured:
             logger.error("❌ Google Calendar service not initialized")
             return None
 
-        try:
-            google_event = self._format_event_for_google(event_data)
+        google_event = self._format_event_for_google(event_data)
 
-            logger.info(
-                f"📅 Creating event in Google Calendar: {event_data.get('summary')}"
-            )
+        logger.info(f"📅 Creating event in Google Calendar: {event_data.get('summary')}")
 
-            created_event = (
-                self.service.events()
-                .insert(calendarId=self.calendar_id, body=google_event)
-                .execute()
-            )
-
-            logger.info(
-                f"✅ Event created in Google Calendar: {created_event.get('id')}"
-            )
-            return created_event
+        created_event = self.executor.execute(
+            self.service.events().insert(
+                calendarId=calendar_id or self.calendar_id, body=google_event
+            ),
+            "events.insert",
+        )
 
-        except HttpError as e:
-            logger.error(f"❌ Google Calendar API error creating event: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"❌ Unexpected error creating event: {e}")
-            return None
+        logger.info(f"✅ Event created in Google Calendar: {created_event.get('id')}")
+        return created_event
 
-    def update_event(self, google_event_id: str, event_data: Dict) -> Optional[Dict]:
+    def update_event(
+        self,
+        google_event_id: str,
+        event_data: Dict,
+        calendar_id: Optional[str] = None,
+    ) -> Optional[Dict]:
         """
         Actualiza un evento en Google Calendar.
 
         Args:
             google_event_id: ID del evento en Google Calendar
             event_data: Datos actualizados del evento
+            calendar_id: Calendario del evento (default: GOOGLE_CALENDAR_ID)
 
         Returns:
-            Evento actualizado (formato Google) o None si falla
+            Evento actualizado (formato Google) o None si el servicio no está inicializado
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
         """
-        if not self.service:
+        if not self.configured:
             logger.error("❌ Google Calendar service not initialized")
             return None
 
-        try:
-            google_event = self._format_event_for_google(event_data)
-
-            logger.info(f"📅 Updating event in Google Calendar: {google_event_id}")
+        google_event = self._format_event_for_google(event_data)
 
-            updated_event = (
-                self.service.events()
-                .update(
-                    calendarId=self.calendar_id,
-                    eventId=google_event_id,
-                    body=google_event,
-                )
-                .execute()
-            )
+        logger.info(f"📅 Updating event in Google Calendar: {google_event_id}")
 
-            logger.info(f"✅ Event updated in Google Calendar: {google_event_id}")
-            return updated_event
+        updated_event = self.executor.execute(
+            self.service.events().update(
+                calendarId=calendar_id or self.calendar_id,
+                eventId=google_event_id,
+                body=google_event,
+            ),
+            "events.update",
+        )
 
-        except HttpError as e:
-            logger.error(f"❌ Google Calendar API error updating event: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"❌ Unexpected error updating event: {e}")
-            return None
+        logger.info(f"✅ Event updated in Google Calendar: {google_event_id}")
+        return updated_event
 
-    def delete_event(self, google_event_id: str) -> bool:
+    def delete_event(
+        self, google_event_id: str, calendar_id: Optional[str] = None
+    ) -> bool:
         """
         Elimina un evento de Google Calendar.
 
         Args:
             google_event_id: ID del evento en Google Calendar
+            calendar_id: Calendario del evento (default: GOOGLE_CALENDAR_ID)
 
         Returns:
-            True si se eliminó correctamente, False si falla
+            True si se eliminó, False si Google ya no lo tenía (404/410)
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
         """
-        if not self.service:
+        if not self.configured:
             logger.error("❌ Google Calendar service not initialized")
             return False
 
+        logger.info(f"📅 Deleting event from Google Calendar: {google_event_id}")
+
         try:
-            logger.info(f"📅 Deleting event from Google Calendar: {google_event_id}")
+            self.executor.execute(
+                self.service.events().delete(
+                    calendarId=calendar_id or self.calendar_id,
+                    eventId=google_event_id,
+                ),
+                "events.delete",
+            )
+        except GoogleCalendarError as e:
+            if e.status in (404, 410):
+                logger.warning(
+                    f"⚠️  Event not found in Google Calendar: {google_event_id}"
+                )
+                return False
+            raise
 
-            self.service.events().delete(
-                calendarId=self.calendar_id, eventId=google_event_id
-            ).execute()
+        logger.info(f"✅ Event deleted from Google Calendar: {google_event_id}")
+        return True
 
-            logger.info(f"✅ Event deleted from Google Calendar: {google_event_id}")
-            return True
+    # ==================== PUSH NOTIFICATIONS ====================
 
-        except HttpError as e:
-            if e.resp.status == 404:
-                logger.warning(
-                    f"⚠️  Event not found in Google Calendar: {google_event_id}"
+    def watch_events(
+        self,
+        calendar_id: str,
+        channel_id: str,
+        token: str,
+        address: str,
+        ttl_seconds: int,
+    ) -> Dict:
+        """
+        Abre un canal de notificaciones push (`events.watch`) para un calendario.
+
+        Args:
+            calendar_id: Calendario a observar
+            channel_id: ID único del canal (lo elegimos nosotros)
+            token: Secreto que Google reenvía en cada notificación
+            address: URL HTTPS pública de `/calendar/webhook`
+            ttl_seconds: Duración solicitada del canal
+
+        Returns:
+            Canal creado (incluye `resourceId` y `expiration` en ms epoch)
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
+        """
+        logger.info(f"📡 Opening watch channel for calendar {calendar_id}")
+        return self.executor.execute(
+            self.service.events().watch(
+                calendarId=calendar_id,
+                body={
+                    "id": channel_id,
+                    "type": "web_hook",
+                    "address": address,
+                    "token": token,
+                    "params": {"ttl": str(ttl_seconds)},
+                },
+            ),
+            "events.watch",
+        )
+
+    def stop_channel(self, channel_id: str, resource_id: str) -> None:
+        """
+        Cierra un canal de notificaciones push.
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
+        """
+        logger.info(f"📡 Stopping watch channel {channel_id}")
+        self.executor.execute(
+            self.service.channels().stop(
+                body={"id": channel_id, "resourceId": resource_id}
+            ),
+            "channels.stop",
+        )
+
+    # ==================== BATCH METHODS ====================
+
+    def _execute_batch(self, requests: List[Tuple[str, object]]) -> Dict[str, Dict]:
+        """
+        Ejecuta requests de la API en batch HTTP requests de hasta 50 llamadas.
+
+        Cada llamada consume un token del rate limiter; las que fallan por
+        límite de tasa o 5xx se reintentan en un nuevo batch con backoff
+        (cada una según su propio error y el presupuesto de reintentos).
+
+        Args:
+            requests: Lista de (clave única, request de googleapiclient)
+
+        Returns:
+            Dict clave -> {"response": dict | None, "error": GoogleCalendarError | None}
+            con una entrada por cada request (sin respuesta = error)
+
+        Raises:
+            GoogleCalendarError: Si el batch completo falla tras agotar los reintentos
+        """
+        results: Dict[str, Dict] = {}
+
+        def callback(request_id, response, exception):
+            error = self.executor.to_error(exception) if exception else None
+            results[request_id] = {"response": response, "error": error}
+
+        for i in range(0, len(requests), self.MAX_BATCH_SIZE):
+            pending = requests[i : i + self.MAX_BATCH_SIZE]
+            attempt = 0
+            while pending:
+                self.executor.guard()
+                error = None
+                recorded = False
+                try:
+                    wait = self.executor.throttle_delay(len(pending))
+                    if wait:
+                        time.sleep(wait)
+
+                    started = time.perf_counter()
+                    try:
+                        batch = self.service.new_batch_http_request(callback=callback)
+                        for key, request in pending:
+                            batch.add(request, request_id=key)
+                        batch.execute()
+                    except (*SYNC_TRANSPORT_ERRORS, GoogleCalendarError) as e:
+                        # GoogleCalendarError: fallo al refrescar el token
+                        error = self.executor.to_error(e)
+                    self.executor.record_latency("batch", started, error)
+                    if error is not None:
+                        self.executor.record_outcome(error)
+                    else:
+                        # Una llamada sin callback cuenta como fallo de esa
+                        # llamada (no del lote completo)
+                        for key, _ in pending:
+                            if results.get(key) is None:
+                                results[key] = {
+                                    "response": None,
+                                    "error": GoogleCalendarError(
+                                        "No response from Google for this batch item"
+                                    ),
+                                }
+                        # Cada llamada del lote cuenta para el breaker: un lote
+                        # con todas sus llamadas en 5xx es un fallo de Google
+                        # aunque el request HTTP del lote haya respondido 200
+                        for key, _ in pending:
+                            self.executor.record_outcome(results[key]["error"])
+                    recorded = True
+                finally:
+                    if not recorded:
+                        self.executor.release()
+
+                if error is not None:
+                    if not self.executor.should_retry(error, attempt):
+                        raise error
+                    time.sleep(self.executor.backoff_delay(error, attempt))
+                    attempt += 1
+                    continue
+                logger.info(f"📦 Executed batch of {len(pending)} Google Calendar calls")
+
+                # Reintentar solo las llamadas con errores transitorios; cada
+                # una se decide con su propio error (y gasta su presupuesto)
+                retryable = [
+                    (key, request)
+                    for key, request in pending
+                    if results[key]["error"] is not None
+                    and self.executor.should_retry(results[key]["error"], attempt)
+                ]
+                if not retryable:
+                    break
+                time.sleep(
+                    max(
+                        self.executor.backoff_delay(results[key]["error"], attempt)
+                        for key, _ in retryable
+                    )
+                )
+                # Sin el error de la ronda anterior: una llamada que no recibe
+                # callback en el reintento no debe reportar el error viejo
+                for key, _ in retryable:
+                    del results[key]
+                pending = retryable
+                attempt += 1
+
+        return results
+
+    def batch_push_events(self, operations: List[Dict]) -> Dict[str, Dict]:
+        """
+        Crea o actualiza muchos eventos usando batch requests.
+
+        Args:
+            operations: Lista de dicts con:
+                - key: Identificador único de la operación
+                - google_event_id: ID en Google (None = crear)
+                - event_data: Datos del evento en formato interno
+                - calendar_id: Calendario destino (opcional, default: GOOGLE_CALENDAR_ID)
+
+        Returns:
+            Dict key -> {"response": evento de Google | None, "error": GoogleCalendarError | None}
+        """
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return {}
+
+        requests = []
+        for operation in operations:
+            google_event = self._format_event_for_google(operation["event_data"])
+            google_event_id = operation.get("google_event_id")
+            calendar_id = operation.get("calendar_id") or self.calendar_id
+            if google_event_id:
+                request = self.service.events().update(
+                    calendarId=calendar_id,
+                    eventId=google_event_id,
+                    body=google_event,
                 )
             else:
-                logger.error(f"❌ Google Calendar API error deleting event: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"❌ Unexpected error deleting event: {e}")
-            return False
+                request = self.service.events().insert(
+                    calendarId=calendar_id, body=google_event
+                )
+            requests.append((operation["key"], request))
+
+        return self._execute_batch(requests)
+
+    def batch_delete_events(
+        self,
+        google_event_ids: List[str],
+        calendar_ids: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Optional[GoogleCalendarError]]:
+        """
+        Elimina muchos eventos de Google Calendar usando batch requests.
+
+        Los eventos que Google ya no tiene (404/410) se consideran eliminados.
+
+        Args:
+            google_event_ids: IDs de eventos en Google Calendar
+            calendar_ids: Calendario de cada evento (default: GOOGLE_CALENDAR_ID)
+
+        Returns:
+            Dict google_event_id -> None si se eliminó, o el error de esa llamada
+        """
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return {
+                google_event_id: GoogleCalendarError(
+                    "Google Calendar service not initialized"
+                )
+                for google_event_id in google_event_ids
+            }
+
+        requests = [
+            (
+                google_event_id,
+                self.service.events().delete(
+                    calendarId=(calendar_ids or {}).get(google_event_id)
+                    or self.calendar_id,
+                    eventId=google_event_id,
+                ),
+            )
+            for google_event_id in google_event_ids
+        ]
+        batch_results = self._execute_batch(requests)
+
+        results: Dict[str, Optional[GoogleCalendarError]] = {}
+        for google_event_id in google_event_ids:
+            error = batch_results[google_event_id]["error"]
+            if error is not None and error.status in (404, 410):
+                logger.warning(
+                    f"⚠️  Event already deleted in Google Calendar: {google_event_id}"
+                )
+                error = None
+            results[google_event_id] = error
+
+        return results
 
 
 # Singleton para reutilizar la instancia
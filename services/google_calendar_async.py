@@ -0,0 +1,327 @@
+"""
+Cliente asíncrono de Google Calendar API sobre httpx.
+Misma interfaz que GoogleCalendarService, sin ocupar threads del threadpool.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import quote
+import httpx
+from services.google_calendar import (
+    GoogleCalendarService,
+    SyncTokenExpiredError,
+    get_calendar_service,
+)
+from services.google_executor import GoogleCalendarError, get_google_executor
+from utils.config import get_google_api_config
+from utils.logger import logger
+
+
+class AsyncGoogleCalendarService:
+    """
+    Operaciones list/insert/update/delete de Google Calendar con un cliente
+    HTTP asíncrono compartido (pool de conexiones con keep-alive).
+
+    Reutiliza las credenciales, el parseo y el formateo de eventos del
+    `GoogleCalendarService` síncrono.
+    """
+
+    DEFAULT_BASE_URL = "https://www.googleapis.com/calendar/v3"
+
+    # Google solo comprime la respuesta si el User-Agent incluye "gzip";
+    # httpx descomprime automáticamente
+    DEFAULT_HEADERS = {
+        "Accept-Encoding": "gzip",
+        "User-Agent": "mnemos (gzip)",
+    }
+
+    def __init__(self, sync_service: Optional[GoogleCalendarService] = None):
+        self.sync_service = sync_service or get_calendar_service()
+        self.calendar_id = self.sync_service.calendar_id
+        self.calendar_ids = self.sync_service.calendar_ids
+        self.timezone = self.sync_service.timezone
+        self.base_url = os.getenv("GOOGLE_CALENDAR_API_URL", self.DEFAULT_BASE_URL)
+        self.executor = get_google_executor()
+
+        config = get_google_api_config()
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.DEFAULT_HEADERS,
+            timeout=httpx.Timeout(config.timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_connections,
+            ),
+        )
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def configured(self) -> bool:
+        return self.sync_service.configured
+
+    async def aclose(self) -> None:
+        """Cierra el pool de conexiones."""
+        await self._client.aclose()
+
+    # ==================== HTTP ====================
+
+    async def _get_token(self, force_refresh: bool = False) -> str:
+        """
+        Obtiene un access token válido (refresca fuera del event loop). Usa
+        las mismas credenciales que los threads del cliente síncrono.
+
+        Raises:
+            GoogleCalendarError: Si el refresh falla (ver `refresh_credentials`);
+                `aexecute` lo cuenta como resultado de la llamada
+        """
+        credentials = self.sync_service.credentials
+        if force_refresh or not credentials.valid:
+            async with self._refresh_lock:
+                if force_refresh or not credentials.valid:
+                    await asyncio.to_thread(
+                        self.sync_service.refresh_credentials, force_refresh
+                    )
+        return credentials.token
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Ejecuta una llamada autenticada; reintenta una vez si el token expiró."""
+        token = await self._get_token()
+        response = await self._client.request(
+            method, path, headers={"Authorization": f"Bearer {token}"}, **kwargs
+        )
+        if response.status_code == 401:
+            token = await self._get_token(force_refresh=True)
+            response = await self._client.request(
+                method, path, headers={"Authorization": f"Bearer {token}"}, **kwargs
+            )
+        return response
+
+    def _events_path(
+        self, event_id: Optional[str] = None, calendar_id: Optional[str] = None
+    ) -> str:
+        calendar_id = calendar_id or self.calendar_id
+        path = f"/calendars/{quote(calendar_id, safe='')}/events"
+        if event_id:
+            path += f"/{quote(event_id, safe='')}"
+        return path
+
+    async def _iter_list(
+        self,
+        params: Dict,
+        calendar_id: Optional[str] = None,
+        page_token: Optional[str] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Recorre events.list siguiendo `nextPageToken`; entrega cada respuesta.
+        Con `page_token` continúa un recorrido previo desde esa página.
+        """
+        path = self._events_path(calendar_id=calendar_id)
+        while True:
+            page_params = dict(params)
+            if page_token:
+                page_params["pageToken"] = page_token
+
+            try:
+                response = await self.executor.aexecute(
+                    lambda: self._request("GET", path, params=page_params),
+                    "events.list",
+                )
+            except GoogleCalendarError as e:
+                if e.status == 410:
+                    logger.warning("⚠️  Sync token expired, full resync required")
+                    raise SyncTokenExpiredError(str(e), status=410) from e
+                raise
+
+            events_result = response.json()
+            yield events_result
+
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
+
+    # ==================== LIST ====================
+
+    async def iter_event_pages(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        calendar_id: Optional[str] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        """Versión asíncrona de `GoogleCalendarService.iter_event_pages`."""
+        async for page, _ in self.iter_event_pages_with_tokens(
+            start_time, end_time, calendar_id
+        ):
+            yield page
+
+    async def iter_event_pages_with_tokens(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        calendar_id: Optional[str] = None,
+        page_token: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[List[Dict], Optional[str]]]:
+        """
+        Igual que `iter_event_pages` pero entrega `(eventos, nextPageToken)`,
+        para guardar un checkpoint por página y continuar desde `page_token`.
+        """
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return
+
+        start_time = self.sync_service._get_timezone_aware_datetime(start_time)
+        end_time = self.sync_service._get_timezone_aware_datetime(end_time)
+        params = {
+            "timeMin": start_time.isoformat(),
+            "timeMax": end_time.isoformat(),
+            "singleEvents": "true",
+            "orderBy": "startTime",
+            "maxResults": GoogleCalendarService.MAX_PAGE_SIZE,
+            "fields": GoogleCalendarService.LIST_FIELDS,
+        }
+
+        logger.info(
+            f"📅 Fetching events from {params['timeMin']} to {params['timeMax']}"
+        )
+        async for events_result in self._iter_list(params, calendar_id, page_token):
+            yield events_result.get("items", []), events_result.get("nextPageToken")
+
+    async def iter_event_changes(
+        self,
+        sync_token: Optional[str] = None,
+        time_min: Optional[datetime] = None,
+        calendar_id: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[List[Dict], Optional[str]]]:
+        """Versión asíncrona de `GoogleCalendarService.iter_event_changes`."""
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return
+
+        params = {
+            "singleEvents": "true",
+            "maxResults": GoogleCalendarService.MAX_PAGE_SIZE,
+            "fields": GoogleCalendarService.LIST_FIELDS,
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        elif time_min:
+            params["timeMin"] = self.sync_service._get_timezone_aware_datetime(
+                time_min
+            ).isoformat()
+
+        async for events_result in self._iter_list(params, calendar_id):
+            yield events_result.get("items", []), events_result.get("nextSyncToken")
+
+    # ==================== WRITE ====================
+
+    async def create_event(
+        self, event_data: Dict, calendar_id: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Crea un evento en Google Calendar.
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
+        """
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return None
+
+        google_event = self.sync_service._format_event_for_google(event_data)
+        logger.info(f"📅 Creating event in Google Calendar: {event_data.get('summary')}")
+        response = await self.executor.aexecute(
+            lambda: self._request(
+                "POST", self._events_path(calendar_id=calendar_id), json=google_event
+            ),
+            "events.insert",
+        )
+
+        created_event = response.json()
+        logger.info(f"✅ Event created in Google Calendar: {created_event.get('id')}")
+        return created_event
+
+    async def update_event(
+        self,
+        google_event_id: str,
+        event_data: Dict,
+        calendar_id: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        Actualiza un evento en Google Calendar.
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
+        """
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return None
+
+        google_event = self.sync_service._format_event_for_google(event_data)
+        logger.info(f"📅 Updating event in Google Calendar: {google_event_id}")
+        response = await self.executor.aexecute(
+            lambda: self._request(
+                "PUT",
+                self._events_path(google_event_id, calendar_id),
+                json=google_event,
+            ),
+            "events.update",
+        )
+
+        logger.info(f"✅ Event updated in Google Calendar: {google_event_id}")
+        return response.json()
+
+    async def delete_event(
+        self, google_event_id: str, calendar_id: Optional[str] = None
+    ) -> bool:
+        """
+        Elimina un evento de Google Calendar.
+
+        Returns:
+            True si se eliminó, False si Google ya no lo tenía (404/410)
+
+        Raises:
+            GoogleCalendarError: Si la API falla tras agotar los reintentos
+        """
+        if not self.configured:
+            logger.error("❌ Google Calendar service not initialized")
+            return False
+
+        logger.info(f"📅 Deleting event from Google Calendar: {google_event_id}")
+        try:
+            await self.executor.aexecute(
+                lambda: self._request(
+                    "DELETE", self._events_path(google_event_id, calendar_id)
+                ),
+                "events.delete",
+            )
+        except GoogleCalendarError as e:
+            if e.status in (404, 410):
+                logger.warning(
+                    f"⚠️  Event not found in Google Calendar: {google_event_id}"
+                )
+                return False
+            raise
+
+        logger.info(f"✅ Event deleted from Google Calendar: {google_event_id}")
+        return True
+
+
+# Singleton para reutilizar el pool de conexiones
+_async_calendar_service = None
+
+
+def get_async_calendar_service() -> AsyncGoogleCalendarService:
+    """Obtiene instancia singleton del cliente asíncrono de Google Calendar."""
+    global _async_calendar_service
+    if _async_calendar_service is None:
+        _async_calendar_service = AsyncGoogleCalendarService()
+    return _async_calendar_service
+
+
+async def close_async_calendar_service() -> None:
+    """Cierra el pool de conexiones del cliente asíncrono (shutdown)."""
+    global _async_calendar_service
+    if _async_calendar_service is not None:
+        await _async_calendar_service.aclose()
+        _async_calendar_service = None
@@ -0,0 +1,398 @@
+"""
+Ejecutor compartido para llamadas a Google Calendar API.
+Aplica circuit breaker, throttling (token bucket), reintentos con backoff
+exponencial + jitter y un presupuesto de reintentos; los fallos se reportan
+con un error tipado.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+import httplib2
+import httpx
+from google.auth.exceptions import GoogleAuthError, RefreshError
+from googleapiclient.errors import HttpError
+from services.circuit_breaker import CircuitBreaker
+from utils.config import GoogleApiConfig, get_google_api_config
+from utils.logger import logger
+from utils.telemetry import record_counter, record_histogram
+
+
+# Errores de transporte/autenticación del cliente síncrono (googleapiclient)
+SYNC_TRANSPORT_ERRORS = (HttpError, OSError, httplib2.HttpLib2Error, GoogleAuthError)
+
+# Motivos de 403 que indican límite de tasa (reintentables)
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class GoogleCalendarError(Exception):
+    """
+    Error de Google Calendar API tras agotar reintentos (o no reintentable).
+
+    Attributes:
+        status: Código HTTP (None si fue un error de red)
+        reason: Motivo reportado por Google (ej: rateLimitExceeded)
+        retry_after: Segundos sugeridos por Google antes de reintentar
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        reason: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def rate_limited(self) -> bool:
+        return self.status == 429 or (
+            self.status == 403 and self.reason in RATE_LIMIT_REASONS
+        )
+
+    @property
+    def retryable(self) -> bool:
+        return self.status is None or self.rate_limited or (
+            self.status in RETRYABLE_STATUSES
+        )
+
+    @property
+    def service_failure(self) -> bool:
+        """Fallo atribuible a Google (red/5xx); cuenta para el circuit breaker."""
+        return self.status is None or self.status >= 500
+
+
+class CircuitOpenError(GoogleCalendarError):
+    """El circuit breaker está abierto: la llamada falla sin contactar a Google."""
+
+    @property
+    def retryable(self) -> bool:
+        return False
+
+    @property
+    def service_failure(self) -> bool:
+        return False
+
+
+class TokenBucket:
+    """Token bucket thread-safe; `reserve` retorna cuánto esperar por el token."""
+
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserva `tokens` (pudiendo quedar en deuda) y retorna los segundos
+        que el llamador debe esperar antes de usarlos.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RetryBudget:
+    """
+    Limita los reintentos a una fracción de las llamadas exitosas, para que
+    un Google degradado no multiplique nuestro tráfico.
+    """
+
+    def __init__(self, ratio: float, min_tokens: float = 10, max_tokens: float = 100):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._balance = min_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.max_tokens, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance >= 1:
+                self._balance -= 1
+                return True
+            return False
+
+
+class GoogleRequestExecutor:
+    """Ejecuta requests de Google (googleapiclient o httpx) con throttling y reintentos."""
+
+    def __init__(self, config: Optional[GoogleApiConfig] = None):
+        self.config = config or get_google_api_config()
+        self.bucket = TokenBucket(self.config.rate_per_second, self.config.burst)
+        self.budget = RetryBudget(self.config.retry_budget_ratio)
+        self.breaker = CircuitBreaker(
+            "google_calendar",
+            failure_threshold=self.config.cb_failure_threshold,
+            recovery_timeout=self.config.cb_recovery_seconds,
+            half_open_max_calls=self.config.cb_half_open_max_calls,
+        )
+
+        # Estadísticas para /calendar/health; se actualizan desde varios threads
+        # (threadpool, drainer, workers) bajo el lock del bucket
+        self.requests = 0
+        self.retries = 0
+        self.throttle_wait_seconds = 0.0
+        self.budget_exhausted = 0
+
+    # ==================== CLASSIFICATION ====================
+
+    def to_error(self, exc: Exception) -> GoogleCalendarError:
+        """Convierte cualquier excepción de transporte/API a GoogleCalendarError."""
+        if isinstance(exc, GoogleCalendarError):
+            return exc
+        if isinstance(exc, HttpError):
+            return GoogleCalendarError(
+                str(exc),
+                status=exc.resp.status,
+                reason=self._parse_reason(exc.content),
+                retry_after=self._parse_retry_after(exc.resp.get("retry-after")),
+            )
+        if isinstance(exc, httpx.HTTPStatusError):
+            return self.response_error(exc.response)
+        if isinstance(exc, RefreshError):
+            # Credenciales rechazadas: Google respondió, no es un fallo del servicio
+            return GoogleCalendarError(
+                f"Google credentials refresh failed: {exc}",
+                status=401,
+                reason="authError",
+            )
+        return GoogleCalendarError(f"Network error calling Google Calendar: {exc}")
+
+    def response_error(self, response: httpx.Response) -> GoogleCalendarError:
+        """Construye el error tipado a partir de una respuesta httpx con error."""
+        return GoogleCalendarError(
+            f"Google Calendar API error {response.status_code}: {response.text[:200]}",
+            status=response.status_code,
+            reason=self._parse_reason(response.content),
+            retry_after=self._parse_retry_after(response.headers.get("retry-after")),
+        )
+
+    def _parse_reason(self, content: Optional[bytes]) -> Optional[str]:
+        try:
+            errors = json.loads(content or b"{}").get("error", {}).get("errors", [])
+            return errors[0].get("reason") if errors else None
+        except (ValueError, AttributeError):
+            return None
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+
+    # ==================== CIRCUIT BREAKER ====================
+
+    def release(self) -> None:
+        """Libera el cupo del breaker de una llamada que no llegó a un resultado."""
+        self.breaker.release()
+
+    def guard(self) -> None:
+        """
+        Verifica el circuit breaker antes de una llamada.
+
+        Raises:
+            CircuitOpenError: Si el breaker está abierto
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(
+                "Google Calendar circuit breaker is open",
+                retry_after=self.breaker.retry_after(),
+            )
+
+    def record_outcome(self, error: Optional[GoogleCalendarError]) -> None:
+        """Informa al breaker el resultado de una llamada."""
+        if error is None or not error.service_failure:
+            # Errores 4xx (404, 410, ...) significan que Google sí respondió
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def record_latency(
+        self,
+        operation: str,
+        started: float,
+        error: Optional[GoogleCalendarError] = None,
+    ) -> None:
+        """Registra la latencia de una llamada a Google (sin throttling ni backoff)."""
+        record_histogram(
+            "google_latency",
+            time.perf_counter() - started,
+            attributes={
+                "operation": operation,
+                "status": "ok" if error is None else str(error.status),
+            },
+        )
+
+    # ==================== THROTTLING & RETRIES ====================
+
+    def throttle_delay(self, tokens: int = 1) -> float:
+        """Reserva tokens del bucket y registra la espera resultante."""
+        wait = self.bucket.reserve(tokens)
+        with self.bucket._lock:
+            self.requests += tokens
+            self.throttle_wait_seconds += wait
+        if wait > 0:
+            record_histogram("google_throttle_wait", wait)
+        return wait
+
+    def should_retry(self, error: GoogleCalendarError, attempt: int) -> bool:
+        """Decide si reintentar según el tipo de error, intentos y presupuesto."""
+        if not error.retryable or attempt >= self.config.max_retries:
+            return False
+        if not self.budget.withdraw():
+            with self.bucket._lock:
+                self.budget_exhausted += 1
+            logger.warning("⚠️  Google API retry budget exhausted, not retrying")
+            return False
+        return True
+
+    def backoff_delay(self, error: GoogleCalendarError, attempt: int) -> float:
+        """Backoff exponencial con full jitter (respeta Retry-After si viene)."""
+        cap = min(
+            self.config.backoff_max_seconds,
+            self.config.backoff_base_seconds * (2**attempt),
+        )
+        delay = random.uniform(0, cap)
+        if error.retry_after:
+            delay = max(delay, error.retry_after)
+
+        with self.bucket._lock:
+            self.retries += 1
+        record_counter(
+            "google_retries",
+            attributes={"status": str(error.status), "reason": error.reason or ""},
+        )
+        logger.warning(
+            f"🔁 Google API error ({error.status} {error.reason or ''}), "
+            f"retry {attempt + 1}/{self.config.max_retries} in {delay:.2f}s"
+        )
+        return delay
+
+    # ==================== EXECUTION ====================
+
+    def execute(self, request, operation: str = "request") -> Any:
+        """
+        Ejecuta un request de googleapiclient con throttling y reintentos.
+
+        Raises:
+            CircuitOpenError: Si el circuit breaker está abierto
+            GoogleCalendarError: Si falla de forma no reintentable o se agotan los reintentos
+        """
+        attempt = 0
+        while True:
+            self.guard()
+            recorded = False
+            try:
+                wait = self.throttle_delay()
+                if wait:
+                    time.sleep(wait)
+                started = time.perf_counter()
+                try:
+                    result = request.execute()
+                    self.record_latency(operation, started)
+                    self.budget.deposit()
+                    self.record_outcome(None)
+                    recorded = True
+                    return result
+                except SYNC_TRANSPORT_ERRORS as e:
+                    error = self.to_error(e)
+
+                self.record_latency(operation, started, error)
+                self.record_outcome(error)
+                recorded = True
+            finally:
+                if not recorded:
+                    self.release()
+            if not self.should_retry(error, attempt):
+                logger.error(f"❌ Google Calendar {operation} failed: {error}")
+                raise error
+            time.sleep(self.backoff_delay(error, attempt))
+            attempt += 1
+
+    async def aexecute(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        operation: str = "request",
+    ) -> httpx.Response:
+        """
+        Versión asíncrona de `execute` para el cliente httpx.
+
+        Raises:
+            CircuitOpenError: Si el circuit breaker está abierto
+            GoogleCalendarError: Si la respuesta es un error no reintentable o se agotan los reintentos
+        """
+        attempt = 0
+        while True:
+            self.guard()
+            recorded = False
+            try:
+                wait = self.throttle_delay()
+                if wait:
+                    await asyncio.sleep(wait)
+                started = time.perf_counter()
+                try:
+                    response = await send()
+                    if not response.is_error:
+                        self.record_latency(operation, started)
+                        self.budget.deposit()
+                        self.record_outcome(None)
+                        recorded = True
+                        return response
+                    error = self.response_error(response)
+                except (httpx.TransportError, GoogleCalendarError) as e:
+                    # GoogleCalendarError: fallo al refrescar el token en `send`
+                    error = self.to_error(e)
+
+                self.record_latency(operation, started, error)
+                self.record_outcome(error)
+                recorded = True
+            finally:
+                # Cancelación (CancelledError) u otro error inesperado
+                if not recorded:
+                    self.release()
+            if not self.should_retry(error, attempt):
+                logger.error(f"❌ Google Calendar {operation} failed: {error}")
+                raise error
+            await asyncio.sleep(self.backoff_delay(error, attempt))
+            attempt += 1
+
+    def get_stats(self) -> Dict:
+        """Estadísticas acumuladas del ejecutor."""
+        with self.bucket._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttle_wait_seconds": round(self.throttle_wait_seconds, 3),
+                "retry_budget_exhausted": self.budget_exhausted,
+            }
+
+
+# Singleton compartido por los clientes síncrono y asíncrono
+_executor = None
+
+
+def get_google_executor() -> GoogleRequestExecutor:
+    """Obtiene la instancia singleton del ejecutor de requests de Google."""
+    global _executor
+    if _executor is None:
+        _executor = GoogleRequestExecutor()
+    return _executor
@@ -0,0 +1,148 @@
+"""
+Sincronización concurrente de varios calendarios de Google.
+Cada calendario corre su propio SyncEngine (con su propia sesión de BD) y
+al final se deduplican los eventos compartidos por iCalUID.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional, Set
+from sqlalchemy.orm import Session
+from database import SessionLocal
+from services.event_store import dedupe_by_ical_uid
+from services.google_calendar_async import (
+    AsyncGoogleCalendarService,
+    get_async_calendar_service,
+)
+from services.single_flight import get_single_flight
+from services.sync_engine import SyncEngine, SyncResult
+from utils.config import get_sync_config
+from utils.logger import logger
+
+
+class MultiCalendarSync:
+    """
+    Ejecuta la sincronización de todos los calendarios configurados en
+    paralelo, con un máximo de `SYNC_MAX_CONCURRENT_CALENDARS` a la vez.
+
+    El tiempo total es aproximadamente el del calendario más lento.
+    """
+
+    def __init__(
+        self,
+        async_service: Optional[AsyncGoogleCalendarService] = None,
+        calendar_ids: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.async_service = async_service or get_async_calendar_service()
+        self.calendar_ids = calendar_ids or self.async_service.calendar_ids
+        self.max_concurrency = (
+            max_concurrency or get_sync_config().max_concurrent_calendars
+        )
+        self.session_factory = session_factory
+
+    async def sync_incremental(self) -> SyncResult:
+        """Sincronización incremental (syncToken por calendario) de todos los calendarios."""
+        return await self._run_all(
+            lambda engine, calendar_id: engine.async_sync_incremental(
+                self.async_service, calendar_id
+            )
+        )
+
+    async def sync_window(
+        self, start_time: datetime, end_time: datetime, window: Optional[str] = None
+    ) -> SyncResult:
+        """
+        Sincroniza un rango de tiempo en todos los calendarios.
+        `window` nombra el rango en las métricas (today, week, range, ...).
+        """
+        # Aware para poder comparar rangos con las sincronizaciones en curso
+        start_time = self.async_service.sync_service._get_timezone_aware_datetime(
+            start_time
+        )
+        end_time = self.async_service.sync_service._get_timezone_aware_datetime(
+            end_time
+        )
+        return await self._run_all(
+            lambda engine, calendar_id: engine.async_sync_window(
+                start_time, end_time, self.async_service, calendar_id, window=window
+            ),
+            start_time,
+            end_time,
+        )
+
+    async def _run_all(
+        self,
+        run: Callable[[SyncEngine, str], Awaitable[SyncResult]],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> SyncResult:
+        """
+        Ejecuta `run` para cada calendario (acotado por un semáforo) y combina
+        los resultados. Si algún calendario falla, los demás terminan igual y
+        luego se propaga el primer error.
+
+        Cada calendario pasa por el single-flight: si ya hay una sincronización
+        en curso de la misma ventana [start_time, end_time] (o ambas son
+        incrementales),
+        se comparte su resultado en vez de repetirla.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        single_flight = get_single_flight()
+
+        async def run_calendar(calendar_id: str) -> SyncResult:
+            db = self.session_factory()
+            try:
+                return await run(SyncEngine(db), calendar_id)
+            except Exception:
+                await asyncio.to_thread(db.rollback)
+                raise
+            finally:
+                await asyncio.to_thread(db.close)
+
+        async def sync_one(calendar_id: str) -> SyncResult:
+            async with semaphore:
+                return await single_flight.run(
+                    calendar_id,
+                    start_time,
+                    end_time,
+                    lambda: run_calendar(calendar_id),
+                )
+
+        outcomes = await asyncio.gather(
+            *(sync_one(calendar_id) for calendar_id in self.calendar_ids),
+            return_exceptions=True,
+        )
+
+        results = []
+        errors = []
+        for calendar_id, outcome in zip(self.calendar_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ Sync failed for calendar {calendar_id}: {outcome}")
+                errors.append(outcome)
+            else:
+                results.append(outcome)
+
+        written_ical_uids = set().union(
+            *(result.written_ical_uids for result in results)
+        )
+        if len(self.calendar_ids) > 1 and written_ical_uids:
+            await asyncio.to_thread(self._dedupe, written_ical_uids)
+        if errors:
+            raise errors[0]
+
+        return results[0] if len(results) == 1 else SyncResult.merge(results)
+
+    def _dedupe(self, ical_uids: Set[str]) -> None:
+        db = self.session_factory()
+        try:
+            # El orden de prioridad es el de todos los calendarios configurados,
+            # aunque esta corrida sincronice solo algunos
+            dedupe_by_ical_uid(db, self.async_service.calendar_ids, ical_uids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
@@ -0,0 +1,635 @@
+"""
+Outbox persistente de cambios locales hacia Google Calendar.
+
+Las escrituras locales encolan la intención (push/delete) en la misma
+transacción que el cambio; un drainer en segundo plano la envía a Google en
+batch requests, con reintentos y backoff. Nada se pierde si el proceso se
+reinicia: lo pendiente sigue en `calendar_outbox`.
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+from database import SessionLocal
+from models.calendar_event import CalendarEvent
+from models.calendar_outbox import CalendarOutbox
+from services.event_store import event_to_google_data
+from services.google_calendar import get_calendar_service
+from services.google_executor import GoogleCalendarError
+from utils.config import get_outbox_config
+from utils.logger import logger
+from utils.telemetry import record_counter, start_span
+from utils.timezone import now_local
+
+
+PENDING = "pending"
+SENDING = "sending"  # Reservada por el drainer o un push directo (ver claim_pushes)
+FAILED = "failed"
+
+
+# ==================== ENQUEUE ====================
+
+
+def enqueue_push(db: Session, event: CalendarEvent) -> CalendarOutbox:
+    """
+    Encola el envío de un evento local a Google (crear o actualizar).
+
+    Si ya hay un push pendiente para el evento se reutiliza la misma fila y
+    se pospone el envío `OUTBOX_DEBOUNCE_SECONDS`, así varias ediciones
+    seguidas terminan en una sola llamada a Google. Si la fila se está
+    enviando, sigue reservada: al terminar ese envío vuelve a pendiente (la
+    versión cambió) y se envía la edición nueva. No hace commit.
+    """
+    config = get_outbox_config()
+    send_at = now_local() + timedelta(seconds=config.debounce_seconds)
+    entry = (
+        db.query(CalendarOutbox).filter(CalendarOutbox.event_id == event.id).first()
+    )
+    if entry is None:
+        entry = CalendarOutbox(
+            event_id=event.id, action="push", version=1, status=PENDING
+        )
+        entry.next_attempt_at = send_at
+        db.add(entry)
+    else:
+        entry.version = CalendarOutbox.version + 1
+        # Expresiones SQL: la reserva puede cambiar entre la lectura y el UPDATE
+        in_flight = CalendarOutbox.status == SENDING
+        entry.status = case((in_flight, SENDING), else_=PENDING)
+        entry.next_attempt_at = case(
+            (in_flight, CalendarOutbox.next_attempt_at), else_=send_at
+        )
+
+    entry.google_event_id = event.google_event_id
+    entry.calendar_id = event.calendar_id
+    entry.attempts = 0
+    entry.last_error = None
+    return entry
+
+
+def enqueue_delete(db: Session, event: CalendarEvent) -> Optional[CalendarOutbox]:
+    """
+    Encola el borrado en Google de un evento que se elimina localmente.
+
+    Reemplaza cualquier push pendiente del evento. Los eventos `local_*`
+    nunca llegaron a Google: solo se descarta su push pendiente. No hace commit.
+    """
+    entry = (
+        db.query(CalendarOutbox).filter(CalendarOutbox.event_id == event.id).first()
+    )
+    if event.google_event_id.startswith("local_"):
+        if entry is not None:
+            db.delete(entry)
+        return None
+
+    if entry is None:
+        entry = CalendarOutbox(version=1)
+        db.add(entry)
+    else:
+        entry.version = CalendarOutbox.version + 1
+
+    # Sin event_id: el id local puede reutilizarse una vez borrada la fila
+    entry.event_id = None
+    entry.action = "delete"
+    entry.google_event_id = event.google_event_id
+    entry.calendar_id = event.calendar_id
+    entry.status = PENDING
+    entry.attempts = 0
+    entry.last_error = None
+    entry.next_attempt_at = now_local()
+    return entry
+
+
+def discard_pending_pushes(db: Session, event_ids: Iterable[int]) -> None:
+    """
+    Descarta los pushes pendientes de varios eventos (ya enviados o borrados
+    directamente por una operación masiva). No hace commit.
+    """
+    event_ids = list(event_ids)
+    if not event_ids:
+        return
+    db.query(CalendarOutbox).filter(
+        CalendarOutbox.event_id.in_(event_ids), CalendarOutbox.action == "push"
+    ).delete(synchronize_session=False)
+
+
+def get_pending_google_ids(db: Session, google_event_ids: Iterable[str]) -> Set[str]:
+    """
+    De `google_event_ids`, los que tienen un cambio local pendiente de enviar
+    a Google o en envío (push o delete en el outbox). La sincronización no debe pisarlos
+    con la copia de Google, que es anterior.
+
+    Las entradas fallidas no cuentan: el drainer ya no las reintentará, así
+    que Google vuelve a ser la fuente de verdad para esos eventos.
+    """
+    google_event_ids = set(google_event_ids)
+    if not google_event_ids:
+        return set()
+    pushes = (
+        db.query(CalendarEvent.google_event_id)
+        .join(CalendarOutbox, CalendarOutbox.event_id == CalendarEvent.id)
+        .filter(
+            CalendarOutbox.action == "push",
+            CalendarOutbox.status.in_((PENDING, SENDING)),
+            CalendarEvent.google_event_id.in_(google_event_ids),
+        )
+    )
+    deletes = db.query(CalendarOutbox.google_event_id).filter(
+        CalendarOutbox.action == "delete",
+        CalendarOutbox.status.in_((PENDING, SENDING)),
+        CalendarOutbox.google_event_id.in_(google_event_ids),
+    )
+    return {google_event_id for (google_event_id,) in pushes.union(deletes)}
+
+
+def get_outbox_counts(db: Session) -> Dict[str, int]:
+    """Número de entradas por estado (pending / sending / failed)."""
+    rows = (
+        db.query(CalendarOutbox.status, func.count(CalendarOutbox.id))
+        .group_by(CalendarOutbox.status)
+        .all()
+    )
+    counts = {PENDING: 0, SENDING: 0, FAILED: 0}
+    counts.update({entry_status: count for entry_status, count in rows})
+    return counts
+
+
+# ==================== CLAIMS ====================
+
+
+def _claim(db: Session, entry_id: int, version: int) -> bool:
+    """
+    Reserva una entrada para enviarla: pasa a "sending" solo si nadie la
+    editó (`version`) ni la tiene reservada (o su reserva venció). No hace commit.
+
+    Returns:
+        True si la reserva es de este llamador
+    """
+    now = now_local()
+    lease = timedelta(seconds=get_outbox_config().claim_timeout_seconds)
+    return bool(
+        db.query(CalendarOutbox)
+        .filter(
+            CalendarOutbox.id == entry_id,
+            CalendarOutbox.version == version,
+            or_(
+                CalendarOutbox.status != SENDING,
+                CalendarOutbox.next_attempt_at <= now,
+            ),
+        )
+        .update(
+            {"status": SENDING, "next_attempt_at": now + lease},
+            synchronize_session=False,
+        )
+    )
+
+
+def _release(db: Session, entry_id: int) -> None:
+    """
+    Devuelve a pendiente una entrada que sigue reservada (fue editada durante
+    el envío): el drainer enviará la versión nueva. No hace commit.
+    """
+    db.query(CalendarOutbox).filter(
+        CalendarOutbox.id == entry_id, CalendarOutbox.status == SENDING
+    ).update(
+        {"status": PENDING, "next_attempt_at": now_local()},
+        synchronize_session=False,
+    )
+
+
+def claim_pushes(db: Session, events: List[CalendarEvent]) -> Dict[int, Dict]:
+    """
+    Reserva el push de `events` antes de enviarlos directamente a Google, para
+    que el drainer no envíe los mismos eventos a la vez (un evento `local_*`
+    se crearía dos veces). Los eventos sin entrada reciben una ya reservada,
+    así las ediciones durante el envío se encolan en ella. Hace commit.
+
+    Returns:
+        event_id -> reserva (para `complete_claim` / `abandon_claim`) de los
+        eventos reservados; los que ya se están enviando quedan fuera
+    """
+    entries = {
+        entry.event_id: (entry.id, entry.version, entry.status)
+        for entry in db.query(CalendarOutbox).filter(
+            CalendarOutbox.event_id.in_([event.id for event in events])
+        )
+    }
+    lease_until = now_local() + timedelta(
+        seconds=get_outbox_config().claim_timeout_seconds
+    )
+
+    claims: Dict[int, Dict] = {}
+    created: Dict[int, CalendarOutbox] = {}
+    for event in events:
+        if event.id in entries:
+            entry_id, version, previous_status = entries[event.id]
+            if _claim(db, entry_id, version):
+                claims[event.id] = {
+                    "id": entry_id,
+                    "version": version,
+                    "previous_status": previous_status,
+                }
+            continue
+        created[event.id] = CalendarOutbox(
+            event_id=event.id,
+            action="push",
+            google_event_id=event.google_event_id,
+            calendar_id=event.calendar_id,
+            status=SENDING,
+            version=1,
+            attempts=0,
+            next_attempt_at=lease_until,
+        )
+        db.add(created[event.id])
+
+    # IntegrityError (otro envío creó la entrada a la vez) llega al llamador
+    db.flush()
+    for event_id, entry in created.items():
+        claims[event_id] = {"id": entry.id, "version": 1, "previous_status": None}
+    db.commit()
+    return claims
+
+
+def complete_claim(db: Session, claim: Dict) -> None:
+    """
+    Cierra una reserva enviada con éxito: borra la entrada, o la devuelve a
+    pendiente si se editó durante el envío. No hace commit.
+    """
+    db.query(CalendarOutbox).filter(
+        CalendarOutbox.id == claim["id"],
+        CalendarOutbox.version == claim["version"],
+    ).delete(synchronize_session=False)
+    _release(db, claim["id"])
+
+
+def abandon_claim(db: Session, claim: Dict) -> None:
+    """
+    Cierra una reserva cuyo envío directo falló: la entrada vuelve a su estado
+    anterior (o se borra si la creó `claim_pushes`), o a pendiente si se editó
+    durante el envío. No hace commit.
+    """
+    unchanged = db.query(CalendarOutbox).filter(
+        CalendarOutbox.id == claim["id"],
+        CalendarOutbox.version == claim["version"],
+        CalendarOutbox.status == SENDING,
+    )
+    if claim["previous_status"] is None:
+        unchanged.delete(synchronize_session=False)
+    else:
+        unchanged.update(
+            {"status": claim["previous_status"], "next_attempt_at": now_local()},
+            synchronize_session=False,
+        )
+    _release(db, claim["id"])
+
+
+def record_created_event(
+    db: Session,
+    event_id: int,
+    local_google_event_id: str,
+    calendar_id: Optional[str],
+    google_event: Dict,
+) -> bool:
+    """
+    Guarda el ID asignado por Google a un evento `local_*` recién creado.
+    Si el evento se borró localmente mientras se creaba, encola su borrado en
+    Google. No hace commit.
+
+    Returns:
+        True si el evento local se actualizó
+    """
+    updated = (
+        db.query(CalendarEvent)
+        .filter(
+            CalendarEvent.id == event_id,
+            CalendarEvent.google_event_id == local_google_event_id,
+        )
+        .update(
+            {
+                "google_event_id": google_event["id"],
+                "calendar_id": calendar_id or get_calendar_service().calendar_id,
+                "ical_uid": google_event.get("iCalUID"),
+            },
+            synchronize_session=False,
+        )
+    )
+    if updated:
+        # Una edición encolada durante el envío protege del sync al nuevo ID
+        db.query(CalendarOutbox).filter(
+            CalendarOutbox.event_id == event_id,
+            CalendarOutbox.google_event_id == local_google_event_id,
+        ).update({"google_event_id": google_event["id"]}, synchronize_session=False)
+    else:
+        db.add(
+            CalendarOutbox(
+                action="delete",
+                google_event_id=google_event["id"],
+                calendar_id=calendar_id,
+                status=PENDING,
+                version=1,
+                attempts=0,
+                next_attempt_at=now_local(),
+            )
+        )
+    return bool(updated)
+
+
+# ==================== DRAINER ====================
+
+
+class OutboxDrainer:
+    """
+    Tarea asyncio que vacía el outbox cada `OUTBOX_DRAIN_INTERVAL_SECONDS`.
+
+    Cada ronda reserva hasta `OUTBOX_BATCH_SIZE` entradas vencidas y las
+    envía en batch requests. Una entrada solo se borra si no fue editada
+    mientras se enviaba (columna `version`); si falla se reprograma con
+    backoff exponencial y tras `OUTBOX_MAX_ATTEMPTS` queda en estado "failed".
+    """
+
+    def __init__(self):
+        self.config = get_outbox_config()
+        self._task: Optional[asyncio.Task] = None
+
+        # Estadísticas para /calendar/health
+        self.sent = 0
+        self.failed_attempts = 0
+        self.last_drained_at = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Inicia el loop del drainer si no está corriendo."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._loop(), name="calendar-outbox-drainer")
+        logger.info(
+            f"📤 Outbox drainer started (every {self.config.drain_interval_seconds}s)"
+        )
+
+    async def stop(self) -> None:
+        """Detiene el loop y espera a que la tarea termine."""
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("🛑 Outbox drainer stopped")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                # Vaciar mientras haya lotes completos vencidos
+                while await asyncio.to_thread(self.drain_once) >= self.config.batch_size:
+                    pass
+                self.last_drained_at = now_local()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"❌ Outbox drain failed: {e}")
+            await asyncio.sleep(self.config.drain_interval_seconds)
+
+    def drain_once(self) -> int:
+        """
+        Envía un lote de entradas vencidas.
+
+        Returns:
+            Número de entradas procesadas
+        """
+        db = SessionLocal()
+        try:
+            # Vencidas: pendientes, o reservadas por un envío que no terminó
+            due = [
+                {
+                    "id": entry.id,
+                    "event_id": entry.event_id,
+                    "action": entry.action,
+                    "google_event_id": entry.google_event_id,
+                    "calendar_id": entry.calendar_id,
+                    "version": entry.version,
+                    "attempts": entry.attempts,
+                }
+                for entry in db.query(CalendarOutbox)
+                .filter(
+                    CalendarOutbox.status.in_((PENDING, SENDING)),
+                    CalendarOutbox.next_attempt_at <= now_local(),
+                )
+                .order_by(CalendarOutbox.next_attempt_at)
+                .limit(self.config.batch_size)
+            ]
+            entries = [
+                entry for entry in due if _claim(db, entry["id"], entry["version"])
+            ]
+            db.commit()
+            if not entries:
+                return 0
+
+            pushes = [entry for entry in entries if entry["action"] == "push"]
+            deletes = [entry for entry in entries if entry["action"] == "delete"]
+            with start_span(
+                "outbox.drain", {"pushes": len(pushes), "deletes": len(deletes)}
+            ):
+                if pushes:
+                    self._send_pushes(db, pushes)
+                if deletes:
+                    self._send_deletes(db, deletes)
+            return len(entries)
+        finally:
+            db.close()
+
+    def _send_pushes(self, db: Session, entries: List[Dict]) -> None:
+        events = {
+            event.id: event
+            for event in db.query(CalendarEvent).filter(
+                CalendarEvent.id.in_([entry["event_id"] for entry in entries])
+            )
+        }
+
+        sendable = []
+        for entry in entries:
+            event = events.get(entry["event_id"])
+            if event is None:
+                # El evento se borró del caché local: no hay nada que enviar
+                self._complete(db, entry)
+                continue
+            is_local = event.google_event_id.startswith("local_")
+            entry["local_google_event_id"] = event.google_event_id
+            entry["calendar_id"] = event.calendar_id
+            operation = {
+                "key": str(entry["id"]),
+                "google_event_id": None if is_local else event.google_event_id,
+                "calendar_id": event.calendar_id,
+                "event_data": event_to_google_data(event),
+            }
+            sendable.append((entry, operation))
+        # No mantener la transacción abierta durante las llamadas a Google
+        db.commit()
+        if not sendable:
+            return
+
+        calendar_service = get_calendar_service()
+        try:
+            batch_results = calendar_service.batch_push_events(
+                [operation for _, operation in sendable]
+            )
+        except GoogleCalendarError as e:
+            for entry, _ in sendable:
+                self._fail(db, entry, str(e), retryable=e.retryable)
+            db.commit()
+            return
+
+        for entry, operation in sendable:
+            outcome = batch_results.get(operation["key"])
+            if not outcome or outcome["error"] is not None:
+                error = outcome["error"] if outcome else None
+                self._fail(
+                    db,
+                    entry,
+                    str(error) if error else "No response from Google",
+                    retryable=error.retryable if error else True,
+                )
+                continue
+
+            if operation["google_event_id"] is None:
+                record_created_event(
+                    db,
+                    entry["event_id"],
+                    entry["local_google_event_id"],
+                    entry["calendar_id"],
+                    outcome["response"],
+                )
+                record_counter(
+                    "events_created", attributes=self._metric_attributes(entry)
+                )
+            else:
+                record_counter(
+                    "events_updated", attributes=self._metric_attributes(entry)
+                )
+            self._complete(db, entry)
+            self.sent += 1
+        db.commit()
+
+    def _send_deletes(self, db: Session, entries: List[Dict]) -> None:
+        calendar_ids = {
+            entry["google_event_id"]: entry["calendar_id"] for entry in entries
+        }
+        db.commit()
+
+        try:
+            errors = get_calendar_service().batch_delete_events(
+                list(calendar_ids), calendar_ids
+            )
+        except GoogleCalendarError as e:
+            for entry in entries:
+                self._fail(db, entry, str(e), retryable=e.retryable)
+            db.commit()
+            return
+
+        for entry in entries:
+            error = errors[entry["google_event_id"]]
+            if error is None:
+                record_counter(
+                    "events_deleted", attributes=self._metric_attributes(entry)
+                )
+                self._complete(db, entry)
+                self.sent += 1
+            else:
+                self._fail(db, entry, str(error), retryable=error.retryable)
+        db.commit()
+
+    def _metric_attributes(self, entry: Dict) -> Dict[str, str]:
+        return {"source": "outbox", "calendar_id": entry["calendar_id"] or ""}
+
+    def _complete(self, db: Session, entry: Dict) -> None:
+        """Borra la entrada si no fue editada mientras se enviaba."""
+        complete_claim(db, entry)
+
+    def _fail(self, db: Session, entry: Dict, error: str, retryable: bool) -> None:
+        """Reprograma la entrada con backoff exponencial o la marca como fallida."""
+        self.failed_attempts += 1
+        attempts = entry["attempts"] + 1
+        delay = min(
+            self.config.retry_base_seconds * (2 ** (attempts - 1)),
+            self.config.retry_max_seconds,
+        )
+        give_up = not retryable or attempts >= self.config.max_attempts
+
+        db.query(CalendarOutbox).filter(
+            CalendarOutbox.id == entry["id"],
+            CalendarOutbox.version == entry["version"],
+        ).update(
+            {
+                "attempts": attempts,
+                "last_error": error,
+                "status": FAILED if give_up else PENDING,
+                "next_attempt_at": now_local() + timedelta(seconds=delay),
+            },
+            synchronize_session=False,
+        )
+        # Editada durante el envío: se envía la versión nueva sin esperar
+        _release(db, entry["id"])
+        if give_up:
+            logger.error(
+                f"❌ Outbox {entry['action']} for {entry['google_event_id']} "
+                f"failed after {attempts} attempt(s): {error}"
+            )
+        else:
+            logger.warning(
+                f"⚠️  Outbox {entry['action']} for {entry['google_event_id']} "
+                f"failed, retrying in {delay:.0f}s: {error}"
+            )
+
+    def get_status(self) -> Dict:
+        """Estado del drainer y del outbox para `/calendar/health`."""
+        db = SessionLocal()
+        try:
+            counts = get_outbox_counts(db)
+        finally:
+            db.close()
+        return {
+            "drainer_running": self.running,
+            "pending": counts[PENDING],
+            "sending": counts[SENDING],
+            "failed": counts[FAILED],
+            "sent": self.sent,
+            "failed_attempts": self.failed_attempts,
+            "last_drained_at": self.last_drained_at,
+            "last_error": self.last_error,
+        }
+
+
+# Singleton para reutilizar la instancia
+_outbox_drainer = None
+
+
+def get_outbox_drainer() -> OutboxDrainer:
+    """Obtiene instancia singleton del drainer del outbox."""
+    global _outbox_drainer
+    if _outbox_drainer is None:
+        _outbox_drainer = OutboxDrainer()
+    return _outbox_drainer
+
+
+async def start_outbox_drainer() -> None:
+    """Inicia el drainer si está habilitado y Google Calendar está configurado."""
+    if not get_outbox_config().drainer_enabled:
+        logger.info("⏸️  Outbox drainer disabled (OUTBOX_DRAINER_ENABLED=false)")
+        return
+
+    if not get_calendar_service().configured:
+        logger.warning("⚠️  Outbox drainer not started: Google Calendar not configured")
+        return
+
+    await get_outbox_drainer().start()
+
+
+async def stop_outbox_drainer() -> None:
+    """Detiene el drainer si está corriendo."""
+    await get_outbox_drainer().stop()
@@ -0,0 +1,109 @@
+"""
+Single-flight de sincronizaciones: si varios clientes (Streamlit, Janus, un
+cron) piden a la vez la misma sincronización, solo una llega a Google y el
+resto recibe su resultado.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+from services.sync_engine import SyncResult
+from services.sync_lock import SyncLock
+from utils.logger import logger
+
+
+@dataclass
+class _Flight:
+    """Sincronización en curso (o en espera) de un calendario."""
+
+    start: Optional[datetime]  # None = incremental
+    end: Optional[datetime]
+    future: asyncio.Future
+
+    def matches(self, start: Optional[datetime], end: Optional[datetime]) -> bool:
+        # Solo la misma ventana: el resultado (synced_ids, páginas) es el de
+        # su rango, así que unirse a una más amplia devolvería eventos de más.
+        # Las incrementales (None/None) solo se comparten entre sí.
+        return self.start == start and self.end == end
+
+
+class SingleFlight:
+    """
+    Coordina las sincronizaciones de este proceso por calendario:
+
+    - Un pedido de la misma ventana que una sincronización en curso o en
+      espera se une a ella y comparte su `SyncResult`.
+    - Los demás pedidos del mismo calendario se ejecutan de a uno (sin
+      transacciones de upsert compitiendo) y, además, bajo un `SyncLock`
+      entre procesos.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, List[_Flight]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        # Estadísticas para /calendar/health
+        self.started = 0
+        self.joined = 0
+
+    async def run(
+        self,
+        calendar_id: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        sync: Callable[[], Awaitable[SyncResult]],
+    ) -> SyncResult:
+        """
+        Ejecuta `sync` para el calendario, o se une a una sincronización de la
+        misma ventana [start, end] (None/None = incremental).
+        """
+        flights = self._flights.setdefault(calendar_id, [])
+        for flight in flights:
+            if flight.matches(start, end):
+                self.joined += 1
+                logger.info(f"🔗 Joining in-flight sync for {calendar_id}")
+                # shield: si este pedido se cancela, la sincronización sigue
+                return await asyncio.shield(flight.future)
+
+        flight = _Flight(start, end, asyncio.get_running_loop().create_future())
+        # Evita el aviso "exception was never retrieved" si nadie se unió
+        flight.future.add_done_callback(
+            lambda future: future.cancelled() or future.exception()
+        )
+        flights.append(flight)
+        self.started += 1
+        try:
+            lock = self._locks.setdefault(calendar_id, asyncio.Lock())
+            async with lock:
+                async with SyncLock(f"sync:{calendar_id}"):
+                    result = await sync()
+            flight.future.set_result(result)
+            return result
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                flight.future.cancel()
+            else:
+                flight.future.set_exception(e)
+            raise
+        finally:
+            flights.remove(flight)
+
+    def get_stats(self) -> Dict:
+        return {
+            "started": self.started,
+            "joined": self.joined,
+            "in_flight": sum(len(flights) for flights in self._flights.values()),
+        }
+
+
+# Singleton por proceso
+_single_flight = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Obtiene instancia singleton del coordinador de sincronizaciones."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
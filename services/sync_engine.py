@@ -0,0 +1,517 @@
+"""
+Motor de sincronización Google Calendar -> caché local.
+Pipeline por etapas: fetch (páginas) -> parse -> diff -> write -> metrics.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from models.calendar_event import CalendarEvent
+from models.calendar_sync_state import CalendarSyncState
+from services.google_calendar import (
+    GoogleCalendarService,
+    SyncTokenExpiredError,
+    get_calendar_service,
+)
+from services.event_store import (
+    bulk_upsert_events,
+    calendar_rank,
+    get_stored_versions,
+)
+from services.outbox import get_pending_google_ids
+from utils.config import get_sync_config
+from utils.logger import logger
+from utils.telemetry import record_counter, record_histogram, start_span
+from utils.timezone import now_local
+
+if TYPE_CHECKING:
+    from services.google_calendar_async import AsyncGoogleCalendarService
+
+
+@dataclass
+class SyncResult:
+    """Resultado y métricas de una ejecución del motor de sincronización."""
+
+    calendar_id: str
+    mode: str  # window | full | incremental
+    window: Optional[str] = None  # today | week | month | critical | range | backfill
+    pages: int = 0
+    fetched: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0  # Existían con el mismo content_hash: no se reescriben
+    deleted: int = 0
+    synced_ids: List[str] = field(default_factory=list)
+    # iCalUIDs de las filas escritas: solo ahí pueden aparecer duplicados nuevos
+    written_ical_uids: Set[str] = field(default_factory=set)
+    next_sync_token: Optional[str] = None
+    # Segundos acumulados por etapa (fetch, parse, diff, write, total)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def upserted(self) -> int:
+        return self.created + self.updated
+
+    @classmethod
+    def merge(cls, results: List["SyncResult"]) -> "SyncResult":
+        """
+        Combina los resultados de varios calendarios sincronizados en paralelo.
+        Los contadores se suman; los tiempos son los del calendario más lento.
+        """
+        modes = {result.mode for result in results}
+        windows = {result.window for result in results}
+        merged = cls(
+            calendar_id=",".join(result.calendar_id for result in results),
+            mode=modes.pop() if len(modes) == 1 else "mixed",
+            window=windows.pop() if len(windows) == 1 else None,
+        )
+        for result in results:
+            merged.pages += result.pages
+            merged.fetched += result.fetched
+            merged.created += result.created
+            merged.updated += result.updated
+            merged.unchanged += result.unchanged
+            merged.deleted += result.deleted
+            merged.synced_ids.extend(result.synced_ids)
+            merged.written_ical_uids |= result.written_ical_uids
+            for stage, seconds in result.timings.items():
+                merged.timings[stage] = max(merged.timings.get(stage, 0.0), seconds)
+        return merged
+
+    def server_timing(self) -> str:
+        """Formatea los tiempos por etapa como header `Server-Timing` (ms)."""
+        return ", ".join(
+            f"{stage};dur={seconds * 1000:.1f}"
+            for stage, seconds in self.timings.items()
+        )
+
+
+class SyncEngine:
+    """
+    Sincroniza eventos de Google Calendar en la BD local por etapas.
+
+    Cada página obtenida de Google recorre el pipeline completo antes de pedir
+    la siguiente, así la memoria se mantiene constante para cualquier rango.
+    """
+
+    STAGES = ("fetch", "parse", "diff", "write")
+
+    def __init__(
+        self,
+        db: Session,
+        calendar_service: Optional[GoogleCalendarService] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self.db = db
+        self.calendar_service = calendar_service or get_calendar_service()
+        self.batch_size = batch_size or get_sync_config().batch_size
+
+    # ==================== ENTRY POINTS ====================
+
+    def sync_window(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        calendar_id: Optional[str] = None,
+        window: Optional[str] = None,
+    ) -> SyncResult:
+        """
+        Sincroniza todos los eventos de un rango de tiempo.
+
+        Args:
+            start_time: Inicio del rango
+            end_time: Fin del rango
+            calendar_id: Calendario a sincronizar (default: GOOGLE_CALENDAR_ID)
+            window: Nombre del rango para métricas (today, week, range, ...)
+
+        Returns:
+            SyncResult con contadores y tiempos por etapa
+        """
+        calendar_id = calendar_id or self.calendar_service.calendar_id
+        result = SyncResult(calendar_id=calendar_id, mode="window", window=window)
+        pages = (
+            (page, None)
+            for page in self.calendar_service.iter_event_pages(
+                start_time, end_time, calendar_id
+            )
+        )
+        self._run(pages, result)
+        return result
+
+    def sync_incremental(self, calendar_id: Optional[str] = None) -> SyncResult:
+        """
+        Sincroniza solo los cambios desde el último syncToken guardado.
+
+        Sin token previo (o si Google lo invalida con HTTP 410) hace una
+        sincronización completa desde `SYNC_LOOKBACK_DAYS` días atrás.
+
+        Args:
+            calendar_id: Calendario a sincronizar (default: GOOGLE_CALENDAR_ID)
+
+        Returns:
+            SyncResult con contadores y tiempos por etapa
+        """
+        calendar_id = calendar_id or self.calendar_service.calendar_id
+        state = self._get_sync_state(calendar_id)
+        time_min = now_local() - timedelta(days=get_sync_config().lookback_days)
+
+        result = SyncResult(
+            calendar_id=calendar_id,
+            mode="incremental" if state.sync_token else "full",
+        )
+        try:
+            self._run(
+                self.calendar_service.iter_event_changes(
+                    sync_token=state.sync_token,
+                    time_min=time_min,
+                    calendar_id=calendar_id,
+                ),
+                result,
+            )
+        except SyncTokenExpiredError:
+            # Token inválido: descartar cambios parciales y resincronizar todo
+            self.db.rollback()
+            state = self._get_sync_state(calendar_id)
+            result = SyncResult(calendar_id=calendar_id, mode="full")
+            self._run(
+                self.calendar_service.iter_event_changes(
+                    time_min=time_min, calendar_id=calendar_id
+                ),
+                result,
+            )
+
+        self._save_sync_state(state, result)
+        return result
+
+    async def async_sync_window(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        async_service: "AsyncGoogleCalendarService",
+        calendar_id: Optional[str] = None,
+        page_token: Optional[str] = None,
+        checkpoint: Optional[Callable[[Optional[str], SyncResult], None]] = None,
+        window: Optional[str] = None,
+    ) -> SyncResult:
+        """
+        Versión asíncrona de `sync_window`: las páginas se piden con el cliente
+        HTTP asíncrono y solo la escritura en BD usa un thread.
+
+        Args:
+            page_token: Continúa un recorrido previo desde esta página
+            checkpoint: Se llama (en un thread) después de escribir cada página
+                con el `nextPageToken` siguiente (None al terminar el rango)
+            window: Nombre del rango para métricas (today, week, range, ...)
+        """
+        calendar_id = calendar_id or async_service.calendar_id
+        result = SyncResult(calendar_id=calendar_id, mode="window", window=window)
+
+        async def pages():
+            async for page, next_page_token in (
+                async_service.iter_event_pages_with_tokens(
+                    start_time, end_time, calendar_id, page_token
+                )
+            ):
+                yield page, None
+                # El pipeline pide la página siguiente solo después de escribir esta
+                if checkpoint:
+                    await asyncio.to_thread(checkpoint, next_page_token, result)
+
+        await self._arun(pages(), result)
+        return result
+
+    async def async_sync_incremental(
+        self,
+        async_service: "AsyncGoogleCalendarService",
+        calendar_id: Optional[str] = None,
+    ) -> SyncResult:
+        """Versión asíncrona de `sync_incremental`."""
+        calendar_id = calendar_id or async_service.calendar_id
+        state = await asyncio.to_thread(self._get_sync_state, calendar_id)
+        time_min = now_local() - timedelta(days=get_sync_config().lookback_days)
+
+        result = SyncResult(
+            calendar_id=calendar_id,
+            mode="incremental" if state.sync_token else "full",
+        )
+        try:
+            await self._arun(
+                async_service.iter_event_changes(
+                    sync_token=state.sync_token,
+                    time_min=time_min,
+                    calendar_id=calendar_id,
+                ),
+                result,
+            )
+        except SyncTokenExpiredError:
+            await asyncio.to_thread(self.db.rollback)
+            state = await asyncio.to_thread(self._get_sync_state, calendar_id)
+            result = SyncResult(calendar_id=calendar_id, mode="full")
+            await self._arun(
+                async_service.iter_event_changes(
+                    time_min=time_min, calendar_id=calendar_id
+                ),
+                result,
+            )
+
+        await asyncio.to_thread(self._save_sync_state, state, result)
+        return result
+
+    # ==================== PIPELINE ====================
+
+    def _run(
+        self,
+        pages: Iterable[Tuple[List[Dict], Optional[str]]],
+        result: SyncResult,
+    ) -> None:
+        """Ejecuta el pipeline para cada página y emite las métricas finales."""
+        with start_span("calendar.sync", self._metric_attributes(result)):
+            started = self._begin(result)
+            for page, page_sync_token in self._fetch(pages, result):
+                self._process_page(page, page_sync_token, result)
+            self._finish(result, started)
+
+    async def _arun(
+        self,
+        pages: AsyncIterator[Tuple[List[Dict], Optional[str]]],
+        result: SyncResult,
+    ) -> None:
+        """
+        Igual que `_run` pero con fetch asíncrono: solo las etapas de BD
+        (parse/diff/write) ocupan un thread, una página a la vez.
+        """
+        with start_span("calendar.sync", self._metric_attributes(result)):
+            started = self._begin(result)
+            iterator = pages.__aiter__()
+            while True:
+                with self._stage(result, "fetch"):
+                    item = await anext(iterator, None)
+                if item is None:
+                    break
+                page, page_sync_token = item
+                result.pages += 1
+                result.fetched += len(page)
+                # to_thread copia el contexto: los spans de parse/diff/write
+                # quedan bajo "calendar.sync"
+                await asyncio.to_thread(
+                    self._process_page, page, page_sync_token, result
+                )
+            self._finish(result, started)
+
+    def _begin(self, result: SyncResult) -> float:
+        for stage in self.STAGES:
+            result.timings[stage] = 0.0
+        return time.perf_counter()
+
+    def _finish(self, result: SyncResult, started: float) -> None:
+        result.timings["total"] = time.perf_counter() - started
+        self._emit_metrics(result)
+
+    def _process_page(
+        self, page: List[Dict], page_sync_token: Optional[str], result: SyncResult
+    ) -> None:
+        """Etapas parse -> diff -> write para una página."""
+        with self._stage(result, "parse"):
+            parsed_events, cancelled_ids = self._parse(page, result.calendar_id)
+        with self._stage(result, "diff"):
+            changed_events = self._diff(parsed_events, result)
+        with self._stage(result, "write"):
+            self._write(changed_events, cancelled_ids, result)
+
+        result.synced_ids.extend(event["google_event_id"] for event in parsed_events)
+        if page_sync_token:
+            result.next_sync_token = page_sync_token
+
+    def _fetch(
+        self,
+        pages: Iterable[Tuple[List[Dict], Optional[str]]],
+        result: SyncResult,
+    ) -> Iterator[Tuple[List[Dict], Optional[str]]]:
+        """Etapa fetch: consume páginas de Google midiendo el tiempo de cada una."""
+        iterator = iter(pages)
+        while True:
+            with self._stage(result, "fetch"):
+                item = next(iterator, None)
+            if item is None:
+                return
+            result.pages += 1
+            result.fetched += len(item[0])
+            yield item
+
+    def _parse(
+        self, page: List[Dict], calendar_id: str
+    ) -> Tuple[List[Dict], List[str]]:
+        """Etapa parse: separa eventos cancelados y parsea el resto."""
+        active_events = []
+        cancelled_ids = []
+        for google_event in page:
+            if google_event.get("status") == "cancelled":
+                cancelled_ids.append(google_event["id"])
+            else:
+                active_events.append(google_event)
+        parsed_events = self.calendar_service.parse_events(active_events, calendar_id)
+        return parsed_events, cancelled_ids
+
+    def _diff(self, parsed_events: List[Dict], result: SyncResult) -> List[Dict]:
+        """
+        Etapa diff: una sola consulta IN trae el `content_hash` y el calendario
+        dueño guardados de los eventos de la página; solo los nuevos o
+        modificados pasan a write.
+
+        Si el mismo evento está en varios calendarios, la fila pertenece al de
+        mayor prioridad (`calendar_rank`): los demás no la reescriben y ese
+        calendario la reclama aunque el contenido no haya cambiado.
+
+        Los eventos con un cambio local aún en el outbox se omiten: la copia de
+        Google es anterior a la edición y la pisaría (el drainer luego enviaría
+        la fila revertida). Se sincronizan cuando el outbox los envía.
+        """
+        # Si un evento aparece dos veces en la página, gana la última versión
+        latest = {event["google_event_id"]: event for event in parsed_events}
+        existing = get_stored_versions(self.db, list(latest))
+        pending_local = get_pending_google_ids(self.db, latest)
+        rank_of = calendar_rank(self.calendar_service.calendar_ids)
+
+        changed_events = []
+        for google_event_id, event in latest.items():
+            if google_event_id in pending_local:
+                logger.debug(
+                    f"⏭️  Skipping {google_event_id}: local change pending in outbox"
+                )
+                result.unchanged += 1
+                continue
+            if google_event_id not in existing:
+                result.created += 1
+                changed_events.append(event)
+                continue
+
+            stored_hash, owner = existing[google_event_id]
+            incoming_rank = rank_of(event["calendar_id"])
+            owner_rank = rank_of(owner)
+            if incoming_rank > owner_rank or (
+                incoming_rank == owner_rank and stored_hash == event["content_hash"]
+            ):
+                result.unchanged += 1
+                continue
+            result.updated += 1
+            changed_events.append(event)
+        return changed_events
+
+    def _write(
+        self, parsed_events: List[Dict], cancelled_ids: List[str], result: SyncResult
+    ) -> None:
+        """
+        Etapa write: upserts por lotes de los eventos nuevos o modificados y
+        borrado de cancelados (commit por lote).
+        """
+        bulk_upsert_events(
+            self.db,
+            parsed_events,
+            chunk_size=self.batch_size,
+            calendar_ids=self.calendar_service.calendar_ids,
+        )
+        result.written_ical_uids.update(
+            event["ical_uid"] for event in parsed_events if event.get("ical_uid")
+        )
+
+        if cancelled_ids:
+            # Solo filas de este calendario: el mismo evento puede seguir en otro
+            calendar_filter = CalendarEvent.calendar_id == result.calendar_id
+            if result.calendar_id == self.calendar_service.calendar_id:
+                calendar_filter = or_(
+                    calendar_filter, CalendarEvent.calendar_id.is_(None)
+                )
+            result.deleted += (
+                self.db.query(CalendarEvent)
+                .filter(
+                    CalendarEvent.google_event_id.in_(cancelled_ids), calendar_filter
+                )
+                .delete(synchronize_session=False)
+            )
+            self.db.commit()
+
+    def _emit_metrics(self, result: SyncResult) -> None:
+        """Etapa metrics: reporta contadores y latencia por etapa (logs + OTEL)."""
+        attributes = self._metric_attributes(result)
+        record_histogram("sync_duration", result.timings["total"], attributes)
+        record_histogram("sync_pages", result.pages, attributes)
+        record_histogram("sync_fetch_duration", result.timings["fetch"], attributes)
+        record_histogram("sync_parse_duration", result.timings["parse"], attributes)
+        record_histogram("sync_write_duration", result.timings["write"], attributes)
+
+        counter_attributes = {**attributes, "source": "google_sync"}
+        record_counter("events_synced", result.fetched, counter_attributes)
+        record_counter("events_created", result.created, counter_attributes)
+        record_counter("events_updated", result.updated, counter_attributes)
+        record_counter("events_deleted", result.deleted, counter_attributes)
+
+        logger.info(
+            f"✅ Sync [{result.mode}] {result.calendar_id}: "
+            f"{result.created} created, {result.updated} updated, "
+            f"{result.unchanged} unchanged, {result.deleted} deleted "
+            f"({result.pages} pages)"
+        )
+        logger.info(
+            "⏱️  Sync stages: "
+            + ", ".join(
+                f"{stage}={seconds * 1000:.1f}ms"
+                for stage, seconds in result.timings.items()
+            )
+        )
+
+    # ==================== HELPERS ====================
+
+    def _metric_attributes(self, result: SyncResult) -> Dict[str, str]:
+        return {
+            "window": result.window or result.mode,
+            "calendar_id": result.calendar_id,
+        }
+
+    @contextmanager
+    def _stage(self, result: SyncResult, stage: str):
+        """Acumula el tiempo de una etapa en `result.timings` y abre su span."""
+        started = time.perf_counter()
+        try:
+            with start_span(f"calendar.sync.{stage}", self._metric_attributes(result)):
+                yield
+        finally:
+            result.timings[stage] = result.timings.get(stage, 0.0) + (
+                time.perf_counter() - started
+            )
+
+    def _save_sync_state(self, state: CalendarSyncState, result: SyncResult) -> None:
+        """Guarda el nuevo syncToken y la fecha de la sincronización."""
+        state.sync_token = result.next_sync_token
+        if result.mode == "full":
+            state.last_full_sync_at = now_local()
+        else:
+            state.last_incremental_sync_at = now_local()
+        self.db.commit()
+
+    def _get_sync_state(self, calendar_id: str) -> CalendarSyncState:
+        """Obtiene (o crea) el estado de sincronización del calendario."""
+        state = (
+            self.db.query(CalendarSyncState)
+            .filter(CalendarSyncState.calendar_id == calendar_id)
+            .first()
+        )
+        if not state:
+            state = CalendarSyncState(calendar_id=calendar_id)
+            self.db.add(state)
+        return state
@@ -0,0 +1,213 @@
+"""
+Lock de sincronización entre procesos (varios workers de uvicorn).
+
+PostgreSQL usa un advisory lock de sesión; SQLite, una fila en
+`calendar_sync_locks` con vencimiento que se renueva mientras el lock está
+tomado. Ambos se toman por calendario, así dos procesos nunca escriben a la
+vez los mismos eventos.
+"""
+
+import asyncio
+import hashlib
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+from database import engine as default_engine
+from models.calendar_sync_lock import CalendarSyncLock
+from utils.config import get_sync_config
+from utils.logger import logger
+
+
+# Identifica a este proceso como dueño de los locks de SQLite
+PROCESS_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class SyncLockTimeoutError(Exception):
+    """Otro proceso mantiene el lock más de `SYNC_LOCK_WAIT_SECONDS`."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SyncLock:
+    """
+    Lock asíncrono entre procesos. Se usa como `async with SyncLock(name):`;
+    si está tomado por otro proceso reintenta hasta `SYNC_LOCK_WAIT_SECONDS`.
+
+    En SQLite, mientras el lock está tomado una tarea extiende `expires_at`
+    cada tercio del TTL: una sincronización más larga que el TTL no pierde el
+    lock, y si el proceso muere el lock vence como máximo un TTL después.
+    """
+
+    POLL_SECONDS = 0.5
+
+    def __init__(self, name: str, engine: Engine = default_engine):
+        self.name = name
+        self.engine = engine
+        config = get_sync_config()
+        self.wait_seconds = config.lock_wait_seconds
+        self.ttl_seconds = config.lock_ttl_seconds
+        self._conn: Optional[Connection] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @property
+    def _advisory(self) -> bool:
+        return self.engine.dialect.name == "postgresql"
+
+    @property
+    def _advisory_key(self) -> int:
+        # pg_advisory_lock recibe un bigint: hash estable del nombre
+        digest = hashlib.blake2b(self.name.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big", signed=True)
+
+    async def __aenter__(self) -> "SyncLock":
+        await self.acquire()
+        if not self._advisory:
+            self._heartbeat = asyncio.create_task(
+                self._renew_loop(), name=f"sync-lock-heartbeat:{self.name}"
+            )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+        await asyncio.to_thread(self.release)
+
+    async def acquire(self) -> None:
+        """
+        Raises:
+            SyncLockTimeoutError: Si no se obtiene el lock dentro del tiempo de espera
+        """
+        deadline = time.monotonic() + self.wait_seconds
+        waited = False
+        while not await asyncio.to_thread(self.try_acquire):
+            if time.monotonic() >= deadline:
+                raise SyncLockTimeoutError(
+                    f"Sync lock '{self.name}' is held by another process",
+                    retry_after=self.wait_seconds,
+                )
+            if not waited:
+                logger.info(f"⏳ Waiting for sync lock '{self.name}' (another process)")
+                waited = True
+            await asyncio.sleep(self.POLL_SECONDS)
+
+    def try_acquire(self) -> bool:
+        """Intenta tomar el lock sin esperar."""
+        if self._advisory:
+            return self._try_advisory_lock()
+        return self._try_row_lock()
+
+    def release(self) -> None:
+        if self._advisory:
+            self._release_advisory_lock()
+        else:
+            self._release_row_lock()
+
+    # ==================== POSTGRESQL ====================
+
+    def _try_advisory_lock(self) -> bool:
+        # El advisory lock vive en la conexión: se mantiene abierta hasta soltarlo
+        conn = self.engine.connect()
+        try:
+            acquired = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self._advisory_key}
+            ).scalar()
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        if not acquired:
+            conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    def _release_advisory_lock(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": self._advisory_key}
+            )
+            self._conn.commit()
+        except Exception as e:
+            # Descartar la conexión: al cerrarse en el servidor se suelta el lock
+            logger.warning(f"⚠️  Could not release sync lock '{self.name}': {e}")
+            self._conn.invalidate()
+        finally:
+            self._conn.close()
+            self._conn = None
+
+    # ==================== SQLITE ====================
+
+    def _try_row_lock(self) -> bool:
+        table = CalendarSyncLock.__table__
+        now = datetime.now(timezone.utc)
+
+        # Un lock vencido es de un proceso que murió sin soltarlo
+        with self.engine.begin() as conn:
+            conn.execute(
+                table.delete().where(
+                    table.c.name == self.name, table.c.expires_at < now
+                )
+            )
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    table.insert().values(
+                        name=self.name,
+                        owner=PROCESS_OWNER,
+                        acquired_at=now,
+                        expires_at=now + timedelta(seconds=self.ttl_seconds),
+                    )
+                )
+        except IntegrityError:
+            return False
+        return True
+
+    def _renew_row_lock(self) -> bool:
+        """Extiende `expires_at` del lock de este proceso; False si ya no es suyo."""
+        table = CalendarSyncLock.__table__
+        with self.engine.begin() as conn:
+            renewed = conn.execute(
+                table.update()
+                .where(table.c.name == self.name, table.c.owner == PROCESS_OWNER)
+                .values(
+                    expires_at=datetime.now(timezone.utc)
+                    + timedelta(seconds=self.ttl_seconds)
+                )
+            ).rowcount
+        return bool(renewed)
+
+    async def _renew_loop(self) -> None:
+        interval = max(1.0, self.ttl_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await asyncio.to_thread(self._renew_row_lock):
+                    logger.warning(f"⚠️  Sync lock '{self.name}' was lost (expired)")
+                    return
+            except Exception as e:
+                # Reintentar en el próximo intervalo (ej: base bloqueada)
+                logger.warning(f"⚠️  Could not renew sync lock '{self.name}': {e}")
+
+    def _release_row_lock(self) -> None:
+        table = CalendarSyncLock.__table__
+        with self.engine.begin() as conn:
+            conn.execute(
+                table.delete().where(
+                    table.c.name == self.name, table.c.owner == PROCESS_OWNER
+                )
+            )
@@ -0,0 +1,158 @@
+"""
+Worker en segundo plano que mantiene el caché local sincronizado.
+Ejecuta sincronizaciones incrementales periódicas (con jitter) sobre asyncio.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from services.google_calendar import get_calendar_service
+from services.multi_calendar_sync import MultiCalendarSync
+from services.sync_engine import SyncResult
+from utils.config import get_sync_config, get_webhook_config
+from utils.logger import logger
+from utils.timezone import now_local
+
+
+class SyncWorker:
+    """
+    Tarea asyncio que ejecuta la sincronización incremental de todos los
+    calendarios (`MultiCalendarSync`) cada N segundos.
+
+    Las llamadas a Google usan el cliente asíncrono y solo la escritura en BD
+    ocupa un thread; los endpoints de lectura sirven siempre desde `calendar_events`.
+    """
+
+    def __init__(self, interval_seconds: int, jitter_seconds: int):
+        self.interval_seconds = interval_seconds
+        self.jitter_seconds = jitter_seconds
+        self._task: Optional[asyncio.Task] = None
+
+        # Estado de frescura
+        self.last_synced_at: Optional[datetime] = None
+        self.last_attempt_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.last_result: Optional[SyncResult] = None
+        self.runs = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Inicia el loop de sincronización si no está corriendo."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._loop(), name="calendar-sync-worker")
+        logger.info(
+            f"🔄 Sync worker started (every {self.interval_seconds}s "
+            f"± {self.jitter_seconds}s)"
+        )
+
+    async def stop(self) -> None:
+        """Detiene el loop y espera a que la tarea termine."""
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("🛑 Sync worker stopped")
+
+    async def run_once(self) -> None:
+        """Ejecuta una sincronización incremental y actualiza el estado."""
+        self.last_attempt_at = now_local()
+        self.runs += 1
+        try:
+            self.last_result = await self._sync()
+            self.last_synced_at = now_local()
+            self.last_error = None
+        except Exception as e:
+            self.failures += 1
+            self.last_error = str(e)
+            logger.error(f"❌ Background sync failed: {e}")
+
+    async def _loop(self) -> None:
+        # Pequeño jitter inicial para que varios procesos no arranquen a la vez
+        await asyncio.sleep(random.uniform(0, self.jitter_seconds))
+        while True:
+            await self.run_once()
+            await asyncio.sleep(
+                self.interval_seconds + random.uniform(0, self.jitter_seconds)
+            )
+
+    async def _sync(self) -> SyncResult:
+        return await MultiCalendarSync().sync_incremental()
+
+    def get_status(self) -> Dict:
+        """Estado del worker para `/calendar/health`."""
+        stale_after = timedelta(
+            seconds=2 * (self.interval_seconds + self.jitter_seconds)
+        )
+        stale = (
+            self.last_synced_at is None
+            or now_local() - self.last_synced_at > stale_after
+        )
+
+        status = {
+            "worker_running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "last_synced_at": self.last_synced_at,
+            "last_attempt_at": self.last_attempt_at,
+            "last_error": self.last_error,
+            "stale": stale,
+            "runs": self.runs,
+            "failures": self.failures,
+        }
+        if self.last_result:
+            status["last_result"] = {
+                "mode": self.last_result.mode,
+                "created": self.last_result.created,
+                "updated": self.last_result.updated,
+                "unchanged": self.last_result.unchanged,
+                "deleted": self.last_result.deleted,
+                "pages": self.last_result.pages,
+            }
+        return status
+
+
+# Singleton para reutilizar la instancia
+_sync_worker = None
+
+
+def get_sync_worker() -> SyncWorker:
+    """Obtiene instancia singleton del worker de sincronización."""
+    global _sync_worker
+    if _sync_worker is None:
+        config = get_sync_config()
+        interval_seconds = config.interval_seconds
+        webhook_config = get_webhook_config()
+        if webhook_config.enabled:
+            # Con notificaciones push el polling solo cubre avisos perdidos
+            interval_seconds = max(
+                interval_seconds, webhook_config.fallback_interval_seconds
+            )
+        _sync_worker = SyncWorker(interval_seconds, config.jitter_seconds)
+    return _sync_worker
+
+
+async def start_sync_worker() -> None:
+    """Inicia el worker si está habilitado y Google Calendar está configurado."""
+    if not get_sync_config().worker_enabled:
+        logger.info("⏸️  Sync worker disabled (SYNC_WORKER_ENABLED=false)")
+        return
+
+    if not get_calendar_service().configured:
+        logger.warning("⚠️  Sync worker not started: Google Calendar not configured")
+        return
+
+    await get_sync_worker().start()
+
+
+async def stop_sync_worker() -> None:
+    """Detiene el worker si está corriendo."""
+    await get_sync_worker().stop()
@@ -0,0 +1,251 @@
+"""
+Notificaciones push de Google Calendar (watch channels).
+
+Google avisa en `/calendar/webhook` cuando un calendario cambia; las ráfagas
+de avisos se agrupan (debounce) en una sola sincronización incremental y los
+canales se renuevan antes de expirar.
+"""
+
+import asyncio
+import hmac
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set
+from database import SessionLocal
+from models.calendar_watch_channel import CalendarWatchChannel
+from services.google_calendar import get_calendar_service
+from services.google_executor import GoogleCalendarError
+from services.multi_calendar_sync import MultiCalendarSync
+from utils.config import get_webhook_config
+from utils.logger import logger
+from utils.timezone import now_local
+
+
+class WatchChannelManager:
+    """
+    Mantiene un canal `events.watch` por calendario y convierte las
+    notificaciones recibidas en sincronizaciones incrementales.
+    """
+
+    def __init__(self):
+        self.config = get_webhook_config()
+        self._renew_task: Optional[asyncio.Task] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self._pending_calendars: Set[str] = set()
+
+        # Estadísticas para /calendar/health
+        self.notifications = 0
+        self.syncs = 0
+        self.last_notification_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._renew_task is not None and not self._renew_task.done()
+
+    async def start(self) -> None:
+        """Abre/renueva los canales y arranca el loop de renovación."""
+        if self.running:
+            return
+        self._renew_task = asyncio.create_task(
+            self._renew_loop(), name="calendar-watch-renewal"
+        )
+        logger.info(f"📡 Watch channels enabled -> {self.config.url}")
+
+    async def stop(self) -> None:
+        """
+        Detiene la renovación. Los canales siguen abiertos en Google hasta
+        expirar, así no se pierden avisos durante un reinicio.
+        """
+        for task in (self._renew_task, self._sync_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._renew_task = None
+        self._sync_task = None
+        logger.info("🛑 Watch channel manager stopped")
+
+    # ==================== NOTIFICATIONS ====================
+
+    def validate(self, channel_id: str, token: str) -> Optional[str]:
+        """
+        Valida el channel id y el token de una notificación.
+
+        Returns:
+            El calendar_id del canal, o None si el canal no existe o el token no coincide
+        """
+        db = SessionLocal()
+        try:
+            channel = (
+                db.query(CalendarWatchChannel)
+                .filter(CalendarWatchChannel.channel_id == channel_id)
+                .first()
+            )
+        finally:
+            db.close()
+
+        if channel is None or not hmac.compare_digest(channel.token, token or ""):
+            return None
+        return channel.calendar_id
+
+    def notify(self, calendar_id: str) -> None:
+        """
+        Registra un cambio en un calendario. Todos los avisos que lleguen
+        durante `WEBHOOK_DEBOUNCE_SECONDS` se resuelven con una sola
+        sincronización incremental.
+        """
+        self.notifications += 1
+        self.last_notification_at = now_local()
+        self._pending_calendars.add(calendar_id)
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.create_task(
+                self._debounced_sync(), name="calendar-webhook-sync"
+            )
+
+    async def _debounced_sync(self) -> None:
+        # Los avisos que llegan mientras sincronizamos se atienden en la vuelta siguiente
+        while self._pending_calendars:
+            await asyncio.sleep(self.config.debounce_seconds)
+            calendar_ids = sorted(self._pending_calendars)
+            self._pending_calendars = set()
+            try:
+                await MultiCalendarSync(calendar_ids=calendar_ids).sync_incremental()
+                self.syncs += 1
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"❌ Webhook-triggered sync failed: {e}")
+
+    # ==================== RENEWAL ====================
+
+    async def _renew_loop(self) -> None:
+        interval = max(60, self.config.renew_before_seconds // 2)
+        while True:
+            try:
+                await asyncio.to_thread(self.ensure_channels)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"❌ Watch channel renewal failed: {e}")
+            await asyncio.sleep(interval)
+
+    def ensure_channels(self) -> None:
+        """
+        Abre un canal para cada calendario que no tenga uno vigente y
+        reemplaza los que expiran en menos de `WEBHOOK_RENEW_BEFORE_SECONDS`.
+        """
+        calendar_service = get_calendar_service()
+        renew_at = now_local() + timedelta(seconds=self.config.renew_before_seconds)
+
+        db = SessionLocal()
+        try:
+            for calendar_id in calendar_service.calendar_ids:
+                channels = (
+                    db.query(CalendarWatchChannel)
+                    .filter(CalendarWatchChannel.calendar_id == calendar_id)
+                    .all()
+                )
+                # Los canales sin resource_id son locales (simulate_webhook.py)
+                # y no reemplazan a un canal real
+                if any(
+                    channel.resource_id and self._expires_after(channel, renew_at)
+                    for channel in channels
+                ):
+                    continue
+
+                self._open_channel(db, calendar_id)
+                # El canal nuevo ya está activo: cerrar los anteriores
+                for channel in channels:
+                    self._close_channel(db, channel)
+                db.commit()
+        finally:
+            db.close()
+
+    def _open_channel(self, db, calendar_id: str) -> CalendarWatchChannel:
+        channel_id = str(uuid.uuid4())
+        token = secrets.token_urlsafe(32)
+        response = get_calendar_service().watch_events(
+            calendar_id,
+            channel_id,
+            token,
+            self.config.url,
+            self.config.channel_ttl_seconds,
+        )
+        channel = CalendarWatchChannel(
+            channel_id=channel_id,
+            calendar_id=calendar_id,
+            resource_id=response.get("resourceId"),
+            token=token,
+            expiration=datetime.fromtimestamp(
+                int(response["expiration"]) / 1000, tz=timezone.utc
+            ),
+        )
+        db.add(channel)
+        logger.info(
+            f"✅ Watch channel {channel_id} for {calendar_id} "
+            f"expires at {channel.expiration.isoformat()}"
+        )
+        return channel
+
+    def _close_channel(self, db, channel: CalendarWatchChannel) -> None:
+        # Si ya expiró en Google solo hace falta borrar el registro
+        if channel.resource_id and self._expires_after(channel, now_local()):
+            try:
+                get_calendar_service().stop_channel(
+                    channel.channel_id, channel.resource_id
+                )
+            except GoogleCalendarError as e:
+                # Si no se puede cerrar, expira solo; sus avisos dejan de validar
+                logger.warning(f"⚠️  Could not stop channel {channel.channel_id}: {e}")
+        db.delete(channel)
+
+    def _expires_after(self, channel: CalendarWatchChannel, moment: datetime) -> bool:
+        expiration = channel.expiration
+        if expiration.tzinfo is None:
+            # SQLite no guarda la zona horaria: se almacena en UTC
+            expiration = expiration.replace(tzinfo=timezone.utc)
+        return expiration > moment
+
+    def get_status(self) -> Dict:
+        """Estado de las notificaciones push para `/calendar/health`."""
+        return {
+            "enabled": self.config.enabled,
+            "running": self.running,
+            "notifications": self.notifications,
+            "syncs": self.syncs,
+            "pending_calendars": sorted(self._pending_calendars),
+            "last_notification_at": self.last_notification_at,
+            "last_error": self.last_error,
+        }
+
+
+# Singleton para reutilizar la instancia
+_watch_manager = None
+
+
+def get_watch_manager() -> WatchChannelManager:
+    """Obtiene instancia singleton del gestor de watch channels."""
+    global _watch_manager
+    if _watch_manager is None:
+        _watch_manager = WatchChannelManager()
+    return _watch_manager
+
+
+async def start_watch_channels() -> None:
+    """Inicia los watch channels si hay GOOGLE_WEBHOOK_URL y Google está configurado."""
+    if not get_webhook_config().enabled:
+        logger.info("⏸️  Push notifications disabled (GOOGLE_WEBHOOK_URL not set)")
+        return
+
+    if not get_calendar_service().configured:
+        logger.warning("⚠️  Watch channels not started: Google Calendar not configured")
+        return
+
+    await get_watch_manager().start()
+
+
+async def stop_watch_channels() -> None:
+    """Detiene la renovación de canales si está corriendo."""
+    await get_watch_manager().stop()
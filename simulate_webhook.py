@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Simulador local de notificaciones push de Google Calendar.
+Envía a `/calendar/webhook` los mismos headers que Google, para probar el
+receptor y el debounce sin exponer una URL pública.
+
+Uso:
+    uv run simulate_webhook.py --register
+    uv run simulate_webhook.py --channel-id <id> --token <token> --count 10
+"""
+
+import argparse
+import secrets
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+import httpx
+
+DEFAULT_URL = "http://localhost:8000/api/v1/calendar/webhook"
+
+
+def register_channel(calendar_id: str) -> tuple[str, str]:
+    """
+    Crea un canal local (sin resource_id) en la BD para que el receptor
+    acepte las notificaciones simuladas. No contacta a Google.
+    """
+    from database import Base, SessionLocal, engine
+    from models.calendar_watch_channel import CalendarWatchChannel
+
+    Base.metadata.create_all(bind=engine)
+    channel_id = f"local-{uuid.uuid4()}"
+    token = secrets.token_urlsafe(32)
+
+    db = SessionLocal()
+    try:
+        db.add(
+            CalendarWatchChannel(
+                channel_id=channel_id,
+                calendar_id=calendar_id,
+                token=token,
+                expiration=datetime.now(timezone.utc) + timedelta(days=1),
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"✅ Canal local registrado para {calendar_id}")
+    print(f"   ├─ channel_id: {channel_id}")
+    print(f"   └─ token:      {token}")
+    return channel_id, token
+
+
+def send_notifications(
+    url: str,
+    channel_id: str,
+    token: str,
+    count: int,
+    interval: float,
+    resource_state: str,
+) -> bool:
+    """Envía `count` notificaciones (la primera con `sync` si se pide) y muestra las respuestas."""
+    ok = True
+    with httpx.Client(timeout=10) as client:
+        for number in range(1, count + 1):
+            response = client.post(
+                url,
+                headers={
+                    "X-Goog-Channel-ID": channel_id,
+                    "X-Goog-Channel-Token": token,
+                    "X-Goog-Resource-State": resource_state,
+                    "X-Goog-Resource-ID": "local-resource",
+                    "X-Goog-Message-Number": str(number),
+                },
+            )
+            icon = "✅" if response.is_success else "❌"
+            print(f"{icon} #{number} {resource_state} -> {response.status_code}")
+            ok = ok and response.is_success
+            if interval and number < count:
+                time.sleep(interval)
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=DEFAULT_URL, help="URL del receptor")
+    parser.add_argument(
+        "--register",
+        action="store_true",
+        help="Registra un canal local en la BD antes de enviar",
+    )
+    parser.add_argument(
+        "--calendar-id",
+        default="primary",
+        help="Calendario del canal local (con --register)",
+    )
+    parser.add_argument("--channel-id", help="Canal existente")
+    parser.add_argument("--token", help="Token del canal existente")
+    parser.add_argument(
+        "--count", type=int, default=5, help="Notificaciones en la ráfaga"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.2, help="Segundos entre notificaciones"
+    )
+    parser.add_argument(
+        "--state",
+        default="exists",
+        choices=["sync", "exists", "not_exists"],
+        help="X-Goog-Resource-State a enviar",
+    )
+    args = parser.parse_args()
+
+    if args.register:
+        channel_id, token = register_channel(args.calendar_id)
+    elif args.channel_id and args.token:
+        channel_id, token = args.channel_id, args.token
+    else:
+        parser.error("usa --register o indica --channel-id y --token")
+
+    ok = send_notifications(
+        args.url, channel_id, token, args.count, args.interval, args.state
+    )
+    if ok:
+        print("💡 Las notificaciones se agrupan en una sola sincronización (ver logs)")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
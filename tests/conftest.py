@@ -0,0 +1,78 @@
+"""
+Fixtures compartidos: servicios de Google Calendar sin credenciales reales
+y un servidor falso de Calendar API sobre httpx.MockTransport.
+"""
+
+from typing import Callable
+import httpx
+import pytest
+from services.google_calendar import GoogleCalendarService
+from services.google_calendar_async import AsyncGoogleCalendarService
+from services.google_executor import GoogleRequestExecutor
+from utils.config import GoogleApiConfig
+
+
+class FakeCredentials:
+    """Credenciales ya válidas; `refresh` entrega un token nuevo."""
+
+    def __init__(self):
+        self.token = "token-1"
+        self.valid = True
+        self.refreshes = 0
+
+    def refresh(self, request) -> None:
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes + 1}"
+        self.valid = True
+
+
+@pytest.fixture
+def calendar_service(monkeypatch) -> GoogleCalendarService:
+    """GoogleCalendarService con credenciales falsas (sin archivo ni red)."""
+    monkeypatch.setenv("GOOGLE_SERVICE_ACCOUNT_FILE", "/nonexistent/sa.json")
+    monkeypatch.setenv("GOOGLE_CALENDAR_ID", "primary")
+    monkeypatch.delenv("GOOGLE_CALENDAR_IDS", raising=False)
+    monkeypatch.setenv("TIMEZONE", "America/Lima")
+    service = GoogleCalendarService()
+    service.credentials = FakeCredentials()
+    return service
+
+
+@pytest.fixture
+def executor() -> GoogleRequestExecutor:
+    """Ejecutor propio del test: sin espera de backoff ni throttling."""
+    config = GoogleApiConfig()
+    config.max_retries = 3
+    config.backoff_base_seconds = 0.0
+    config.backoff_max_seconds = 0.0
+    config.rate_per_second = 1000.0
+    config.burst = 1000
+    return GoogleRequestExecutor(config)
+
+
+@pytest.fixture
+def fake_google(calendar_service, executor):
+    """
+    Construye un AsyncGoogleCalendarService cuyo cliente httpx responde con
+    `handler(request)`; los requests recibidos quedan en `service.requests`.
+    """
+
+    def build(
+        handler: Callable[[httpx.Request], httpx.Response],
+    ) -> AsyncGoogleCalendarService:
+        service = AsyncGoogleCalendarService(calendar_service)
+        service.executor = executor
+        service.requests = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            service.requests.append(request)
+            return handler(request)
+
+        service._client = httpx.AsyncClient(
+            base_url=service.base_url,
+            headers=service.DEFAULT_HEADERS,
+            transport=httpx.MockTransport(record),
+        )
+        return service
+
+    return build
@@ -0,0 +1,282 @@
+"""
+Tests de AsyncGoogleCalendarService contra un servidor falso de Calendar API:
+paginación, reintentos, syncToken expirado (410) y mapeo de errores.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+import httpx
+import pytest
+from services.google_calendar import GoogleCalendarService, SyncTokenExpiredError
+from services.google_executor import GoogleCalendarError
+
+
+def google_error(status: int, reason: str, **headers) -> httpx.Response:
+    """Respuesta de error con el formato de Calendar API."""
+    body = {
+        "error": {
+            "code": status,
+            "message": reason,
+            "errors": [{"domain": "global", "reason": reason, "message": reason}],
+        }
+    }
+    return httpx.Response(status, content=json.dumps(body), headers=headers)
+
+
+def collect(iterator):
+    """Consume un iterador asíncrono completo."""
+
+    async def run():
+        return [item async for item in iterator]
+
+    return asyncio.run(run())
+
+
+def make_event(event_id: str) -> dict:
+    return {
+        "id": event_id,
+        "status": "confirmed",
+        "summary": f"Evento {event_id}",
+        "start": {"dateTime": "2026-10-18T09:00:00-05:00"},
+        "end": {"dateTime": "2026-10-18T10:00:00-05:00"},
+    }
+
+
+EVENT_DATA = {
+    "summary": "Nuevo",
+    "start_datetime": datetime(2026, 10, 18, 9),
+    "end_datetime": datetime(2026, 10, 18, 10),
+}
+
+WINDOW = (datetime(2026, 10, 1), datetime(2026, 11, 1))
+
+
+# ==================== PAGINACIÓN ====================
+
+
+def test_iter_event_pages_follows_next_page_token(fake_google):
+    pages = {
+        None: {"items": [make_event("a"), make_event("b")], "nextPageToken": "p2"},
+        "p2": {"items": [make_event("c")], "nextPageToken": "p3"},
+        "p3": {"items": [make_event("d")]},
+    }
+    service = fake_google(
+        lambda request: httpx.Response(
+            200, json=pages[request.url.params.get("pageToken")]
+        )
+    )
+
+    result = collect(service.iter_event_pages(*WINDOW))
+
+    assert [[event["id"] for event in page] for page in result] == [
+        ["a", "b"],
+        ["c"],
+        ["d"],
+    ]
+    assert [r.url.params.get("pageToken") for r in service.requests] == [
+        None,
+        "p2",
+        "p3",
+    ]
+    first = service.requests[0]
+    assert first.url.path == "/calendar/v3/calendars/primary/events"
+    assert first.url.params["fields"] == GoogleCalendarService.LIST_FIELDS
+    assert first.url.params["timeMin"] == "2026-10-01T00:00:00-05:00"
+    assert first.headers["Authorization"] == "Bearer token-1"
+
+
+def test_iter_event_pages_with_tokens_resumes_from_page_token(fake_google):
+    service = fake_google(
+        lambda request: httpx.Response(200, json={"items": [make_event("z")]})
+    )
+
+    result = collect(service.iter_event_pages_with_tokens(*WINDOW, page_token="p7"))
+
+    assert result == [([make_event("z")], None)]
+    assert service.requests[0].url.params["pageToken"] == "p7"
+
+
+def test_iter_event_changes_returns_next_sync_token(fake_google):
+    pages = {
+        None: {"items": [make_event("a")], "nextPageToken": "p2"},
+        "p2": {"items": [], "nextSyncToken": "sync-2"},
+    }
+    service = fake_google(
+        lambda request: httpx.Response(
+            200, json=pages[request.url.params.get("pageToken")]
+        )
+    )
+
+    result = collect(service.iter_event_changes(sync_token="sync-1"))
+
+    assert [token for _, token in result] == [None, "sync-2"]
+    assert all(r.url.params["syncToken"] == "sync-1" for r in service.requests)
+
+
+def test_calendar_id_is_url_encoded(fake_google):
+    service = fake_google(lambda request: httpx.Response(200, json={"items": []}))
+
+    collect(service.iter_event_pages(*WINDOW, calendar_id="team@group.calendar"))
+
+    assert service.requests[0].url.raw_path.startswith(
+        b"/calendar/v3/calendars/team%40group.calendar/events"
+    )
+
+
+# ==================== REINTENTOS ====================
+
+
+@pytest.mark.parametrize(
+    "failure",
+    [
+        lambda: google_error(503, "backendError"),
+        lambda: google_error(429, "rateLimitExceeded", **{"Retry-After": "0"}),
+        lambda: google_error(403, "userRateLimitExceeded"),
+    ],
+    ids=["503", "429", "403-rate-limit"],
+)
+def test_retryable_errors_are_retried(fake_google, executor, failure):
+    responses = [failure(), failure(), httpx.Response(200, json={"items": []})]
+    service = fake_google(lambda request: responses.pop(0))
+
+    assert collect(service.iter_event_pages(*WINDOW)) == [[]]
+    assert len(service.requests) == 3
+    assert executor.retries == 2
+
+
+def test_transport_errors_are_retried(fake_google, executor):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"id": "new"})
+
+    service = fake_google(handler)
+
+    created = asyncio.run(service.create_event(EVENT_DATA))
+
+    assert created == {"id": "new"}
+    assert len(calls) == 2
+    assert executor.retries == 1
+
+
+def test_retries_stop_at_max_retries(fake_google, executor):
+    service = fake_google(lambda request: google_error(500, "backendError"))
+
+    with pytest.raises(GoogleCalendarError) as exc_info:
+        collect(service.iter_event_pages(*WINDOW))
+
+    assert exc_info.value.status == 500
+    assert len(service.requests) == executor.config.max_retries + 1
+
+
+def test_expired_token_is_refreshed_once(fake_google, calendar_service):
+    def handler(request):
+        if request.headers["Authorization"] == "Bearer token-1":
+            return google_error(401, "authError")
+        return httpx.Response(200, json={"items": []})
+
+    service = fake_google(handler)
+    calendar_service.refresh_credentials = lambda force=False: (
+        calendar_service.credentials.refresh(None)
+    )
+
+    assert collect(service.iter_event_pages(*WINDOW)) == [[]]
+    assert [r.headers["Authorization"] for r in service.requests] == [
+        "Bearer token-1",
+        "Bearer token-2",
+    ]
+    assert calendar_service.credentials.refreshes == 1
+
+
+# ==================== SYNC TOKEN (410) ====================
+
+
+def test_expired_sync_token_raises_sync_token_expired(fake_google):
+    service = fake_google(lambda request: google_error(410, "fullSyncRequired"))
+
+    with pytest.raises(SyncTokenExpiredError) as exc_info:
+        collect(service.iter_event_changes(sync_token="stale"))
+
+    assert exc_info.value.status == 410
+    # 410 no es reintentable
+    assert len(service.requests) == 1
+
+
+def test_sync_token_expired_mid_pagination(fake_google):
+    def handler(request):
+        if request.url.params.get("pageToken") == "p2":
+            return google_error(410, "fullSyncRequired")
+        return httpx.Response(200, json={"items": [], "nextPageToken": "p2"})
+
+    service = fake_google(handler)
+
+    async def run():
+        pages = []
+        with pytest.raises(SyncTokenExpiredError):
+            async for page in service.iter_event_changes(sync_token="stale"):
+                pages.append(page)
+        return pages
+
+    assert asyncio.run(run()) == [([], None)]
+
+
+# ==================== MAPEO DE ERRORES ====================
+
+
+@pytest.mark.parametrize(
+    "status, reason",
+    [(400, "badRequest"), (403, "forbidden"), (404, "notFound")],
+)
+def test_client_errors_map_to_google_calendar_error(fake_google, status, reason):
+    service = fake_google(lambda request: google_error(status, reason))
+
+    with pytest.raises(GoogleCalendarError) as exc_info:
+        asyncio.run(service.update_event("evt-1", EVENT_DATA))
+
+    error = exc_info.value
+    assert not isinstance(error, SyncTokenExpiredError)
+    assert (error.status, error.reason) == (status, reason)
+    assert not error.retryable
+    assert len(service.requests) == 1
+
+
+def test_retry_after_header_is_parsed(fake_google, executor):
+    executor.config.max_retries = 0
+    service = fake_google(
+        lambda request: google_error(429, "rateLimitExceeded", **{"Retry-After": "7"})
+    )
+
+    with pytest.raises(GoogleCalendarError) as exc_info:
+        collect(service.iter_event_pages(*WINDOW))
+
+    assert exc_info.value.retry_after == 7.0
+    assert exc_info.value.rate_limited
+
+
+@pytest.mark.parametrize("status", [404, 410])
+def test_delete_missing_event_returns_false(fake_google, status):
+    service = fake_google(lambda request: google_error(status, "notFound"))
+
+    assert asyncio.run(service.delete_event("evt-1")) is False
+    assert service.requests[0].method == "DELETE"
+
+
+def test_delete_event(fake_google):
+    service = fake_google(lambda request: httpx.Response(204))
+
+    assert asyncio.run(service.delete_event("evt/1")) is True
+    assert service.requests[0].url.raw_path.endswith(b"/events/evt%2F1")
+
+
+def test_client_errors_do_not_open_the_circuit_breaker(fake_google, executor):
+    service = fake_google(lambda request: google_error(404, "notFound"))
+
+    for _ in range(executor.config.cb_failure_threshold + 1):
+        with pytest.raises(GoogleCalendarError):
+            asyncio.run(service.update_event("evt-1", EVENT_DATA))
+
+    assert executor.breaker.allow_request()
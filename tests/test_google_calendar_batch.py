@@ -0,0 +1,151 @@
+"""
+Tests de `GoogleCalendarService._execute_batch` con un batch falso de
+googleapiclient: resultado por llamada y circuit breaker.
+"""
+
+import json
+from typing import Callable, Dict, List, Optional, Union
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+# Respuesta de una llamada del batch: dict (éxito), excepción o None (sin callback)
+Outcome = Optional[Union[Dict, Exception]]
+
+
+def http_error(status: int, reason: str) -> HttpError:
+    """HttpError con el formato de Calendar API."""
+    content = json.dumps(
+        {"error": {"code": status, "errors": [{"reason": reason}]}}
+    ).encode()
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+class FakeBatch:
+    def __init__(self, service: "FakeService", callback: Callable):
+        self.service = service
+        self.callback = callback
+        self.keys: List[str] = []
+
+    def add(self, request, request_id: str) -> None:
+        self.keys.append(request_id)
+
+    def execute(self) -> None:
+        self.service.batches.append(list(self.keys))
+        for key in self.keys:
+            outcome = self.service.respond(key, len(self.service.batches))
+            if isinstance(outcome, Exception):
+                self.callback(key, None, outcome)
+            elif outcome is not None:
+                self.callback(key, outcome, None)
+
+
+class FakeService:
+    """Cliente falso: `respond(clave, número de batch)` decide cada llamada."""
+
+    def __init__(self, respond: Callable[[str, int], Outcome]):
+        self.respond = respond
+        self.batches: List[List[str]] = []
+
+    def new_batch_http_request(self, callback: Callable) -> FakeBatch:
+        return FakeBatch(self, callback)
+
+
+@pytest.fixture
+def batch_service(calendar_service, executor):
+    """GoogleCalendarService cuyo batch responde con `respond(clave, batch)`."""
+
+    def build(respond: Callable[[str, int], Outcome]):
+        calendar_service.executor = executor
+        calendar_service._local.service = FakeService(respond)
+        return calendar_service
+
+    return build
+
+
+def requests(*keys: str):
+    return [(key, object()) for key in keys]
+
+
+def test_each_item_gets_its_response_or_error(batch_service):
+    responses = {"a": {"id": "a"}, "b": http_error(404, "notFound"), "c": None}
+    service = batch_service(lambda key, batch: responses[key])
+
+    results = service._execute_batch(requests("a", "b", "c"))
+
+    assert results["a"] == {"response": {"id": "a"}, "error": None}
+    assert results["b"]["error"].status == 404
+    assert results["c"]["response"] is None
+    assert results["c"]["error"] is not None
+
+
+def test_items_failing_with_5xx_open_the_circuit_breaker(batch_service, executor):
+    executor.config.max_retries = 0
+    executor.breaker.failure_threshold = 3
+    service = batch_service(lambda key, batch: http_error(503, "backendError"))
+
+    service._execute_batch(requests("a", "b", "c"))
+
+    assert not executor.breaker.allow_request()
+
+
+def test_items_failing_with_4xx_do_not_open_the_circuit_breaker(
+    batch_service, executor
+):
+    executor.breaker.failure_threshold = 3
+    service = batch_service(lambda key, batch: http_error(404, "notFound"))
+
+    service._execute_batch(requests("a", "b", "c"))
+
+    assert executor.breaker.allow_request()
+
+
+def test_retries_only_items_with_retryable_errors(batch_service):
+    def respond(key, batch):
+        if key == "a" and batch == 1:
+            return http_error(503, "backendError")
+        if key == "b":
+            return http_error(400, "badRequest")
+        return {"id": key}
+
+    service = batch_service(respond)
+
+    results = service._execute_batch(requests("a", "b", "c"))
+
+    assert service.service.batches == [["a", "b", "c"], ["a"]]
+    assert results["a"] == {"response": {"id": "a"}, "error": None}
+    assert results["b"]["error"].status == 400
+
+
+def test_retried_item_without_callback_does_not_keep_the_old_error(
+    batch_service, executor
+):
+    executor.config.max_retries = 1
+
+    def respond(key, batch):
+        return http_error(503, "backendError") if batch == 1 else None
+
+    service = batch_service(respond)
+
+    results = service._execute_batch(requests("a"))
+
+    assert len(service.service.batches) == 2
+    assert results["a"]["response"] is None
+    assert results["a"]["error"].status is None
+
+
+def test_retry_budget_is_spent_per_item(batch_service, executor):
+    executor.budget._balance = 1
+
+    def respond(key, batch):
+        return http_error(503, "backendError") if batch == 1 else {"id": key}
+
+    service = batch_service(respond)
+
+    results = service._execute_batch(requests("a", "b"))
+
+    # Solo hay presupuesto para reintentar una llamada
+    assert service.service.batches == [["a", "b"], ["a"]]
+    assert results["a"]["error"] is None
+    assert results["b"]["error"].status == 503
+    assert executor.budget_exhausted == 1
@@ -0,0 +1,131 @@
+"""
+El fields mask de events.list (`GoogleCalendarService.LIST_FIELDS`) debe
+incluir todo lo que leen `parse_event` y el sync; si no, Google omite esos
+campos y el parseo pierde datos sin ningún error.
+"""
+
+from typing import Dict, Set
+import pytest
+from services.google_calendar import GoogleCalendarService
+
+
+def parse_fields_mask(mask: str) -> Dict[str, Dict]:
+    """Parsea un fields mask (`a,b(c,d)`) a un árbol {campo: subcampos}."""
+    tree: Dict[str, Dict] = {}
+    stack = [tree]
+    name = ""
+    for char in mask + ",":
+        if char in ",()":
+            if name:
+                stack[-1][name.strip()] = {}
+            if char == "(":
+                stack.append(stack[-1][name.strip()])
+            elif char == ")":
+                stack.pop()
+            name = ""
+        else:
+            name += char
+    return tree
+
+
+def apply_fields_mask(value, tree: Dict[str, Dict]):
+    """Recorta `value` como lo haría Google con el fields mask."""
+    if isinstance(value, list):
+        return [apply_fields_mask(item, tree) for item in value]
+    return {
+        key: apply_fields_mask(value[key], sub) if sub else value[key]
+        for key, sub in tree.items()
+        if key in value
+    }
+
+
+class RecordingDict(dict):
+    """dict que registra qué claves se leyeron."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read: Set[str] = set()
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.read.add(key)
+        return super().__contains__(key)
+
+
+def full_event(all_day: bool = False) -> Dict:
+    """Evento tal como lo devuelve events.list sin fields mask."""
+    if all_day:
+        start, end = {"date": "2026-10-18"}, {"date": "2026-10-19"}
+    else:
+        start = {"dateTime": "2026-10-18T09:00:00-05:00", "timeZone": "America/Lima"}
+        end = {"dateTime": "2026-10-18T10:30:00-05:00", "timeZone": "America/Lima"}
+    return {
+        "kind": "calendar#event",
+        "etag": '"3362112345678000"',
+        "id": "abc123",
+        "status": "confirmed",
+        "htmlLink": "https://www.google.com/calendar/event?eid=abc123",
+        "created": "2026-10-01T12:00:00.000Z",
+        "updated": "2026-10-02T12:00:00.000Z",
+        "summary": "Revisión semanal",
+        "description": 'Notas\n\nBUJO_META: {"priority": "high", "category": "trabajo"}',
+        "location": "Oficina",
+        "colorId": "9",
+        "creator": {"email": "owner@example.com", "self": True},
+        "organizer": {"email": "owner@example.com", "self": True},
+        "start": start,
+        "end": end,
+        "iCalUID": "abc123@google.com",
+        "sequence": 0,
+        "attendees": [
+            {"email": "a@example.com", "responseStatus": "accepted"},
+            {"email": "b@example.com", "responseStatus": "needsAction"},
+        ],
+        "hangoutLink": "https://meet.google.com/abc-defg-hij",
+        "conferenceData": {"conferenceId": "abc-defg-hij"},
+        "reminders": {"useDefault": True},
+        "eventType": "default",
+    }
+
+
+MASK = parse_fields_mask(GoogleCalendarService.LIST_FIELDS)
+
+
+@pytest.fixture
+def service(monkeypatch) -> GoogleCalendarService:
+    monkeypatch.setenv("GOOGLE_SERVICE_ACCOUNT_FILE", "/nonexistent/sa.json")
+    return GoogleCalendarService()
+
+
+def test_mask_includes_paging_and_sync_tokens():
+    assert {"nextPageToken", "nextSyncToken", "items"} <= MASK.keys()
+
+
+@pytest.mark.parametrize("all_day", [False, True], ids=["timed", "all-day"])
+def test_mask_includes_every_key_parse_event_reads(service, all_day):
+    event = RecordingDict(full_event(all_day))
+
+    service.parse_event(event)
+
+    assert event.read <= MASK["items"].keys()
+
+
+def test_mask_includes_keys_read_by_the_sync():
+    # SyncEngine separa los cancelados por `status` y los borra por `id`
+    assert {"id", "status"} <= MASK["items"].keys()
+
+
+@pytest.mark.parametrize("all_day", [False, True], ids=["timed", "all-day"])
+def test_masked_event_parses_like_the_full_event(service, all_day):
+    event = full_event(all_day)
+    masked = apply_fields_mask({"items": [event]}, MASK)["items"][0]
+
+    assert len(masked) < len(event)
+    assert service.parse_event(masked) == service.parse_event(event)
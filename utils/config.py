@@ -119,8 +119,263 @@ class PriorityConfig:
         return env_value
 
 
+class EnvConfig:
+    """Base con helpers para cargar y validar valores numéricos/booleanos desde .env."""
+
+    def _load_bool(self, var_name: str, default: bool) -> bool:
+        """Carga un booleano (true/false) desde .env."""
+        env_value = os.getenv(var_name, "").strip().lower()
+
+        if not env_value:
+            return default
+
+        if env_value not in ("true", "false"):
+            logger.error(f"❌ {var_name}='{env_value}' debe ser 'true' o 'false'")
+            logger.warning(f"   Usando valor por defecto: {default}")
+            return default
+
+        return env_value == "true"
+
+    def _load_int(self, var_name: str, default: int, minimum: int = 1) -> int:
+        """Carga y valida un entero desde .env."""
+        env_value = os.getenv(var_name, "").strip()
+
+        if not env_value:
+            return default
+
+        try:
+            value = int(env_value)
+        except ValueError:
+            logger.error(f"❌ {var_name}='{env_value}' no es un entero válido")
+            logger.warning(f"   Usando valor por defecto: {default}")
+            return default
+
+        if value < minimum:
+            logger.error(f"❌ {var_name}={value} debe ser >= {minimum}")
+            logger.warning(f"   Usando valor por defecto: {default}")
+            return default
+
+        logger.info(f"✅ {var_name}: {value}")
+        return value
+
+    def _load_float(self, var_name: str, default: float, minimum: float = 0) -> float:
+        """Carga y valida un número decimal desde .env."""
+        env_value = os.getenv(var_name, "").strip()
+
+        if not env_value:
+            return default
+
+        try:
+            value = float(env_value)
+        except ValueError:
+            logger.error(f"❌ {var_name}='{env_value}' no es un número válido")
+            logger.warning(f"   Usando valor por defecto: {default}")
+            return default
+
+        if value < minimum:
+            logger.error(f"❌ {var_name}={value} debe ser >= {minimum}")
+            logger.warning(f"   Usando valor por defecto: {default}")
+            return default
+
+        logger.info(f"✅ {var_name}: {value}")
+        return value
+
+
+class SyncConfig(EnvConfig):
+    """Configuración para la sincronización con Google Calendar."""
+
+    # Valores por defecto
+    DEFAULT_LOOKBACK_DAYS = 30
+    DEFAULT_BATCH_SIZE = 500
+    DEFAULT_WORKER_ENABLED = True
+    DEFAULT_INTERVAL_SECONDS = 300
+    DEFAULT_JITTER_SECONDS = 30
+    DEFAULT_MAX_CONCURRENT_CALENDARS = 4
+    DEFAULT_BACKFILL_CONCURRENCY = 4
+    DEFAULT_LOCK_WAIT_SECONDS = 60.0
+    DEFAULT_LOCK_TTL_SECONDS = 900
+
+    def __init__(self):
+        self.lookback_days = self._load_int(
+            "SYNC_LOOKBACK_DAYS", self.DEFAULT_LOOKBACK_DAYS, minimum=0
+        )
+        self.batch_size = self._load_int("SYNC_BATCH_SIZE", self.DEFAULT_BATCH_SIZE)
+
+        # Worker de sincronización periódica
+        self.worker_enabled = self._load_bool(
+            "SYNC_WORKER_ENABLED", self.DEFAULT_WORKER_ENABLED
+        )
+        self.interval_seconds = self._load_int(
+            "SYNC_INTERVAL_SECONDS", self.DEFAULT_INTERVAL_SECONDS
+        )
+        self.jitter_seconds = self._load_int(
+            "SYNC_JITTER_SECONDS", self.DEFAULT_JITTER_SECONDS, minimum=0
+        )
+
+        # Calendarios (GOOGLE_CALENDAR_IDS) sincronizados en paralelo
+        self.max_concurrent_calendars = self._load_int(
+            "SYNC_MAX_CONCURRENT_CALENDARS", self.DEFAULT_MAX_CONCURRENT_CALENDARS
+        )
+
+        # Meses (shards) de un backfill histórico descargados a la vez
+        self.backfill_concurrency = self._load_int(
+            "SYNC_BACKFILL_CONCURRENCY", self.DEFAULT_BACKFILL_CONCURRENCY
+        )
+
+        # Lock entre procesos (varios workers de uvicorn) por calendario
+        self.lock_wait_seconds = self._load_float(
+            "SYNC_LOCK_WAIT_SECONDS", self.DEFAULT_LOCK_WAIT_SECONDS
+        )
+        # Solo SQLite: el lock expira si el proceso dueño muere sin soltarlo
+        # (se renueva cada TTL/3 mientras está tomado)
+        self.lock_ttl_seconds = self._load_int(
+            "SYNC_LOCK_TTL_SECONDS", self.DEFAULT_LOCK_TTL_SECONDS
+        )
+
+
+class OutboxConfig(EnvConfig):
+    """Configuración del outbox de cambios locales hacia Google Calendar."""
+
+    # Valores por defecto
+    DEFAULT_DRAINER_ENABLED = True
+    DEFAULT_DRAIN_INTERVAL_SECONDS = 5
+    DEFAULT_DEBOUNCE_SECONDS = 2.0
+    DEFAULT_BATCH_SIZE = 50
+    DEFAULT_MAX_ATTEMPTS = 10
+    DEFAULT_RETRY_BASE_SECONDS = 30.0
+    DEFAULT_RETRY_MAX_SECONDS = 3600.0
+    DEFAULT_CLAIM_TIMEOUT_SECONDS = 600.0
+
+    def __init__(self):
+        self.drainer_enabled = self._load_bool(
+            "OUTBOX_DRAINER_ENABLED", self.DEFAULT_DRAINER_ENABLED
+        )
+        self.drain_interval_seconds = self._load_int(
+            "OUTBOX_DRAIN_INTERVAL_SECONDS", self.DEFAULT_DRAIN_INTERVAL_SECONDS
+        )
+        # Espera tras la última edición antes de enviar (agrupa ediciones seguidas)
+        self.debounce_seconds = self._load_float(
+            "OUTBOX_DEBOUNCE_SECONDS", self.DEFAULT_DEBOUNCE_SECONDS
+        )
+        self.batch_size = self._load_int("OUTBOX_BATCH_SIZE", self.DEFAULT_BATCH_SIZE)
+
+        # Reintentos con backoff exponencial; luego la entrada queda en "failed"
+        self.max_attempts = self._load_int(
+            "OUTBOX_MAX_ATTEMPTS", self.DEFAULT_MAX_ATTEMPTS
+        )
+        self.retry_base_seconds = self._load_float(
+            "OUTBOX_RETRY_BASE_SECONDS", self.DEFAULT_RETRY_BASE_SECONDS
+        )
+        self.retry_max_seconds = self._load_float(
+            "OUTBOX_RETRY_MAX_SECONDS", self.DEFAULT_RETRY_MAX_SECONDS
+        )
+
+        # Una entrada en envío cuyo dueño murió vuelve a enviarse tras este plazo
+        self.claim_timeout_seconds = self._load_float(
+            "OUTBOX_CLAIM_TIMEOUT_SECONDS", self.DEFAULT_CLAIM_TIMEOUT_SECONDS
+        )
+
+
+class WebhookConfig(EnvConfig):
+    """Configuración de las notificaciones push (watch channels) de Google Calendar."""
+
+    # Valores por defecto
+    DEFAULT_DEBOUNCE_SECONDS = 5.0
+    DEFAULT_CHANNEL_TTL_SECONDS = 7 * 24 * 3600  # Máximo permitido por Google
+    DEFAULT_RENEW_BEFORE_SECONDS = 6 * 3600
+    DEFAULT_FALLBACK_INTERVAL_SECONDS = 3600
+
+    def __init__(self):
+        # URL pública HTTPS de /calendar/webhook (vacía = notificaciones desactivadas)
+        self.url = os.getenv("GOOGLE_WEBHOOK_URL", "").strip()
+
+        # Ráfagas de notificaciones dentro de esta ventana -> una sola sincronización
+        self.debounce_seconds = self._load_float(
+            "WEBHOOK_DEBOUNCE_SECONDS", self.DEFAULT_DEBOUNCE_SECONDS
+        )
+        self.channel_ttl_seconds = self._load_int(
+            "WEBHOOK_CHANNEL_TTL_SECONDS", self.DEFAULT_CHANNEL_TTL_SECONDS
+        )
+        # Los canales se renuevan cuando les queda menos que esto
+        self.renew_before_seconds = self._load_int(
+            "WEBHOOK_RENEW_BEFORE_SECONDS", self.DEFAULT_RENEW_BEFORE_SECONDS
+        )
+        # Con notificaciones activas el polling solo es un respaldo
+        self.fallback_interval_seconds = self._load_int(
+            "WEBHOOK_FALLBACK_SYNC_INTERVAL_SECONDS",
+            self.DEFAULT_FALLBACK_INTERVAL_SECONDS,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+
+class GoogleApiConfig(EnvConfig):
+    """Configuración del acceso a Google Calendar API (cliente, cuota y reintentos)."""
+
+    # Valores por defecto
+    DEFAULT_TIMEOUT_SECONDS = 30.0
+    DEFAULT_MAX_CONNECTIONS = 20
+    # Cuota por defecto de Calendar API: ~600 requests/minuto por usuario
+    DEFAULT_RATE_PER_SECOND = 10.0
+    DEFAULT_BURST = 20
+    DEFAULT_MAX_RETRIES = 5
+    DEFAULT_BACKOFF_BASE_SECONDS = 1.0
+    DEFAULT_BACKOFF_MAX_SECONDS = 32.0
+    # Fracción de requests que pueden convertirse en reintentos
+    DEFAULT_RETRY_BUDGET_RATIO = 0.2
+    # Circuit breaker
+    DEFAULT_CB_FAILURE_THRESHOLD = 5
+    DEFAULT_CB_RECOVERY_SECONDS = 30.0
+    DEFAULT_CB_HALF_OPEN_MAX_CALLS = 1
+
+    def __init__(self):
+        self.timeout_seconds = self._load_float(
+            "GOOGLE_API_TIMEOUT", self.DEFAULT_TIMEOUT_SECONDS
+        )
+        self.max_connections = self._load_int(
+            "GOOGLE_API_MAX_CONNECTIONS", self.DEFAULT_MAX_CONNECTIONS
+        )
+
+        # Token bucket dimensionado a la cuota
+        self.rate_per_second = self._load_float(
+            "GOOGLE_API_RATE_PER_SECOND", self.DEFAULT_RATE_PER_SECOND
+        )
+        self.burst = self._load_int("GOOGLE_API_BURST", self.DEFAULT_BURST)
+
+        # Reintentos con backoff exponencial + jitter
+        self.max_retries = self._load_int(
+            "GOOGLE_API_MAX_RETRIES", self.DEFAULT_MAX_RETRIES, minimum=0
+        )
+        self.backoff_base_seconds = self._load_float(
+            "GOOGLE_API_BACKOFF_BASE", self.DEFAULT_BACKOFF_BASE_SECONDS
+        )
+        self.backoff_max_seconds = self._load_float(
+            "GOOGLE_API_BACKOFF_MAX", self.DEFAULT_BACKOFF_MAX_SECONDS
+        )
+        self.retry_budget_ratio = self._load_float(
+            "GOOGLE_API_RETRY_BUDGET_RATIO", self.DEFAULT_RETRY_BUDGET_RATIO
+        )
+
+        # Circuit breaker: falla rápido mientras Google está caído o lento
+        self.cb_failure_threshold = self._load_int(
+            "GOOGLE_CB_FAILURE_THRESHOLD", self.DEFAULT_CB_FAILURE_THRESHOLD
+        )
+        self.cb_recovery_seconds = self._load_float(
+            "GOOGLE_CB_RECOVERY_SECONDS", self.DEFAULT_CB_RECOVERY_SECONDS
+        )
+        self.cb_half_open_max_calls = self._load_int(
+            "GOOGLE_CB_HALF_OPEN_MAX_CALLS", self.DEFAULT_CB_HALF_OPEN_MAX_CALLS
+        )
+
+
 # Singleton global
 _priority_config_instance = None
+_sync_config_instance = None
+_outbox_config_instance = None
+_webhook_config_instance = None
+_google_api_config_instance = None
 
 
 def get_priority_config() -> PriorityConfig:
@@ -132,3 +387,35 @@ def get_priority_config() -> PriorityConfig:
     if _priority_config_instance is None:
         _priority_config_instance = PriorityConfig()
     return _priority_config_instance
+
+
+def get_sync_config() -> SyncConfig:
+    """Obtiene la instancia global de SyncConfig (singleton)."""
+    global _sync_config_instance
+    if _sync_config_instance is None:
+        _sync_config_instance = SyncConfig()
+    return _sync_config_instance
+
+
+def get_outbox_config() -> OutboxConfig:
+    """Obtiene la instancia global de OutboxConfig (singleton)."""
+    global _outbox_config_instance
+    if _outbox_config_instance is None:
+        _outbox_config_instance = OutboxConfig()
+    return _outbox_config_instance
+
+
+def get_webhook_config() -> WebhookConfig:
+    """Obtiene la instancia global de WebhookConfig (singleton)."""
+    global _webhook_config_instance
+    if _webhook_config_instance is None:
+        _webhook_config_instance = WebhookConfig()
+    return _webhook_config_instance
+
+
+def get_google_api_config() -> GoogleApiConfig:
+    """Obtiene la instancia global de GoogleApiConfig (singleton)."""
+    global _google_api_config_instance
+    if _google_api_config_instance is None:
+        _google_api_config_instance = GoogleApiConfig()
+    return _google_api_config_instance
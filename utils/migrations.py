@@ -0,0 +1,294 @@
+"""
+Migraciones ligeras del esquema.
+
+`Base.metadata.create_all` crea las tablas que faltan pero no modifica tablas
+existentes; aquí se agregan las columnas e índices introducidos después de
+la versión original de cada tabla. Todas las operaciones son idempotentes.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from database import Base
+from models.calendar_event import normalize_category
+from utils.logger import logger
+
+
+# Tabla -> columnas agregadas después de su creación (deben ser nullable)
+ADDED_COLUMNS = {
+    "calendar_events": ["calendar_id", "ical_uid", "content_hash"],
+}
+
+
+def _add_missing_columns(engine: Engine, table_name: str, column_names) -> None:
+    table = Base.metadata.tables[table_name]
+    existing = {column["name"] for column in inspect(engine).get_columns(table_name)}
+
+    with engine.begin() as conn:
+        for name in column_names:
+            if name in existing:
+                continue
+            column_type = table.c[name].type.compile(dialect=engine.dialect)
+            conn.execute(
+                text(f"ALTER TABLE {table_name} ADD COLUMN {name} {column_type}")
+            )
+            logger.info(f"🛠️  Migration: added column {table_name}.{name}")
+
+        # Índices declarados en el modelo (index=True / Index(...)) que aún no existen
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+
+# Índice full-text de calendar_events (ver services/event_search.py)
+SQLITE_FTS_STATEMENTS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS calendar_events_fts_ai AFTER INSERT ON calendar_events
+    BEGIN
+        INSERT INTO calendar_events_fts(rowid, summary, description)
+        VALUES (new.id, new.summary, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS calendar_events_fts_ad AFTER DELETE ON calendar_events
+    BEGIN
+        INSERT INTO calendar_events_fts(calendar_events_fts, rowid, summary, description)
+        VALUES ('delete', old.id, old.summary, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS calendar_events_fts_au
+    AFTER UPDATE OF summary, description ON calendar_events
+    BEGIN
+        INSERT INTO calendar_events_fts(calendar_events_fts, rowid, summary, description)
+        VALUES ('delete', old.id, old.summary, old.description);
+        INSERT INTO calendar_events_fts(rowid, summary, description)
+        VALUES (new.id, new.summary, new.description);
+    END
+    """,
+]
+
+# Configuración de text search sin tildes ("reunion" encuentra "Reunión"), como
+# remove_diacritics de FTS5; sin la extensión unaccent se usa 'simple'
+POSTGRES_TS_CONFIG = "mnemos_unaccent"
+
+POSTGRES_UNACCENT_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    f"""
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_ts_config WHERE cfgname = '{POSTGRES_TS_CONFIG}'
+        ) THEN
+            CREATE TEXT SEARCH CONFIGURATION {POSTGRES_TS_CONFIG} (COPY = simple);
+            ALTER TEXT SEARCH CONFIGURATION {POSTGRES_TS_CONFIG}
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, simple;
+        END IF;
+    END
+    $$
+    """,
+]
+
+POSTGRES_FTS_STATEMENTS = [
+    # Columna generada: PostgreSQL la mantiene en cada INSERT/UPDATE (incluido el upsert)
+    """
+    ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{config}', coalesce(summary, '')), 'A')
+        || setweight(to_tsvector('{config}', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_calendar_events_search_vector
+    ON calendar_events USING GIN (search_vector)
+    """,
+]
+
+
+# Rango de tiempo de calendar_events para el modo overlaps (ver services/event_overlap.py)
+POSTGRES_TIME_RANGE_STATEMENTS = [
+    # Cerrado [inicio, fin]; greatest() evita un error si fin < inicio
+    """
+    ALTER TABLE calendar_events ADD COLUMN IF NOT EXISTS time_range tstzrange
+    GENERATED ALWAYS AS (
+        tstzrange(start_datetime, greatest(start_datetime, end_datetime), '[]')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_calendar_events_time_range
+    ON calendar_events USING GIST (time_range)
+    """,
+]
+
+
+# Duración de cada evento: MAX() sobre este índice da la cota del modo overlaps
+SQLITE_TIME_RANGE_STATEMENTS = [
+    """
+    CREATE INDEX IF NOT EXISTS ix_calendar_events_duration
+    ON calendar_events ((julianday(end_datetime) - julianday(start_datetime)))
+    """,
+]
+
+
+def _setup_time_range(engine: Engine) -> None:
+    """
+    Índices del modo overlaps: columna `tstzrange` con índice GiST en
+    PostgreSQL, índice de la duración de cada evento en SQLite.
+    """
+    statements = {
+        "postgresql": POSTGRES_TIME_RANGE_STATEMENTS,
+        "sqlite": SQLITE_TIME_RANGE_STATEMENTS,
+    }.get(engine.dialect.name, [])
+    try:
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+    except Exception as e:
+        logger.warning(f"⚠️  Time range index not available: {e}")
+
+
+def _setup_postgres_full_text_search(engine: Engine) -> None:
+    """
+    Columna `tsvector` con índice GIN, con la configuración sin tildes si la
+    extensión unaccent está disponible. Una columna creada con otra
+    configuración (versiones anteriores usaban 'simple') se vuelve a crear.
+    """
+    config = POSTGRES_TS_CONFIG
+    try:
+        with engine.begin() as conn:
+            for statement in POSTGRES_UNACCENT_STATEMENTS:
+                conn.execute(text(statement))
+    except Exception as e:
+        config = "simple"
+        logger.warning(
+            f"⚠️  unaccent not available, PostgreSQL search will match accents: {e}"
+        )
+
+    with engine.begin() as conn:
+        expression = conn.execute(
+            text(
+                "SELECT generation_expression FROM information_schema.columns "
+                "WHERE table_name = 'calendar_events' "
+                "AND column_name = 'search_vector'"
+            )
+        ).scalar()
+        if expression is not None and f"'{config}'" not in expression:
+            conn.execute(text("ALTER TABLE calendar_events DROP COLUMN search_vector"))
+            logger.info(
+                f"🛠️  Migration: rebuilding calendar_events.search_vector ({config})"
+            )
+        for statement in POSTGRES_FTS_STATEMENTS:
+            conn.execute(text(statement.format(config=config)))
+
+
+def _setup_full_text_search(engine: Engine) -> None:
+    """
+    Crea el índice full-text: FTS5 (external content + triggers) en SQLite y
+    una columna `tsvector` con índice GIN en PostgreSQL.
+    """
+    dialect = engine.dialect.name
+    try:
+        if dialect == "postgresql":
+            _setup_postgres_full_text_search(engine)
+            return
+        with engine.begin() as conn:
+            if dialect == "sqlite":
+                created = not conn.execute(
+                    text(
+                        "SELECT 1 FROM sqlite_master "
+                        "WHERE type = 'table' AND name = 'calendar_events_fts'"
+                    )
+                ).first()
+                conn.execute(
+                    text(
+                        "CREATE VIRTUAL TABLE IF NOT EXISTS calendar_events_fts "
+                        "USING fts5(summary, description, content='calendar_events', "
+                        "content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+                    )
+                )
+                for statement in SQLITE_FTS_STATEMENTS:
+                    conn.execute(text(statement))
+                if created:
+                    # Indexar los eventos que ya estaban en el caché
+                    conn.execute(
+                        text(
+                            "INSERT INTO calendar_events_fts(calendar_events_fts) "
+                            "VALUES ('rebuild')"
+                        )
+                    )
+                    logger.info("🛠️  Migration: created full-text index calendar_events_fts")
+    except Exception as e:
+        # Ej: SQLite compilado sin FTS5; la búsqueda usa ILIKE
+        logger.warning(f"⚠️  Full-text search index not available: {e}")
+
+
+# Migraciones de datos que corren una sola vez (nombre -> registrada en schema_migrations)
+NORMALIZE_CATEGORIES = "normalize_categories"
+
+
+def _ensure_migrations_table(conn) -> None:
+    conn.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "name VARCHAR PRIMARY KEY, "
+            "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+        )
+    )
+
+
+def _is_applied(conn, name: str) -> bool:
+    return (
+        conn.execute(
+            text("SELECT 1 FROM schema_migrations WHERE name = :name"), {"name": name}
+        ).first()
+        is not None
+    )
+
+
+def _mark_applied(conn, name: str) -> None:
+    conn.execute(
+        text("INSERT INTO schema_migrations (name) VALUES (:name)"), {"name": name}
+    )
+
+
+def _normalize_categories(engine: Engine) -> None:
+    """
+    Normaliza (una sola vez) las categorías guardadas antes de que se
+    escribieran en mayúsculas, para que el filtro por igualdad las encuentre.
+
+    Se hace en Python con `normalize_category` (el mismo código que las
+    escrituras nuevas): el UPPER() de SQLite solo convierte ASCII y dejaría
+    "educación" como "EDUCACIóN".
+    """
+    with engine.begin() as conn:
+        _ensure_migrations_table(conn)
+        if _is_applied(conn, NORMALIZE_CATEGORIES):
+            return
+
+        rows = conn.execute(
+            text("SELECT id, category FROM calendar_events WHERE category IS NOT NULL")
+        ).all()
+        changes = [
+            {"id": event_id, "category": normalize_category(category)}
+            for event_id, category in rows
+            if normalize_category(category) != category
+        ]
+        if changes:
+            conn.execute(
+                text("UPDATE calendar_events SET category = :category WHERE id = :id"),
+                changes,
+            )
+            logger.info(
+                f"🛠️  Migration: normalized category of {len(changes)} event(s)"
+            )
+        _mark_applied(conn, NORMALIZE_CATEGORIES)
+
+
+def run_migrations(engine: Engine) -> None:
+    """Aplica las migraciones pendientes (llamar después de `create_all`)."""
+    inspector = inspect(engine)
+    for table_name, column_names in ADDED_COLUMNS.items():
+        if inspector.has_table(table_name):
+            _add_missing_columns(engine, table_name, column_names)
+    if inspector.has_table("calendar_events"):
+        _normalize_categories(engine)
+    _setup_full_text_search(engine)
+    _setup_time_range(engine)
@@ -0,0 +1,32 @@
+"""
+Cursores opacos para paginación keyset (`/calendar/events`).
+
+El cursor codifica la clave de orden `(start_datetime, id)` del último
+elemento entregado; la página siguiente empieza estrictamente después.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(start_datetime: datetime, event_id: int) -> str:
+    """Codifica la posición `(start_datetime, id)` como string opaco URL-safe."""
+    payload = json.dumps({"s": start_datetime.isoformat(), "i": event_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decodifica un cursor generado por `encode_cursor`.
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["s"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -31,16 +31,26 @@ OTEL_EXPORTER_ENDPOINT = os.getenv(
 OTEL_ENVIRONMENT = os.getenv("OTEL_ENVIRONMENT", "development")
 
 
+# Resultado de setup_opentelemetry (los providers globales solo se configuran una vez)
+_setup_result = None
+
+
 def setup_opentelemetry():
     """
     Configura OpenTelemetry para tracing, metrics, y logging.
+    Es idempotente: llamadas posteriores retornan lo ya configurado.
 
     Returns:
         Tuple of (tracer, meter, logger)
     """
+    global _setup_result
+    if _setup_result is not None:
+        return _setup_result
+
     if not OTEL_ENABLED:
         logging.info("📊 OpenTelemetry disabled (OTEL_ENABLED=false)")
-        return None, None, None
+        _setup_result = (None, None, None)
+        return _setup_result
 
     # Resource: información sobre el servicio
     resource = Resource.create(
@@ -111,7 +121,8 @@ def setup_opentelemetry():
 
     logging.info(f"✅ OpenTelemetry configured for service: {OTEL_SERVICE_NAME}")
 
-    return tracer, meter, logger_provider
+    _setup_result = (tracer, meter, logger_provider)
+    return _setup_result
 
 
 def instrument_fastapi(app):
@@ -198,8 +209,69 @@ def create_custom_meters():
             description="Time taken to sync events",
             unit="seconds",
         ),
+        # Google Calendar API
+        "google_retries": meter.create_counter(
+            "mnemos.google.retries",
+            description="Number of retried Google Calendar API calls",
+            unit="1",
+        ),
+        "google_throttle_wait": meter.create_histogram(
+            "mnemos.google.throttle_wait",
+            description="Time spent waiting on the Google API token bucket",
+            unit="seconds",
+        ),
+        "google_latency": meter.create_histogram(
+            "mnemos.google.latency",
+            description="Round-trip time of each Google Calendar API call",
+            unit="seconds",
+        ),
+        # Etapas de la sincronización (atributos: window, calendar_id)
+        "sync_pages": meter.create_histogram(
+            "mnemos.sync.pages",
+            description="Pages fetched from Google per sync",
+            unit="1",
+        ),
+        "sync_fetch_duration": meter.create_histogram(
+            "mnemos.sync.fetch.duration",
+            description="Time spent waiting on Google pages per sync",
+            unit="seconds",
+        ),
+        "sync_parse_duration": meter.create_histogram(
+            "mnemos.sync.parse.duration",
+            description="Time spent parsing Google events per sync",
+            unit="seconds",
+        ),
+        "sync_write_duration": meter.create_histogram(
+            "mnemos.sync.write.duration",
+            description="Time spent writing events to the database per sync",
+            unit="seconds",
+        ),
     }
 
 
 # Inicializar custom meters
 custom_meters = create_custom_meters()
+
+
+def record_counter(name: str, value: float = 1, attributes: dict | None = None):
+    """Incrementa un counter de `custom_meters` (no-op si OTEL está deshabilitado)."""
+    counter = custom_meters.get(name)
+    if counter is not None:
+        counter.add(value, attributes or {})
+
+
+def record_histogram(name: str, value: float, attributes: dict | None = None):
+    """Registra un valor en un histogram de `custom_meters` (no-op si OTEL está deshabilitado)."""
+    histogram = custom_meters.get(name)
+    if histogram is not None:
+        histogram.record(value, attributes or {})
+
+
+def start_span(name: str, attributes: dict | None = None):
+    """
+    Abre un span como contexto (`with start_span(...):`). Sin OTEL configurado
+    el tracer global es no-op.
+    """
+    return trace.get_tracer("mnemos").start_as_current_span(
+        name, attributes=attributes or {}
+    )